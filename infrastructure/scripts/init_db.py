@@ -1,6 +1,6 @@
 """audit-agent データベース初期化スクリプト.
 
-pgvector拡張の有効化、RLSポリシーの設定、初期データの投入を行う。
+pgvector拡張の有効化、ベクトル索引の作成、RLSポリシーの設定、初期データの投入を行う。
 
 使用方法:
     python -m infrastructure.scripts.init_db
@@ -30,6 +30,46 @@ async def init_extensions(engine) -> None:  # type: ignore[no-untyped-def]
         print("[OK] PostgreSQL extensions enabled")
 
 
+async def init_vector_index(engine) -> None:  # type: ignore[no-untyped-def]
+    """vector_documents の埋め込みカラム（halfvec）とHNSW索引を作成.
+
+    FP16 (halfvec) で格納し、索引・ディスクのサイズを float4 の半分に抑える。
+    既存の vector(1536) カラムは halfvec(1536) に変換する。
+    """
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+                "WHERE attrelid = to_regclass('vector_documents') "
+                "AND attname = 'embedding' AND NOT attisdropped"
+            )
+        )
+        column_type = result.scalar()
+
+        if column_type is None:
+            exists = await conn.execute(text("SELECT to_regclass('vector_documents') IS NOT NULL"))
+            if not exists.scalar():
+                print("[SKIP] Table 'vector_documents' does not exist yet")
+                return
+            await conn.execute(text("ALTER TABLE vector_documents ADD COLUMN embedding halfvec(1536)"))
+        elif column_type.startswith("vector"):
+            await conn.execute(
+                text(
+                    "ALTER TABLE vector_documents "
+                    "ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536)"
+                )
+            )
+
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_vector_documents_embedding_hnsw "
+                "ON vector_documents USING hnsw (embedding halfvec_cosine_ops) "
+                "WITH (m = 16, ef_construction = 64)"
+            )
+        )
+        print("[OK] vector_documents halfvec embedding + HNSW index ready")
+
+
 async def init_rls_policies(engine) -> None:  # type: ignore[no-untyped-def]
     """RLS (Row Level Security) ポリシーを設定.
 
@@ -104,6 +144,7 @@ async def main() -> None:
     try:
         print("=== audit-agent Database Initialization ===")
         await init_extensions(engine)
+        await init_vector_index(engine)
         await init_rls_policies(engine)
         print("=== Initialization Complete ===")
     finally:
@@ -11,8 +11,8 @@ from src.config.constants import CONFIDENCE_THRESHOLD
 from src.llm_gateway.gateway import LLMGateway
 from src.monitoring.metrics import (
     agent_confidence_score,
+    agent_execution_child,
     agent_execution_duration_seconds,
-    agent_executions_total,
 )
 from src.security.audit_trail import AuditTrailService
 
@@ -82,10 +82,7 @@ class BaseAuditAgent(ABC, Generic[StateT]):
             elapsed_ms = (time.monotonic() - start) * 1000
 
             # メトリクス記録
-            agent_executions_total.labels(
-                agent_type=self.agent_name,
-                status="success",
-            ).inc()
+            agent_execution_child(self.agent_name, "success").inc()
             agent_execution_duration_seconds.labels(
                 agent_type=self.agent_name,
             ).observe(elapsed_ms / 1000)
@@ -99,10 +96,7 @@ class BaseAuditAgent(ABC, Generic[StateT]):
 
         except Exception as e:
             elapsed_ms = (time.monotonic() - start) * 1000
-            agent_executions_total.labels(
-                agent_type=self.agent_name,
-                status="error",
-            ).inc()
+            agent_execution_child(self.agent_name, "error").inc()
             logger.error(
                 f"Agent実行エラー: {self.agent_name}",
                 error=str(e),
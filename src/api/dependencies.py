@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.session import get_session
 from src.llm_gateway.gateway import LLMGateway
 from src.llm_gateway.providers.anthropic import AnthropicProvider
+from src.security.auth import verify_token
 
 
 async def get_db_session() -> AsyncSession:  # type: ignore[misc]
@@ -28,8 +29,6 @@ async def get_current_user_ws(token: str) -> dict[str, Any] | None:
     if not token:
         return None
     try:
-        from src.security.auth import verify_token
-
         payload = verify_token(token)
         return {
             "user_id": payload.get("sub", ""),
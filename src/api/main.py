@@ -7,10 +7,10 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
-from prometheus_client import make_asgi_app
 
 from src import __version__
 from src.api.middleware.correlation import CorrelationIdMiddleware
+from src.api.middleware.metrics import PrometheusMiddleware
 from src.api.middleware.rate_limit import setup_rate_limiter
 from src.api.middleware.security import (
     IPThrottleMiddleware,
@@ -34,7 +34,7 @@ from src.api.routes import (
 )
 from src.config.settings import get_settings
 from src.monitoring.logging import setup_logging
-from src.monitoring.metrics import app_info
+from src.monitoring.metrics import app_info, create_metrics_app, mark_metrics_process_dead
 
 
 @asynccontextmanager
@@ -55,12 +55,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
 
     # メトリクス情報設定
-    app_info.info(
-        {
-            "version": __version__,
-            "environment": settings.app_env,
-        }
-    )
+    app_info.labels(version=__version__, environment=settings.app_env).set(1)
 
     # 外部監視統合（Sentry, Datadog, LangSmith）
     from src.monitoring.integrations import setup_all_integrations
@@ -91,6 +86,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception:
             logger.debug("Kafka Consumer停止時エラー")
 
+    # 通知用共有HTTPクライアント切断
+    from src.notifications.http_clients import close_teams_client
+    from src.notifications.slack import shutdown_slack_client
+
+    await shutdown_slack_client()
+    await close_teams_client()
+
+    # マルチプロセスモードのPrometheusゲージから自ワーカー分を除外
+    mark_metrics_process_dead()
+
     logger.info("audit-agent シャットダウン")
 
 
@@ -127,6 +132,9 @@ def create_app() -> FastAPI:
     if settings.is_production:
         app.add_middleware(IPThrottleMiddleware)
 
+    # リクエストメトリクス
+    app.add_middleware(PrometheusMiddleware)
+
     # 相関ID
     app.add_middleware(CorrelationIdMiddleware)
 
@@ -153,7 +161,7 @@ def create_app() -> FastAPI:
 
     # ── Prometheusメトリクス ──────────────────────────
     if settings.prometheus_enabled:
-        metrics_app = make_asgi_app()
+        metrics_app = create_metrics_app()
         app.mount("/metrics", metrics_app)
 
     return app
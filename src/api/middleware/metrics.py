@@ -0,0 +1,49 @@
+"""メトリクスミドルウェア — HTTPリクエスト数・処理時間の計測"""
+
+import time
+from collections.abc import Callable
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from src.monitoring.metrics import http_request_child, http_request_duration_seconds
+
+# ルートに一致しなかったリクエストのエンドポイントラベル（パスをそのまま使うとカーディナリティが発散する）
+UNMATCHED_ENDPOINT = "unmatched"
+
+
+class PrometheusMiddleware(BaseHTTPMiddleware):
+    """リクエストごとに http_requests_total / http_request_duration_seconds を記録
+
+    ラベルはルートテンプレート（例: /api/v1/projects/{project_id}）を使うため、
+    (method, endpoint) の組はルート数で有界。組ごとに子ヒストグラムの observe を
+    初回にキャッシュし、以降は labels() を経由せず直接呼び出す。
+    下流で例外が発生した場合も status_code=500 として記録する。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        super().__init__(app)
+        self._observers: dict[tuple[str, str], Callable[[float], None]] = {}
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+
+            route = request.scope.get("route")
+            endpoint = getattr(route, "path", UNMATCHED_ENDPOINT)
+            key = (request.method, endpoint)
+
+            observer = self._observers.get(key)
+            if observer is None:
+                observer = http_request_duration_seconds.labels(*key).observe
+                self._observers[key] = observer
+            observer(elapsed)
+            http_request_child(request.method, endpoint, str(status_code)).inc()
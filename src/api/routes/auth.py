@@ -68,7 +68,7 @@ async def login(
             detail="メールアドレスまたはパスワードが正しくありません",
         )
 
-    if not _auth_service.verify_password(request.password, user.hashed_password):
+    if not await _auth_service.verify_password_async(request.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="メールアドレスまたはパスワードが正しくありません",
@@ -104,7 +104,7 @@ async def register(
             detail="このメールアドレスは既に登録されています",
         )
 
-    hashed_password = _auth_service.hash_password(request.password)
+    hashed_password = await _auth_service.hash_password_async(request.password)
 
     user = User(
         tenant_id=request.tenant_id,
@@ -38,20 +38,7 @@ async def send_notification(
         provider_names: 送信先プロバイダ名リスト (省略時は全プロバイダ)
         action_url: アクションリンク (省略可)
     """
-    priority_str = body.get("priority", "medium")
-    try:
-        priority = NotificationPriority(priority_str)
-    except ValueError:
-        priority = NotificationPriority.MEDIUM
-
-    message = NotificationMessage(
-        title=body.get("title", ""),
-        body=body.get("body", ""),
-        priority=priority,
-        tenant_id=body.get("tenant_id", ""),
-        source=body.get("source", ""),
-        action_url=body.get("action_url"),
-    )
+    message = NotificationMessage.from_dict(body)
 
     provider_names = body.get("provider_names")
     results = await _dispatcher.dispatch(message, provider_names=provider_names)
@@ -3,7 +3,7 @@
 from functools import lru_cache
 from typing import Any
 
-from pydantic import field_validator
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -40,6 +40,8 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 7
+    # bcrypt コスト係数（2^rounds 回の鍵拡張）。範囲外は bcrypt が拒否するため読込時に検証
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
 
     # ── Anthropic ─────────────────────────────────────
     anthropic_api_key: str = ""
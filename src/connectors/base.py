@@ -15,6 +15,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.monitoring.metrics import connector_duration_child, connector_request_child
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 # リトライ対象の例外
@@ -96,7 +98,11 @@ class CircuitBreakerOpenError(Exception):
 
 
 def with_circuit_breaker(func: F) -> F:
-    """サーキットブレーカーデコレータ（BaseConnector用）"""
+    """サーキットブレーカーデコレータ（BaseConnector用）
+
+    呼び出しごとに connector_requests_total / connector_request_duration_seconds を記録する
+    （ラベルはコネクタ名とメソッド名）。
+    """
 
     @wraps(func)
     async def wrapper(self: "BaseConnector", *args: Any, **kwargs: Any) -> Any:
@@ -107,12 +113,15 @@ def with_circuit_breaker(func: F) -> F:
                 func.__name__,
             )
             raise CircuitBreakerOpenError(self.connector_name)
+        start = time.perf_counter()
         try:
             result = await func(self, *args, **kwargs)
             self.circuit_breaker.record_success()
+            connector_request_child(self.connector_name, func.__name__, "success").inc()
             return result
         except Exception as e:
             self.circuit_breaker.record_failure()
+            connector_request_child(self.connector_name, func.__name__, "failure").inc()
             logger.warning(
                 "{}:{} — 失敗記録 ({}/{}): {}",
                 self.connector_name,
@@ -122,6 +131,8 @@ def with_circuit_breaker(func: F) -> F:
                 str(e),
             )
             raise
+        finally:
+            connector_duration_child(self.connector_name, func.__name__).observe(time.perf_counter() - start)
 
     return wrapper  # type: ignore[return-value]
 
@@ -10,8 +10,8 @@ from src.llm_gateway.cost_tracker import CostTracker
 from src.llm_gateway.providers.base import BaseLLMProvider, LLMResponse
 from src.monitoring.metrics import (
     llm_cost_total,
+    llm_request_child,
     llm_request_duration_seconds,
-    llm_requests_total,
     llm_tokens_total,
 )
 
@@ -120,11 +120,7 @@ class LLMGateway:
 
     def _record_metrics(self, response: LLMResponse) -> None:
         """Prometheusメトリクスを記録"""
-        llm_requests_total.labels(
-            provider=response.provider,
-            model=response.model,
-            status="success",
-        ).inc()
+        llm_request_child(response.provider, response.model, "success").inc()
 
         llm_tokens_total.labels(
             provider=response.provider,
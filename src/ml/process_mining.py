@@ -5,12 +5,24 @@
 NetworkXベース（Neo4j不要）。
 """
 
+from bisect import bisect_left
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from itertools import pairwise
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
+# この件数を超えるイベントログはNumPyの一括ソートで並べ替える
+BULK_SORT_MIN_EVENTS = 1000
+
+# ボトルネック重大度: 閾値に対する超過倍率の境界（超過判定）と対応する重大度
+BOTTLENECK_RATIO_THRESHOLDS = (1.5, 3.0)
+BOTTLENECK_SEVERITIES = ("low", "medium", "high")
+
 
 @dataclass
 class ActivityEdge:
@@ -161,6 +173,15 @@ class ProcessMiner:
 
     def _group_by_case(self, event_log: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
         """ケース別にイベントをグループ化し、タイムスタンプ順にソート"""
+        if len(event_log) > BULK_SORT_MIN_EVENTS:
+            # ログ全体を一度だけ安定ソートし、ケースの初出順を保ったまま振り分け
+            timestamps = np.asarray([e.get("timestamp", "") for e in event_log])
+            bulk: dict[str, list[dict[str, Any]]] = {e["case_id"]: [] for e in event_log}
+            for idx in np.argsort(timestamps, kind="stable"):
+                event = event_log[idx]
+                bulk[event["case_id"]].append(event)
+            return bulk
+
         cases: dict[str, list[dict[str, Any]]] = defaultdict(list)
         for event in event_log:
             cases[event["case_id"]].append(event)
@@ -173,23 +194,21 @@ class ProcessMiner:
 
     def _build_activity_graph(self, cases: dict[str, list[dict[str, Any]]]) -> list[ActivityEdge]:
         """アクティビティ遷移グラフを構築"""
-        edge_counts: Counter[tuple[str, str]] = Counter()
+        # 全ケースの遷移ペアを平坦化し、Counterで一括集計
+        transitions = [
+            ((prev["activity"], curr["activity"]), prev.get("timestamp", ""), curr.get("timestamp", ""))
+            for events in cases.values()
+            for prev, curr in pairwise(events)
+        ]
+        edge_counts: Counter[tuple[str, str]] = Counter(edge_key for edge_key, _, _ in transitions)
+
+        # 所要時間の計算
         edge_durations: dict[tuple[str, str], list[float]] = defaultdict(list)
-
-        for events in cases.values():
-            for i in range(len(events) - 1):
-                source = events[i]["activity"]
-                target = events[i + 1]["activity"]
-                edge_key = (source, target)
-                edge_counts[edge_key] += 1
-
-                # 所要時間の計算
-                ts1 = events[i].get("timestamp", "")
-                ts2 = events[i + 1].get("timestamp", "")
-                if ts1 and ts2:
-                    duration = self._calc_duration_hours(ts1, ts2)
-                    if duration >= 0:
-                        edge_durations[edge_key].append(duration)
+        for edge_key, ts1, ts2 in transitions:
+            if ts1 and ts2:
+                duration = self._calc_duration_hours(ts1, ts2)
+                if duration >= 0:
+                    edge_durations[edge_key].append(duration)
 
         edges: list[ActivityEdge] = []
         for (source, target), count in edge_counts.items():
@@ -210,24 +229,25 @@ class ProcessMiner:
 
     def _extract_variants(self, cases: dict[str, list[dict[str, Any]]]) -> list[ProcessVariant]:
         """プロセスバリアント（実行パスのパターン）を抽出"""
-        path_counter: Counter[tuple[str, ...]] = Counter()
-
-        for events in cases.values():
-            path = tuple(e["activity"] for e in events)
-            path_counter[path] += 1
-
-        variants: list[ProcessVariant] = []
-        for path, count in path_counter.most_common():
-            if count >= self._min_variant_count or not variants:
-                variants.append(
-                    ProcessVariant(
-                        path=list(path),
-                        count=count,
-                        is_standard=len(variants) == 0,  # 最頻パスを標準とする
-                    )
-                )
+        path_counter: Counter[tuple[str, ...]] = Counter(
+            tuple(e["activity"] for e in events) for events in cases.values()
+        )
 
-        return variants
+        # 閾値未満のパスはソート対象から除外（該当なしの場合のみ最頻パスを1件採用）
+        frequent = [(path, count) for path, count in path_counter.items() if count >= self._min_variant_count]
+        if frequent:
+            frequent.sort(key=lambda item: -item[1])
+        elif path_counter:
+            frequent = [max(path_counter.items(), key=lambda item: item[1])]
+
+        return [
+            ProcessVariant(
+                path=list(path),
+                count=count,
+                is_standard=i == 0,  # 最頻パスを標準とする
+            )
+            for i, (path, count) in enumerate(frequent)
+        ]
 
     def _detect_bottlenecks(self, edges: list[ActivityEdge]) -> list[Bottleneck]:
         """ボトルネック（閾値超過の遅延遷移）を検出"""
@@ -235,12 +255,7 @@ class ProcessMiner:
         for edge in edges:
             if edge.avg_duration_hours > self._bottleneck_threshold:
                 ratio = edge.avg_duration_hours / self._bottleneck_threshold
-                if ratio > 3:
-                    severity = "high"
-                elif ratio > 1.5:
-                    severity = "medium"
-                else:
-                    severity = "low"
+                severity = BOTTLENECK_SEVERITIES[bisect_left(BOTTLENECK_RATIO_THRESHOLDS, ratio)]
 
                 bottlenecks.append(
                     Bottleneck(
@@ -320,11 +335,14 @@ class ProcessMiner:
     @staticmethod
     def _calc_duration_hours(ts1: str, ts2: str) -> float:
         """2つのタイムスタンプ間の時間差（時間）"""
-        from datetime import datetime
-
         try:
-            t1 = datetime.fromisoformat(ts1.replace("Z", "+00:00"))
-            t2 = datetime.fromisoformat(ts2.replace("Z", "+00:00"))
-            return (t2 - t1).total_seconds() / 3600
-        except (ValueError, TypeError):
+            return (_parse_timestamp(ts2) - _parse_timestamp(ts1)).total_seconds() / 3600
+        except (ValueError, TypeError, AttributeError):
+            # 文字列以外（None、datetime等）や不正な書式は0時間扱い
             return 0.0
+
+
+@lru_cache(maxsize=65536)
+def _parse_timestamp(ts: str) -> datetime:
+    """ISO8601文字列をdatetimeに変換（遷移の終点と次の遷移の始点で同じ値が再出現するためキャッシュ）"""
+    return datetime.fromisoformat(ts[:-1] + "+00:00" if ts.endswith("Z") else ts)
@@ -1,6 +1,7 @@
 """リスクスコア算出 — XGBoost + ルールベースハイブリッド"""
 
 import pickle
+from bisect import bisect_left
 from pathlib import Path
 from typing import Any
 
@@ -36,6 +37,16 @@ class RiskScorer:
         "department_risk_history",
     ]
 
+    # ルールベース加点テーブル: 閾値（昇順・超過判定）と区間ごとの加点
+    AMOUNT_THRESHOLDS = (1_000_000, 10_000_000, 100_000_000)
+    AMOUNT_POINTS = (0, 10, 20, 30)
+    Z_SCORE_THRESHOLDS = (2, 3)
+    Z_SCORE_POINTS = (0, 8, 15)
+    DEVIATION_RATE_THRESHOLDS = (5, 10)
+    DEVIATION_RATE_POINTS = (0, 8, 15)
+    RISK_HISTORY_THRESHOLDS = (2, 5)
+    RISK_HISTORY_POINTS = (0, 5, 10)
+
     def __init__(self, model_path: str | None = None) -> None:
         self._model: Any = None
         self._is_fitted = False
@@ -99,19 +110,12 @@ class RiskScorer:
         """ルールベースのスコアリング"""
         score = 30.0
 
+        # bisect_left は閾値を「超過」した個数を返す（境界値は下位区間）
         amount = abs(features.get("amount", 0))
-        if amount > 100_000_000:
-            score += 30
-        elif amount > 10_000_000:
-            score += 20
-        elif amount > 1_000_000:
-            score += 10
+        score += self.AMOUNT_POINTS[bisect_left(self.AMOUNT_THRESHOLDS, amount)]
 
         z_score = abs(features.get("amount_z_score", 0))
-        if z_score > 3:
-            score += 15
-        elif z_score > 2:
-            score += 8
+        score += self.Z_SCORE_POINTS[bisect_left(self.Z_SCORE_THRESHOLDS, z_score)]
 
         if features.get("is_anomaly", False):
             anomaly_score = features.get("anomaly_score", 0.5)
@@ -121,10 +125,7 @@ class RiskScorer:
             score += 15
 
         deviation_rate = features.get("control_deviation_rate", 0)
-        if deviation_rate > 10:
-            score += 15
-        elif deviation_rate > 5:
-            score += 8
+        score += self.DEVIATION_RATE_POINTS[bisect_left(self.DEVIATION_RATE_THRESHOLDS, deviation_rate)]
 
         if features.get("is_manual_entry", False):
             score += 5
@@ -132,10 +133,7 @@ class RiskScorer:
             score += 10
 
         history = features.get("department_risk_history", 0)
-        if history > 5:
-            score += 10
-        elif history > 2:
-            score += 5
+        score += self.RISK_HISTORY_POINTS[bisect_left(self.RISK_HISTORY_THRESHOLDS, history)]
 
         return min(100.0, max(0.0, score))
 
@@ -1,5 +1,7 @@
 """ヘルスチェック — 依存サービスの状態確認"""
 
+import asyncio
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
@@ -46,7 +48,7 @@ class SystemHealth:
 class HealthChecker:
     """依存サービスのヘルスチェックを実行"""
 
-    async def check_database(self, engine: Any) -> ComponentHealth:
+    async def check_database(self, engine: Any, name: str = "postgresql") -> ComponentHealth:
         """PostgreSQL接続チェック"""
         import time
 
@@ -58,22 +60,22 @@ class HealthChecker:
                 await conn.execute(text("SELECT 1"))
             latency = (time.monotonic() - start) * 1000
             return ComponentHealth(
-                name="postgresql",
+                name=name,
                 status=HealthStatus.HEALTHY,
                 latency_ms=latency,
                 details={"pool_size": engine.pool.size()},
             )
         except Exception as e:
             latency = (time.monotonic() - start) * 1000
-            logger.error("DB ヘルスチェック失敗", error=str(e))
+            logger.error("DB ヘルスチェック失敗", component=name, error=str(e))
             return ComponentHealth(
-                name="postgresql",
+                name=name,
                 status=HealthStatus.UNHEALTHY,
                 latency_ms=latency,
                 details={"error": str(e)},
             )
 
-    async def check_redis(self, redis_client: Any) -> ComponentHealth:
+    async def check_redis(self, redis_client: Any, name: str = "redis") -> ComponentHealth:
         """Redis接続チェック"""
         import time
 
@@ -83,16 +85,16 @@ class HealthChecker:
             latency = (time.monotonic() - start) * 1000
             info = await redis_client.info("server")
             return ComponentHealth(
-                name="redis",
+                name=name,
                 status=HealthStatus.HEALTHY,
                 latency_ms=latency,
                 details={"version": info.get("redis_version", "unknown")},
             )
         except Exception as e:
             latency = (time.monotonic() - start) * 1000
-            logger.error("Redis ヘルスチェック失敗", error=str(e))
+            logger.error("Redis ヘルスチェック失敗", component=name, error=str(e))
             return ComponentHealth(
-                name="redis",
+                name=name,
                 status=HealthStatus.UNHEALTHY,
                 latency_ms=latency,
                 details={"error": str(e)},
@@ -102,16 +104,31 @@ class HealthChecker:
         self,
         engine: Any | None = None,
         redis_client: Any | None = None,
+        engines: Sequence[Any] = (),
+        redis_clients: Sequence[Any] = (),
     ) -> SystemHealth:
-        """全依存サービスのヘルスチェック"""
-        from src import __version__
+        """全依存サービスのヘルスチェック
+
+        各チェックは asyncio.gather で並行実行するため、
+        所要時間は各エンドポイントの合計ではなく最大値となる。
 
-        components: list[ComponentHealth] = []
+        Args:
+            engine: 単一のDBエンジン（名前 "postgresql"）
+            redis_client: 単一のRedisクライアント（名前 "redis"）
+            engines: 追加のDBエンジン（リードレプリカ等、名前 "postgresql_{i}"）
+            redis_clients: 追加のRedisクライアント（名前 "redis_{i}"）
+        """
+        from src import __version__
 
+        tasks = []
         if engine is not None:
-            components.append(await self.check_database(engine))
+            tasks.append(self.check_database(engine))
+        tasks.extend(self.check_database(e, name=f"postgresql_{i}") for i, e in enumerate(engines))
         if redis_client is not None:
-            components.append(await self.check_redis(redis_client))
+            tasks.append(self.check_redis(redis_client))
+        tasks.extend(self.check_redis(r, name=f"redis_{i}") for i, r in enumerate(redis_clients))
+
+        components: list[ComponentHealth] = list(await asyncio.gather(*tasks))
 
         # 総合ステータス判定
         if any(c.status == HealthStatus.UNHEALTHY for c in components):
@@ -1,5 +1,10 @@
 """外部監視サービス統合 — LangSmith / Datadog / Sentry"""
 
+import asyncio
+import atexit
+import queue
+import threading
+from collections import deque
 from typing import Any
 
 from loguru import logger
@@ -129,62 +134,175 @@ def setup_langsmith() -> None:
 
 
 class DatadogMetrics:
-    """Datadog カスタムメトリクス送信"""
+    """Datadog カスタムメトリクス送信
 
-    def __init__(self) -> None:
-        self._settings = get_settings()
-        self._statsd: Any = None
+    メトリクスは呼び出し時にUDP送信せず有界キューに積み、
+    バックグラウンドタスクがDogStatsDのバッファリングでまとめて送信する。
+    キュー溢れ時は古いメトリクスから破棄し、破棄件数を別メトリクスとして送信。
+    """
 
-    def _get_statsd(self) -> Any:
-        """DogStatsDクライアント取得"""
-        if self._statsd:
-            return self._statsd
+    DROPPED_METRIC = "audit_agent.metrics.dropped"
+
+    def __init__(
+        self,
+        max_queue_size: int = 8192,
+        flush_interval_s: float = 0.5,
+        flush_threshold: int = 512,
+    ) -> None:
+        settings = get_settings()
+        self._constant_tags = (f"service:{settings.dd_service}", f"env:{settings.dd_env}")
+        self._statsd: Any = None
+        self._statsd_cls: Any = None
         try:
             from datadog import DogStatsd
 
-            self._statsd = DogStatsd(
+            self._statsd_cls = DogStatsd
+        except ImportError:
+            pass
+        self._queue: deque[tuple[str, str, float, list[str] | None]] = deque(maxlen=max_queue_size)
+        self._flush_interval_s = flush_interval_s
+        self._flush_threshold = flush_threshold
+        self._dropped = 0
+        self._flusher_task: asyncio.Task[None] | None = None
+        # 終了時の取りこぼし防止（close() で解除するため、インスタンスが残り続けない）
+        atexit.register(self.flush)
+
+    def _get_statsd(self) -> Any:
+        """DogStatsDクライアント取得"""
+        if self._statsd is None and self._statsd_cls is not None:
+            self._statsd = self._statsd_cls(
                 host="localhost",
                 port=8125,
-                constant_tags=[
-                    f"service:{self._settings.dd_service}",
-                    f"env:{self._settings.dd_env}",
-                ],
+                constant_tags=list(self._constant_tags),
             )
-        except ImportError:
-            pass
         return self._statsd
 
+    def _enqueue(self, kind: str, metric: str, value: float, tags: list[str] | None) -> None:
+        """メトリクスを送信キューに追加"""
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            self._dropped += 1
+        queue.append((kind, metric, value, tags))
+
+        if self._flusher_task is None or self._flusher_task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # イベントループ外では閾値到達時に同期フラッシュ
+                if len(queue) >= self._flush_threshold:
+                    self.flush()
+                return
+            self._flusher_task = loop.create_task(self._flusher())
+
+    async def _flusher(self) -> None:
+        """一定間隔でキューを送信するバックグラウンドタスク"""
+        while True:
+            await asyncio.sleep(self._flush_interval_s)
+            self.flush()
+
+    def flush(self) -> None:
+        """キュー内のメトリクスを1バッファにまとめて送信"""
+        queue = self._queue
+        if not queue and not self._dropped:
+            return
+
+        client = self._get_statsd()
+        if not client:
+            queue.clear()
+            self._dropped = 0
+            return
+
+        try:
+            with client:
+                for _ in range(len(queue)):
+                    kind, metric, value, tags = queue.popleft()
+                    getattr(client, kind)(metric, value, tags=tags)
+                if self._dropped:
+                    client.increment(self.DROPPED_METRIC, self._dropped)
+                    self._dropped = 0
+        except Exception as e:
+            logger.debug("Datadogメトリクス送信エラー: {}", str(e))
+
+    def close(self) -> None:
+        """バックグラウンド送信タスクを停止し、残りのメトリクスを送信"""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+        atexit.unregister(self.flush)
+        self.flush()
+
     def increment(self, metric: str, value: int = 1, tags: list[str] | None = None) -> None:
         """カウンターインクリメント"""
-        client = self._get_statsd()
-        if client:
-            client.increment(metric, value, tags=tags)
+        self._enqueue("increment", metric, value, tags)
 
     def gauge(self, metric: str, value: float, tags: list[str] | None = None) -> None:
         """ゲージ値送信"""
-        client = self._get_statsd()
-        if client:
-            client.gauge(metric, value, tags=tags)
+        self._enqueue("gauge", metric, value, tags)
 
     def histogram(self, metric: str, value: float, tags: list[str] | None = None) -> None:
         """ヒストグラム値送信"""
-        client = self._get_statsd()
-        if client:
-            client.histogram(metric, value, tags=tags)
+        self._enqueue("histogram", metric, value, tags)
 
     def timing(self, metric: str, value_ms: float, tags: list[str] | None = None) -> None:
         """タイミング送信"""
-        client = self._get_statsd()
-        if client:
-            client.timing(metric, value_ms, tags=tags)
+        self._enqueue("timing", metric, value_ms, tags)
 
 
 class LangSmithTracer:
-    """LangSmithカスタムトレーサー — Agent実行トレース"""
-
-    def __init__(self) -> None:
-        self._settings = get_settings()
-        self._enabled = bool(self._settings.langchain_api_key)
+    """LangSmithカスタムトレーサー — Agent実行トレース
+
+    トレース送信（HTTPS POST）はリクエストスレッドで行わず、
+    キュー経由でデーモンスレッドが送信する。キュー満杯時は破棄して件数を記録。
+    """
+
+    def __init__(self, max_queue_size: int = 4096) -> None:
+        settings = get_settings()
+        self._project: str = settings.langchain_project
+        self._enabled: bool = bool(settings.langchain_api_key)
+        self._run_tree_cls: Any = None
+        self._trace_queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=max_queue_size)
+        self._dropped = 0
+        if self._enabled:
+            try:
+                from langsmith.run_trees import RunTree
+
+                self._run_tree_cls = RunTree
+            except ImportError:
+                logger.warning("langsmith未インストール、トレース無効")
+                self._enabled = False
+        if self._enabled:
+            threading.Thread(target=self._drain, name="langsmith-tracer", daemon=True).start()
+
+    def _submit(self, record: dict[str, Any]) -> None:
+        """トレースを送信キューに追加（満杯時は破棄）"""
+        try:
+            self._trace_queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
+
+    def _drain(self) -> None:
+        """キューからトレースを取り出してLangSmithに送信"""
+        while True:
+            record = self._trace_queue.get()
+            try:
+                outputs = record.pop("outputs")
+                run = self._run_tree_cls(project_name=self._project, **record)
+                run.end(outputs=outputs)
+                run.post()
+            except Exception as e:
+                logger.debug("LangSmithトレースエラー: {}", str(e))
+            finally:
+                self._trace_queue.task_done()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """キュー内のトレース送信完了を待機（シャットダウン用）
+
+        Returns:
+            タイムアウト前に全件送信できた場合True
+        """
+        q = self._trace_queue
+        with q.all_tasks_done:
+            return q.all_tasks_done.wait_for(lambda: q.unfinished_tasks == 0, timeout=timeout)
 
     def trace_agent_execution(
         self,
@@ -197,20 +315,15 @@ class LangSmithTracer:
         if not self._enabled:
             return
 
-        try:
-            from langsmith.run_trees import RunTree
-
-            run = RunTree(
-                name=f"agent:{agent_name}",
-                run_type="chain",
-                inputs=input_data,
-                project_name=self._settings.langchain_project,
-                extra=metadata or {},
-            )
-            run.end(outputs=output_data)
-            run.post()
-        except Exception as e:
-            logger.debug("LangSmithトレースエラー: {}", str(e))
+        self._submit(
+            {
+                "name": f"agent:{agent_name}",
+                "run_type": "chain",
+                "inputs": input_data,
+                "extra": metadata or {},
+                "outputs": output_data,
+            }
+        )
 
     def trace_llm_call(
         self,
@@ -224,24 +337,19 @@ class LangSmithTracer:
         if not self._enabled:
             return
 
-        try:
-            from langsmith.run_trees import RunTree
-
-            run = RunTree(
-                name=f"llm:{model}",
-                run_type="llm",
-                inputs={"prompt": prompt[:500]},
-                project_name=self._settings.langchain_project,
-                extra={
+        self._submit(
+            {
+                "name": f"llm:{model}",
+                "run_type": "llm",
+                "inputs": {"prompt": prompt[:500]},
+                "extra": {
                     "model": model,
                     "tokens": tokens_used,
                     "cost_usd": cost_usd,
                 },
-            )
-            run.end(outputs={"response": response[:500]})
-            run.post()
-        except Exception as e:
-            logger.debug("LangSmithトレースエラー: {}", str(e))
+                "outputs": {"response": response[:500]},
+            }
+        )
 
 
 def setup_all_integrations() -> None:
@@ -4,6 +4,7 @@ import sys
 from contextvars import ContextVar
 from typing import Any
 
+import orjson
 from loguru import logger
 
 # リクエストスコープの相関ID・テナントIDを保持
@@ -11,10 +12,18 @@ correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 tenant_id_var: ContextVar[str] = ContextVar("tenant_id", default="")
 
 
-def _json_formatter(record: dict[str, Any]) -> str:
-    """JSON構造化ログフォーマッタ"""
-    import orjson
+def _stamp_context(record: dict[str, Any]) -> None:
+    """loguru patcher — ログ発行時に相関ID・テナントIDを extra へ設定
+
+    コンテキスト変数の参照を1レコード1回に限定し、各sinkは extra を読むだけにする。
+    bind() された同名キーよりコンテキスト変数の値を優先する。
+    """
+    record["extra"].update(correlation_id=correlation_id_var.get(""), tenant_id=tenant_id_var.get(""))
+
 
+def _json_sink(record: dict[str, Any]) -> bytes:
+    """ログレコードを改行付きJSONバイト列に変換"""
+    extra = record.get("extra") or {}
     log_entry = {
         "timestamp": record["time"].isoformat(),
         "level": record["level"].name,
@@ -22,24 +31,50 @@ def _json_formatter(record: dict[str, Any]) -> str:
         "module": record["module"],
         "function": record["function"],
         "line": record["line"],
-        "correlation_id": correlation_id_var.get(""),
-        "tenant_id": tenant_id_var.get(""),
+        "correlation_id": extra.get("correlation_id", ""),
+        "tenant_id": extra.get("tenant_id", ""),
     }
 
-    # extra フィールドを追加
-    if record.get("extra"):
-        for key, value in record["extra"].items():
-            if key not in ("correlation_id", "tenant_id"):
-                log_entry[key] = value
+    # extra フィールドを一括追加（相関ID・テナントIDは _stamp_context で設定済み）
+    if extra:
+        log_entry.update(extra)
 
     # 例外情報を追加
-    if record["exception"]:
+    exception = record["exception"]
+    if exception:
         log_entry["exception"] = {
-            "type": record["exception"].type.__name__ if record["exception"].type else None,
-            "value": str(record["exception"].value) if record["exception"].value else None,
+            "type": exception.type.__name__ if exception.type else None,
+            "value": str(exception.value) if exception.value else None,
         }
 
-    return orjson.dumps(log_entry).decode() + "\n"
+    return orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _json_formatter(record: dict[str, Any]) -> str:
+    """JSON構造化ログフォーマッタ（文字列版）"""
+    return _json_sink(record).decode()
+
+
+def _file_json_formatter(record: dict[str, Any]) -> str:
+    """ファイル出力用フォーマッタ
+
+    loguruは format 関数の戻り値をテンプレート（波括弧・カラータグ）として
+    再解釈するため、JSONの波括弧と "<" をエスケープして返す。
+    """
+    return _json_formatter(record).replace("{", "{{").replace("}", "}}").replace("<", r"\<")
+
+
+def _stdout_json_sink(message: Any) -> None:
+    """標準出力へJSONバイト列を直接書き込むsink（str経由のデコード・再エンコードを省略）"""
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is not None:
+        stream.flush()
+        buffer.write(_json_sink(message.record))
+        buffer.flush()
+    else:
+        stream.write(_json_formatter(message.record))
+        stream.flush()
 
 
 def setup_logging(level: str = "INFO", json_output: bool = True) -> None:
@@ -51,11 +86,11 @@ def setup_logging(level: str = "INFO", json_output: bool = True) -> None:
     """
     # 既存ハンドラを削除
     logger.remove()
+    logger.configure(patcher=_stamp_context)  # type: ignore[arg-type]
 
     if json_output:
         logger.add(
-            sys.stdout,
-            format=_json_formatter,  # type: ignore[arg-type]
+            _stdout_json_sink,
             level=level,
             serialize=False,
         )
@@ -79,7 +114,7 @@ def setup_logging(level: str = "INFO", json_output: bool = True) -> None:
         rotation="100 MB",
         retention="30 days",
         compression="gz",
-        format=_json_formatter if json_output else "{time} | {level} | {module}:{function}:{line} | {message}",  # type: ignore[arg-type]
+        format=_file_json_formatter if json_output else "{time} | {level} | {module}:{function}:{line} | {message}",  # type: ignore[arg-type]
         level=level,
     )
 
@@ -1,9 +1,44 @@
-"""Prometheus メトリクス定義"""
+"""Prometheus メトリクス定義
+
+高頻度で加算するカウンターは ``*_child`` ヘルパーでラベル確定済みの子メトリクスを
+キャッシュして取得する（``labels()`` のラベル検証・ロック取得を毎回行わない）。
+キャッシュキーはラベル値そのものなので、ラベルのカーディナリティは有界であること
+（HTTPメソッド、ルートテンプレート、コネクタ名、モデル名等）。
+
+マルチワーカー構成（uvicorn --workers N）では環境変数 ``PROMETHEUS_MULTIPROC_DIR`` を
+本モジュールのimport前に設定すること。各ワーカーのメトリクスが共有ディレクトリの
+mmapファイルに書き込まれ、/metrics のスクレイプ時に全ワーカー分が集約される。
+"""
+
+import os
+from functools import lru_cache
+from typing import Any
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, make_asgi_app, multiprocess
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# ── ヒストグラムのバケット定義（秒 / スコア） ─────────────
+_API_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_AGENT_BUCKETS = (0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+_CONFIDENCE_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+_LLM_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+_CONNECTOR_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _hist(name: str, doc: str, labels: list[str], buckets: tuple[float, ...]) -> Histogram:
+    """ヒストグラム生成（全ヒストグラムの生成をここに集約）"""
+    return Histogram(name, doc, labels, buckets=buckets)
 
-from prometheus_client import Counter, Gauge, Histogram, Info
 
 # ── アプリケーション情報 ──────────────────────────────
-app_info = Info("audit_agent", "アプリケーション情報")
+# Info はマルチプロセスモード非対応のため、ラベル付きゲージ（値は常に1）で表現
+app_info = Gauge(
+    "audit_agent_info",
+    "アプリケーション情報",
+    ["version", "environment"],
+    multiprocess_mode="liveall",
+)
 
 # ── API メトリクス ────────────────────────────────────
 http_requests_total = Counter(
@@ -12,11 +47,11 @@ http_requests_total = Counter(
     ["method", "endpoint", "status_code"],
 )
 
-http_request_duration_seconds = Histogram(
+http_request_duration_seconds = _hist(
     "http_request_duration_seconds",
     "HTTPリクエスト処理時間",
     ["method", "endpoint"],
-    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+    _API_BUCKETS,
 )
 
 # ── Agent メトリクス ──────────────────────────────────
@@ -26,18 +61,18 @@ agent_executions_total = Counter(
     ["agent_type", "status"],
 )
 
-agent_execution_duration_seconds = Histogram(
+agent_execution_duration_seconds = _hist(
     "agent_execution_duration_seconds",
     "Agent実行時間",
     ["agent_type"],
-    buckets=[0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0],
+    _AGENT_BUCKETS,
 )
 
-agent_confidence_score = Histogram(
+agent_confidence_score = _hist(
     "agent_confidence_score",
     "Agent信頼度スコア分布",
     ["agent_type"],
-    buckets=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+    _CONFIDENCE_BUCKETS,
 )
 
 # ── LLM メトリクス ────────────────────────────────────
@@ -59,11 +94,11 @@ llm_cost_total = Counter(
     ["provider", "model"],
 )
 
-llm_request_duration_seconds = Histogram(
+llm_request_duration_seconds = _hist(
     "llm_request_duration_seconds",
     "LLM API応答時間",
     ["provider", "model"],
-    buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0],
+    _LLM_BUCKETS,
 )
 
 # ── Dialogue メトリクス ───────────────────────────────
@@ -86,23 +121,25 @@ connector_requests_total = Counter(
     ["connector", "method", "status"],  # status: success/failure
 )
 
-connector_request_duration_seconds = Histogram(
+connector_request_duration_seconds = _hist(
     "connector_request_duration_seconds",
     "コネクタリクエスト処理時間",
     ["connector", "method"],
-    buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+    _CONNECTOR_BUCKETS,
 )
 
 connector_circuit_breaker_state = Gauge(
     "connector_circuit_breaker_state",
     "サーキットブレーカー状態 (0=closed, 1=open)",
     ["connector"],
+    multiprocess_mode="livemax",
 )
 
 connector_circuit_breaker_failures = Gauge(
     "connector_circuit_breaker_failures",
     "サーキットブレーカー連続失敗数",
     ["connector"],
+    multiprocess_mode="livemax",
 )
 
 # ── DB メトリクス ─────────────────────────────────────
@@ -110,10 +147,69 @@ db_pool_size = Gauge(
     "db_pool_size",
     "DBコネクションプールサイズ",
     ["pool_name"],
+    multiprocess_mode="livesum",
 )
 
 db_pool_checked_out = Gauge(
     "db_pool_checked_out",
     "使用中DBコネクション数",
     ["pool_name"],
+    multiprocess_mode="livesum",
 )
+
+
+# ── /metrics エンドポイント ───────────────────────────
+def is_multiprocess_mode() -> bool:
+    """マルチプロセスモード（PROMETHEUS_MULTIPROC_DIR設定済み）か"""
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def create_metrics_app() -> Any:
+    """/metrics 用ASGIアプリを生成
+
+    マルチプロセスモードでは全ワーカーのメトリクスファイルを集約する
+    専用レジストリを使用する（スクレイプごとにファイルを読み込み集計）。
+    """
+    if not is_multiprocess_mode():
+        return make_asgi_app()
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return make_asgi_app(registry=registry)
+
+
+def mark_metrics_process_dead() -> None:
+    """ワーカー終了時に live* モードのゲージから自プロセス分を除外"""
+    if is_multiprocess_mode():
+        multiprocess.mark_process_dead(os.getpid())  # type: ignore[no-untyped-call]
+
+
+# ── ラベル確定済み子メトリクス（ホットパス用キャッシュ） ──────────
+@lru_cache(maxsize=4096)
+def http_request_child(method: str, endpoint: str, status_code: str) -> Any:
+    """http_requests_total の子メトリクス"""
+    return http_requests_total.labels(method, endpoint, status_code)
+
+
+@lru_cache(maxsize=1024)
+def agent_execution_child(agent_type: str, status: str) -> Any:
+    """agent_executions_total の子メトリクス"""
+    return agent_executions_total.labels(agent_type, status)
+
+
+@lru_cache(maxsize=1024)
+def llm_request_child(provider: str, model: str, status: str) -> Any:
+    """llm_requests_total の子メトリクス"""
+    return llm_requests_total.labels(provider, model, status)
+
+
+@lru_cache(maxsize=1024)
+def connector_request_child(connector: str, method: str, status: str) -> Any:
+    """connector_requests_total の子メトリクス"""
+    return connector_requests_total.labels(connector, method, status)
+
+
+@lru_cache(maxsize=1024)
+def connector_duration_child(connector: str, method: str) -> Any:
+    """connector_request_duration_seconds の子メトリクス"""
+    return connector_request_duration_seconds.labels(connector, method)
@@ -1,7 +1,7 @@
 """SLA監視 — テナントTier別のSLA目標管理・違反検出"""
 
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
@@ -78,14 +78,55 @@ class SLAMonitor:
         ],
     }
 
-    def __init__(self) -> None:
-        self._records: dict[str, list[SLARecord]] = defaultdict(list)
+    # evaluate用の平坦化テーブル: tier → ((metric, threshold_ms, threshold_percent), ...)
+    _TIER_TARGETS_FLAT: dict[str, tuple[tuple[SLAMetricType, float, float], ...]] = {
+        tier: tuple((t.metric, t.threshold_ms, t.threshold_percent) for t in targets)
+        for tier, targets in TIER_TARGETS.items()
+    }
+
+    def __init__(self, max_records_per_metric: int = 10_000) -> None:
+        self._max_records = max_records_per_metric
+        # キー: (tenant_id, metric)
+        self._records: dict[tuple[str, SLAMetricType], deque[SLARecord]] = defaultdict(
+            lambda: deque(maxlen=self._max_records)
+        )
+        # キー別の (合計, 件数) — 評価時に全件を再走査しないためのローリング集計
+        self._agg: dict[tuple[str, SLAMetricType], list[float]] = defaultdict(lambda: [0.0, 0])
+        # キー別の単調キュー (最小値用, 最大値用) — 要素は (通番, 値)。窓内の min/max を償却O(1)で維持
+        self._extrema: dict[tuple[str, SLAMetricType], tuple[deque[tuple[int, float]], deque[tuple[int, float]]]] = (
+            defaultdict(lambda: (deque(), deque()))
+        )
+        self._seq: dict[tuple[str, SLAMetricType], int] = defaultdict(int)
         self._violations: list[SLAViolation] = []
 
     def record_metric(self, record: SLARecord) -> None:
-        """メトリクスを記録"""
-        key = f"{record.tenant_id}:{record.metric}"
-        self._records[key].append(record)
+        """メトリクスを記録（キーごとに直近 max_records_per_metric 件を保持）"""
+        key = (record.tenant_id, record.metric)
+        records = self._records[key]
+        agg = self._agg[key]
+        if len(records) == self._max_records:
+            agg[0] -= records[0].value
+            agg[1] -= 1
+        records.append(record)
+        value = record.value
+        agg[0] += value
+        agg[1] += 1
+
+        seq = self._seq[key]
+        self._seq[key] = seq + 1
+        mins, maxs = self._extrema[key]
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((seq, value))
+        while maxs and maxs[-1][1] <= value:
+            maxs.pop()
+        maxs.append((seq, value))
+        # 窓から外れた先頭要素を除去
+        expired = seq - self._max_records
+        if mins[0][0] <= expired:
+            mins.popleft()
+        if maxs[0][0] <= expired:
+            maxs.popleft()
 
     def get_targets(self, tier: str) -> list[SLATarget]:
         """Tier別SLA目標を取得"""
@@ -93,23 +134,27 @@ class SLAMonitor:
 
     def evaluate(self, tenant_id: str, tier: str = "starter") -> list[SLAViolation]:
         """テナントのSLA違反を評価"""
-        targets = self.get_targets(tier)
+        targets = self._TIER_TARGETS_FLAT.get(tier) or self._TIER_TARGETS_FLAT["starter"]
         violations: list[SLAViolation] = []
 
-        for target in targets:
-            key = f"{tenant_id}:{target.metric}"
-            records = self._records.get(key, [])
-            if not records:
+        for metric, threshold_ms, threshold_percent in targets:
+            agg = self._agg.get((tenant_id, metric))
+            if not agg or not agg[1]:
                 continue
 
-            if target.metric == SLAMetricType.UPTIME:
-                violation = self._evaluate_uptime(tenant_id, target, records)
+            # 違反時のみSLAViolationを生成（違反なしの通常経路ではオブジェクト生成なし）
+            avg_value = agg[0] / agg[1]
+            if metric == SLAMetricType.UPTIME:
+                if avg_value >= threshold_percent:
+                    continue
+                violation = self._uptime_violation(tenant_id, metric, threshold_percent, avg_value)
             else:
-                violation = self._evaluate_latency(tenant_id, target, records)
+                if avg_value <= threshold_ms:
+                    continue
+                violation = self._latency_violation(tenant_id, metric, threshold_ms, avg_value)
 
-            if violation:
-                violations.append(violation)
-                self._violations.append(violation)
+            violations.append(violation)
+            self._violations.append(violation)
 
         if violations:
             logger.warning(
@@ -120,49 +165,41 @@ class SLAMonitor:
 
         return violations
 
-    def _evaluate_latency(
-        self,
+    @staticmethod
+    def _latency_violation(
         tenant_id: str,
-        target: SLATarget,
-        records: list[SLARecord],
-    ) -> SLAViolation | None:
-        """レイテンシ系メトリクスの評価"""
-        values = [r.value for r in records]
-        avg_value = sum(values) / len(values)
-
-        if avg_value > target.threshold_ms:
-            severity = "critical" if avg_value > target.threshold_ms * 2 else "warning"
-            return SLAViolation(
-                metric=target.metric,
-                target_value=target.threshold_ms,
-                actual_value=round(avg_value, 2),
-                tenant_id=tenant_id,
-                severity=severity,
-                message=(f"{target.metric}: 平均 {avg_value:.0f}ms (目標: {target.threshold_ms:.0f}ms)"),
-            )
-        return None
-
-    def _evaluate_uptime(
-        self,
+        metric: SLAMetricType,
+        threshold_ms: float,
+        avg_value: float,
+    ) -> SLAViolation:
+        """レイテンシ系メトリクスの違反を生成"""
+        severity = "critical" if avg_value > threshold_ms * 2 else "warning"
+        return SLAViolation(
+            metric=metric,
+            target_value=threshold_ms,
+            actual_value=round(avg_value, 2),
+            tenant_id=tenant_id,
+            severity=severity,
+            message=(f"{metric}: 平均 {avg_value:.0f}ms (目標: {threshold_ms:.0f}ms)"),
+        )
+
+    @staticmethod
+    def _uptime_violation(
         tenant_id: str,
-        target: SLATarget,
-        records: list[SLARecord],
-    ) -> SLAViolation | None:
-        """可用性メトリクスの評価"""
-        values = [r.value for r in records]
-        avg_uptime = sum(values) / len(values)
-
-        if avg_uptime < target.threshold_percent:
-            severity = "critical" if avg_uptime < target.threshold_percent - 1 else "warning"
-            return SLAViolation(
-                metric=target.metric,
-                target_value=target.threshold_percent,
-                actual_value=round(avg_uptime, 2),
-                tenant_id=tenant_id,
-                severity=severity,
-                message=(f"可用性: {avg_uptime:.2f}% (目標: {target.threshold_percent}%)"),
-            )
-        return None
+        metric: SLAMetricType,
+        threshold_percent: float,
+        avg_uptime: float,
+    ) -> SLAViolation:
+        """可用性メトリクスの違反を生成"""
+        severity = "critical" if avg_uptime < threshold_percent - 1 else "warning"
+        return SLAViolation(
+            metric=metric,
+            target_value=threshold_percent,
+            actual_value=round(avg_uptime, 2),
+            tenant_id=tenant_id,
+            severity=severity,
+            message=(f"可用性: {avg_uptime:.2f}% (目標: {threshold_percent}%)"),
+        )
 
     def get_violations(self, tenant_id: str | None = None) -> list[SLAViolation]:
         """SLA違反一覧を取得"""
@@ -175,17 +212,17 @@ class SLAMonitor:
         total_records = 0
         metrics: dict[str, dict[str, Any]] = {}
 
-        for key, records in self._records.items():
-            if not key.startswith(f"{tenant_id}:"):
+        for key, (total, count) in self._agg.items():
+            record_tenant_id, metric = key
+            if record_tenant_id != tenant_id:
                 continue
-            metric_name = key.split(":", 1)[1]
-            values = [r.value for r in records]
-            total_records += len(values)
-            metrics[metric_name] = {
-                "count": len(values),
-                "avg": round(sum(values) / len(values), 2) if values else 0,
-                "min": round(min(values), 2) if values else 0,
-                "max": round(max(values), 2) if values else 0,
+            mins, maxs = self._extrema[key]
+            total_records += int(count)
+            metrics[str(metric)] = {
+                "count": int(count),
+                "avg": round(total / count, 2) if count else 0,
+                "min": round(mins[0][1], 2) if mins else 0,
+                "max": round(maxs[0][1], 2) if maxs else 0,
             }
 
         violations = self.get_violations(tenant_id)
@@ -207,4 +244,7 @@ class SLAMonitor:
     def reset(self) -> None:
         """モニターをリセット"""
         self._records.clear()
+        self._agg.clear()
+        self._extrema.clear()
+        self._seq.clear()
         self._violations.clear()
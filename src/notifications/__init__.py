@@ -3,7 +3,7 @@
 from src.notifications.base import BaseNotificationProvider, NotificationMessage, NotificationPriority
 from src.notifications.dispatcher import NotificationDispatcher
 from src.notifications.slack import SlackProvider
-from src.notifications.teams import TeamsProvider
+from src.notifications.teams import TeamsDispatcher, TeamsProvider
 
 __all__ = [
     "BaseNotificationProvider",
@@ -11,5 +11,6 @@ __all__ = [
     "NotificationMessage",
     "NotificationPriority",
     "SlackProvider",
+    "TeamsDispatcher",
     "TeamsProvider",
 ]
@@ -1,11 +1,10 @@
 """通知プロバイダ基底クラス"""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel
-
 
 class NotificationPriority(StrEnum):
     """通知優先度"""
@@ -16,21 +15,44 @@ class NotificationPriority(StrEnum):
     CRITICAL = "critical"
 
 
-class NotificationMessage(BaseModel):
-    """通知メッセージ"""
+@dataclass(slots=True)
+class NotificationMessage:
+    """通知メッセージ（内部型のため生成時の検証なし。外部入力は from_dict を使用）"""
 
     title: str
     body: str
     priority: NotificationPriority = NotificationPriority.MEDIUM
     tenant_id: str = ""
     source: str = ""  # エスカレーション、承認依頼、アラート等
-    metadata: dict[str, Any] = {}
+    metadata: dict[str, Any] = field(default_factory=dict)
     action_url: str | None = None  # 承認画面等へのリンク
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "NotificationMessage":
+        """外部入力（APIリクエスト等）から生成（不正な優先度はMEDIUM扱い）"""
+        try:
+            priority = NotificationPriority(data.get("priority", NotificationPriority.MEDIUM))
+        except ValueError:
+            priority = NotificationPriority.MEDIUM
+
+        action_url = data.get("action_url")
+        return cls(
+            title=str(data.get("title", "")),
+            body=str(data.get("body", "")),
+            priority=priority,
+            tenant_id=str(data.get("tenant_id", "")),
+            source=str(data.get("source", "")),
+            metadata=dict(data.get("metadata") or {}),
+            action_url=str(action_url) if action_url else None,
+        )
+
 
 class BaseNotificationProvider(ABC):
     """通知プロバイダの基底クラス"""
 
+    # 送信先がプロバイダ設定で固定され、テナント別チャンネルを必要としない場合True
+    is_tenant_agnostic: bool = False
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
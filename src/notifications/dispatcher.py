@@ -1,5 +1,7 @@
 """通知ディスパッチャー — 通知の振り分けと送信"""
 
+import asyncio
+
 from loguru import logger
 
 from src.notifications.base import BaseNotificationProvider, NotificationMessage, NotificationPriority
@@ -12,14 +14,20 @@ class NotificationDispatcher:
     テナント単位の通知設定を管理する。
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_concurrent_per_provider: int = 16) -> None:
         self._providers: dict[str, BaseNotificationProvider] = {}
         self._tenant_channels: dict[str, dict[str, str]] = {}
         # テナント → {プロバイダ名 → チャンネル}
+        # 通知ストーム時にプロバイダごとの同時送信数を制限（接続・TLSハンドシェイクの急増防止）
+        self._max_concurrent_per_provider = max_concurrent_per_provider
+        self._provider_semaphores: dict[str, asyncio.Semaphore] = {}
 
-    def register_provider(self, provider: BaseNotificationProvider) -> None:
-        """通知プロバイダを登録"""
+    def register_provider(self, provider: BaseNotificationProvider, max_concurrent: int | None = None) -> None:
+        """通知プロバイダを登録（max_concurrent省略時はディスパッチャーの既定値）"""
         self._providers[provider.provider_name] = provider
+        self._provider_semaphores[provider.provider_name] = asyncio.Semaphore(
+            max_concurrent or self._max_concurrent_per_provider
+        )
         logger.info("通知プロバイダ登録: {}", provider.provider_name)
 
     def set_tenant_channel(
@@ -47,29 +55,41 @@ class NotificationDispatcher:
         Returns:
             {プロバイダ名: 送信成功/失敗} の辞書
         """
-        targets = provider_names or list(self._providers.keys())
-        results: dict[str, bool] = {}
-
-        for name in targets:
-            provider = self._providers.get(name)
-            if not provider:
-                logger.warning("通知プロバイダ未登録: {}", name)
-                results[name] = False
-                continue
-
-            # テナント別チャンネル
-            channel = ""
-            if message.tenant_id and message.tenant_id in self._tenant_channels:
-                channel = self._tenant_channels[message.tenant_id].get(name, "")
-
-            try:
-                success = await provider.send(message, channel)
-                results[name] = success
-            except Exception as e:
-                logger.error("通知送信エラー: provider={}, error={}", name, str(e))
-                results[name] = False
-
-        return results
+        tenant_channels = self._tenant_channels.get(message.tenant_id, {})
+        # チャンネル未設定のテナント依存プロバイダは送信しない（未登録名は結果に失敗として残す）
+        targets = [
+            name
+            for name in provider_names or self._providers
+            if name in tenant_channels or name not in self._providers or self._providers[name].is_tenant_agnostic
+        ]
+        # 各プロバイダへ並行送信（所要時間は合計ではなく最大値）
+        gathered = await asyncio.gather(
+            *(self._send_one(name, message, tenant_channels.get(name, "")) for name in targets),
+            return_exceptions=True,
+        )
+        return {name: self._as_result(name, result) for name, result in zip(targets, gathered, strict=True)}
+
+    async def _send_one(self, name: str, message: NotificationMessage, channel: str) -> bool:
+        """単一プロバイダへの送信"""
+        provider = self._providers.get(name)
+        if not provider:
+            logger.warning("通知プロバイダ未登録: {}", name)
+            return False
+
+        try:
+            async with self._provider_semaphores[name]:
+                return await provider.send(message, channel)
+        except Exception as e:
+            logger.error("通知送信エラー: provider={}, error={}", name, str(e))
+            return False
+
+    @staticmethod
+    def _as_result(name: str, result: bool | BaseException) -> bool:
+        """gather結果を送信成否に変換（例外はFalse）"""
+        if isinstance(result, BaseException):
+            logger.error("通知処理エラー: provider={}, error={}", name, str(result))
+            return False
+        return result
 
     async def dispatch_escalation(
         self,
@@ -130,10 +150,12 @@ class NotificationDispatcher:
 
     async def health_check_all(self) -> dict[str, bool]:
         """全プロバイダのヘルスチェック"""
-        results: dict[str, bool] = {}
-        for name, provider in self._providers.items():
-            try:
-                results[name] = await provider.health_check()
-            except Exception:
-                results[name] = False
-        return results
+        names = list(self._providers.keys())
+        gathered = await asyncio.gather(
+            *(provider.health_check() for provider in self._providers.values()),
+            return_exceptions=True,
+        )
+        return {
+            name: False if isinstance(result, BaseException) else result
+            for name, result in zip(names, gathered, strict=True)
+        }
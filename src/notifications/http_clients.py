@@ -0,0 +1,38 @@
+"""通知プロバイダ共有HTTPクライアント
+
+プロバイダインスタンスやテナントをまたいで接続プールを共有し、
+Webhook送信ごとのTCP/TLSハンドシェイクを避ける。
+生成は初回利用時、切断はアプリケーション終了時（lifespan）に行う。
+"""
+
+import importlib.util
+
+import httpx
+
+# HTTP/2はh2パッケージ（httpx[http2]）がある場合のみ有効化
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# orjsonでシリアライズ済みのバイト列を content= で送る際のヘッダー
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_TEAMS_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_teams_client() -> httpx.AsyncClient:
+    """Teams Webhook用の共有クライアントを取得（初回のみ生成）"""
+    global _TEAMS_CLIENT
+    if _TEAMS_CLIENT is None or _TEAMS_CLIENT.is_closed:
+        _TEAMS_CLIENT = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _TEAMS_CLIENT
+
+
+async def close_teams_client() -> None:
+    """Teams用共有クライアントを切断"""
+    global _TEAMS_CLIENT
+    if _TEAMS_CLIENT is not None:
+        await _TEAMS_CLIENT.aclose()
+        _TEAMS_CLIENT = None
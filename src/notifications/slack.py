@@ -1,16 +1,58 @@
 """Slack 通知プロバイダ — Webhook + Block Kit"""
 
+import asyncio
+import contextlib
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 
 from src.notifications.base import BaseNotificationProvider, NotificationMessage, NotificationPriority
+from src.notifications.http_clients import HTTP2_AVAILABLE, JSON_HEADERS
+
+# 全SlackProviderで共有するクライアント（TCP/TLSセッションをテナント間で再利用）
+_SLACK_CLIENT: httpx.AsyncClient | None = None
+_SLACK_CLIENT_LOCK = asyncio.Lock()
+
+
+async def _get_slack_client() -> httpx.AsyncClient:
+    """共有httpxクライアントを取得（初回のみ生成）"""
+    global _SLACK_CLIENT
+    if _SLACK_CLIENT is None:
+        async with _SLACK_CLIENT_LOCK:
+            if _SLACK_CLIENT is None:
+                _SLACK_CLIENT = httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=10.0,
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                )
+    return _SLACK_CLIENT
+
+
+# 優先度の順位（まとめ送信時の添付カラー決定に使用、未知の優先度の順位はMEDIUM相当）
+_PRIORITY_RANK = {
+    NotificationPriority.LOW: 0,
+    NotificationPriority.MEDIUM: 1,
+    NotificationPriority.HIGH: 2,
+    NotificationPriority.CRITICAL: 3,
+}
+
+
+async def shutdown_slack_client() -> None:
+    """共有クライアントを切断（アプリケーション終了時）"""
+    global _SLACK_CLIENT
+    if _SLACK_CLIENT is not None:
+        await _SLACK_CLIENT.aclose()
+        _SLACK_CLIENT = None
 
 
 class SlackProvider(BaseNotificationProvider):
     """Slack Incoming Webhook 通知プロバイダ"""
 
+    # Webhook URLで送信先が決まるためテナント別チャンネル不要
+    is_tenant_agnostic = True
+
     PRIORITY_EMOJI = {
         NotificationPriority.LOW: ":information_source:",
         NotificationPriority.MEDIUM: ":warning:",
@@ -25,39 +67,106 @@ class SlackProvider(BaseNotificationProvider):
         NotificationPriority.CRITICAL: "#ff0000",
     }
 
-    def __init__(self, webhook_url: str) -> None:
+    def __init__(
+        self,
+        webhook_url: str,
+        coalesce_window_s: float = 0.25,
+        coalesce_max_messages: int = 10,
+    ) -> None:
         self._webhook_url = webhook_url
-        self._client: httpx.AsyncClient | None = None
+        self._enabled = bool(webhook_url)
+        # 通知ストーム時は窓内のメッセージを1リクエストにまとめる（0以下で無効）
+        # 1メッセージ最大4ブロック + 区切り線で、10件ならSlackの50ブロック上限に収まる
+        self._coalesce_window_s = coalesce_window_s
+        self._coalesce_max_messages = coalesce_max_messages
+        self._coalesce_queue: asyncio.Queue[tuple[NotificationMessage, asyncio.Future[bool]]] | None = None
+        self._coalesce_task: asyncio.Task[None] | None = None
+        # 優先度から決まる固定文字列（絵文字、添付カラー、優先度フィールド）
+        self._priority_attrs: dict[NotificationPriority, tuple[str, str, str]] = {
+            p: (
+                self.PRIORITY_EMOJI.get(p, ":bell:"),
+                self.PRIORITY_COLOR.get(p, "#cccccc"),
+                f"*優先度:* {p.value}",
+            )
+            for p in NotificationPriority
+        }
 
     @property
     def provider_name(self) -> str:
         return "slack"
 
     async def send(self, message: NotificationMessage, channel: str = "") -> bool:
-        """Slack Webhookで通知送信"""
-        if not self._webhook_url:
+        """Slack Webhookで通知送信（CRITICAL以外は短時間まとめて送信）"""
+        if not self._enabled:
             logger.warning("Slack: Webhook URLが未設定")
             return False
 
-        payload = self._build_payload(message)
+        if message.priority == NotificationPriority.CRITICAL or self._coalesce_window_s <= 0:
+            return await self._post(self._build_payload(message), message.title)
 
-        try:
-            if not self._client:
-                self._client = httpx.AsyncClient(timeout=10.0)
+        return await self._enqueue(message)
 
-            response = await self._client.post(self._webhook_url, json=payload)
+    async def _post(self, payload: dict[str, Any], title: str) -> bool:
+        """共有クライアントでペイロードをPOST"""
+        try:
+            client = await _get_slack_client()
+            response = await client.post(self._webhook_url, content=orjson.dumps(payload), headers=JSON_HEADERS)
             response.raise_for_status()
 
-            logger.info("Slack通知送信成功: title={}", message.title)
+            logger.info("Slack通知送信成功: title={}", title)
             return True
         except Exception as e:
             logger.error("Slack通知送信エラー: {}", str(e))
             return False
 
+    async def _enqueue(self, message: NotificationMessage) -> bool:
+        """まとめ送信キューに投入し、送信結果を待機"""
+        loop = asyncio.get_running_loop()
+        if self._coalesce_queue is None:
+            self._coalesce_queue = asyncio.Queue()
+        if self._coalesce_task is None or self._coalesce_task.done():
+            self._coalesce_task = loop.create_task(self._coalesce_loop(self._coalesce_queue))
+
+        future: asyncio.Future[bool] = loop.create_future()
+        self._coalesce_queue.put_nowait((message, future))
+        return await future
+
+    async def _coalesce_loop(self, queue: asyncio.Queue[tuple[NotificationMessage, asyncio.Future[bool]]]) -> None:
+        """窓時間または最大件数までメッセージを集めて1回でPOST"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            # 構築例外やclose()による中断でも待機側が取り残されないよう、バッチ単位で結果を確定
+            ok = False
+            try:
+                deadline = loop.time() + self._coalesce_window_s
+                while len(batch) < self._coalesce_max_messages:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except TimeoutError:
+                        break
+
+                messages = [message for message, _ in batch]
+                if len(messages) == 1:
+                    ok = await self._post(self._build_payload(messages[0]), messages[0].title)
+                else:
+                    ok = await self._post(self._build_batch_payload(messages), f"{len(messages)}件まとめ送信")
+            except Exception as e:
+                logger.error("Slackまとめ送信エラー: {}", str(e))
+            finally:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(ok)
+
     def _build_payload(self, message: NotificationMessage) -> dict[str, Any]:
         """Block Kit形式のペイロードを構築"""
-        emoji = self.PRIORITY_EMOJI.get(message.priority, ":bell:")
-        color = self.PRIORITY_COLOR.get(message.priority, "#cccccc")
+        # 未知の優先度（外部入力の "urgent" 等）は既定の絵文字・カラーで、優先度はそのまま表示
+        emoji, color, priority_text = self._priority_attrs.get(
+            message.priority, (":bell:", "#cccccc", f"*優先度:* {message.priority}")
+        )
 
         blocks: list[dict[str, Any]] = [
             {
@@ -83,7 +192,7 @@ class SlackProvider(BaseNotificationProvider):
         if message.tenant_id:
             fields.append({"type": "mrkdwn", "text": f"*テナント:* {message.tenant_id}"})
         if message.priority:
-            fields.append({"type": "mrkdwn", "text": f"*優先度:* {message.priority.value}"})
+            fields.append({"type": "mrkdwn", "text": priority_text})
 
         if fields:
             blocks.append({"type": "section", "fields": fields})
@@ -109,12 +218,35 @@ class SlackProvider(BaseNotificationProvider):
             "attachments": [{"color": color, "blocks": []}],
         }
 
-    async def health_check(self) -> bool:
-        """Webhook URLが設定されているか確認"""
-        return bool(self._webhook_url)
+    def _build_batch_payload(self, messages: list[NotificationMessage]) -> dict[str, Any]:
+        """複数メッセージを区切り線で連結した1つのペイロードを構築"""
+        blocks: list[dict[str, Any]] = []
+        for i, message in enumerate(messages):
+            if i:
+                blocks.append({"type": "divider"})
+            blocks.extend(self._build_payload(message)["blocks"])
+
+        top = max(messages, key=lambda m: _PRIORITY_RANK.get(m.priority, 1))
+        _, color, _ = self._priority_attrs.get(top.priority, (":bell:", "#cccccc", ""))
+        return {
+            "blocks": blocks,
+            "attachments": [{"color": color, "blocks": []}],
+        }
 
     async def close(self) -> None:
-        """クライアント切断"""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """まとめ送信タスクを停止し、未送信メッセージの待機側にFalseを返す"""
+        if self._coalesce_task is not None:
+            self._coalesce_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._coalesce_task
+            self._coalesce_task = None
+        if self._coalesce_queue is not None:
+            while not self._coalesce_queue.empty():
+                _, future = self._coalesce_queue.get_nowait()
+                if not future.done():
+                    future.set_result(False)
+            self._coalesce_queue = None
+
+    async def health_check(self) -> bool:
+        """Webhook URLが設定されているか確認"""
+        return self._enabled
@@ -1,16 +1,135 @@
 """Teams 通知プロバイダ — Webhook + Adaptive Card"""
 
-from typing import Any
+import asyncio
 
 import httpx
+import orjson
 from loguru import logger
+from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
 from src.notifications.base import BaseNotificationProvider, NotificationMessage, NotificationPriority
+from src.notifications.http_clients import JSON_HEADERS, get_teams_client
+
+# Teams Webhookへの同時POST数の上限（Teamsはレート制限が厳しく、バーストで429になる）
+_SEND_SEM = asyncio.Semaphore(10)
+
+
+# テンプレートの可変部分（出現順）。title/color/text はJSON文字列、
+# facts_json/actions_json は先頭カンマ付きの要素（省略時は空）を埋め込む
+_CARD_SLOTS = ("title", "color", "text", "facts_json", "actions_json")
+
+
+def _build_card_template() -> tuple[bytes, ...]:
+    """Adaptive Cardの静的部分を最小化済みJSONとして分割保持
+
+    戻り値は可変部分で分割した断片で、断片と可変部分を交互に連結するとカードになる。
+    """
+    skeleton = {
+        "type": "message",
+        "attachments": [
+            {
+                "contentType": "application/vnd.microsoft.card.adaptive",
+                "content": {
+                    "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+                    "type": "AdaptiveCard",
+                    "version": "1.5",
+                    "msteams": {"width": "Full"},
+                    "body": [
+                        {
+                            "type": "TextBlock",
+                            "text": "@title@",
+                            "weight": "Bolder",
+                            "size": "Medium",
+                            "color": "@color@",
+                        },
+                        {"type": "TextBlock", "text": "@text@", "wrap": True},
+                        "@facts_json@",
+                    ],
+                    "actions": "@actions_json@",
+                },
+            }
+        ],
+    }
+    source = orjson.dumps(skeleton)
+    source = source.replace(b',"@facts_json@"', b"\x00").replace(b',"actions":"@actions_json@"', b"\x00")
+    for name in ("title", "color", "text"):
+        source = source.replace(f'"@{name}@"'.encode(), b"\x00")
+    parts = tuple(source.split(b"\x00"))
+    assert len(parts) == len(_CARD_SLOTS) + 1
+    return parts
+
+
+_CARD_PARTS = _build_card_template()
+
+# 再送対象のステータス（レート制限・一時的なサーバーエラー）。その他の4xxは即失敗
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Retry-Afterヘッダーに従う待機の上限（秒）
+MAX_RETRY_AFTER_S = 30.0
+
+_BACKOFF = wait_exponential_jitter(initial=0.5, max=8)
+
+
+class _RetryableStatusError(Exception):
+    """再送対象ステータスの応答"""
+
+    def __init__(self, status_code: int, retry_after: float | None) -> None:
+        super().__init__(f"Teams Webhook応答 {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-Afterヘッダー（秒数形式のみ対応）を解釈"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Retry-Afterがあればその秒数、なければジッター付き指数バックオフ"""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, _RetryableStatusError) and exc.retry_after is not None:
+        return min(exc.retry_after, MAX_RETRY_AFTER_S)
+    return _BACKOFF(retry_state)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=_wait_retry_after,
+    retry=retry_if_exception_type((httpx.TransportError, _RetryableStatusError)),
+    reraise=True,
+)
+async def _post_with_retry(webhook_url: str, payload: bytes) -> httpx.Response:
+    """POST（通信エラー・429/5xxは再送。待機中はセマフォを保持しない）"""
+    async with _SEND_SEM:
+        response = await get_teams_client().post(webhook_url, content=payload, headers=JSON_HEADERS)
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        raise _RetryableStatusError(response.status_code, _parse_retry_after(response.headers.get("Retry-After")))
+    return response
+
+
+async def _post_webhook(webhook_url: str, payload: bytes, title: str) -> bool:
+    """共有クライアントでAdaptive CardをPOST"""
+    try:
+        response = await _post_with_retry(webhook_url, payload)
+        response.raise_for_status()
+
+        logger.info("Teams通知送信成功: title={}", title)
+        return True
+    except Exception as e:
+        logger.error("Teams通知送信エラー: {}", str(e))
+        return False
 
 
 class TeamsProvider(BaseNotificationProvider):
     """Microsoft Teams Incoming Webhook 通知プロバイダ"""
 
+    # 送信先はWebhookに紐づくチャネルで固定
+    is_tenant_agnostic = True
+
     PRIORITY_COLOR = {
         NotificationPriority.LOW: "good",
         NotificationPriority.MEDIUM: "warning",
@@ -20,7 +139,7 @@ class TeamsProvider(BaseNotificationProvider):
 
     def __init__(self, webhook_url: str) -> None:
         self._webhook_url = webhook_url
-        self._client: httpx.AsyncClient | None = None
+        self._color_json = {p: orjson.dumps(self.PRIORITY_COLOR.get(p, "default")) for p in NotificationPriority}
 
     @property
     def provider_name(self) -> str:
@@ -32,41 +151,11 @@ class TeamsProvider(BaseNotificationProvider):
             logger.warning("Teams: Webhook URLが未設定")
             return False
 
-        payload = self._build_adaptive_card(message)
-
-        try:
-            if not self._client:
-                self._client = httpx.AsyncClient(timeout=10.0)
+        payload = self._build_adaptive_card_bytes(message)
+        return await _post_webhook(self._webhook_url, payload, message.title)
 
-            response = await self._client.post(self._webhook_url, json=payload)
-            response.raise_for_status()
-
-            logger.info("Teams通知送信成功: title={}", message.title)
-            return True
-        except Exception as e:
-            logger.error("Teams通知送信エラー: {}", str(e))
-            return False
-
-    def _build_adaptive_card(self, message: NotificationMessage) -> dict[str, Any]:
-        """Adaptive Card形式のペイロードを構築"""
-        color = self.PRIORITY_COLOR.get(message.priority, "default")
-
-        body: list[dict[str, Any]] = [
-            {
-                "type": "TextBlock",
-                "text": message.title,
-                "weight": "Bolder",
-                "size": "Medium",
-                "color": color,
-            },
-            {
-                "type": "TextBlock",
-                "text": message.body,
-                "wrap": True,
-            },
-        ]
-
-        # ファクトセット（メタデータ）
+    def _build_adaptive_card_bytes(self, message: NotificationMessage) -> bytes:
+        """Adaptive Card形式のペイロード（JSONバイト列）を構築"""
         facts: list[dict[str, str]] = []
         if message.source:
             facts.append({"title": "種別", "value": message.source})
@@ -75,46 +164,94 @@ class TeamsProvider(BaseNotificationProvider):
         if message.priority:
             facts.append({"title": "優先度", "value": message.priority.value})
 
-        if facts:
-            body.append({"type": "FactSet", "facts": facts})
-
-        # アクション
-        actions: list[dict[str, Any]] = []
+        facts_json = b',{"type":"FactSet","facts":' + orjson.dumps(facts) + b"}" if facts else b""
+        actions_json = b""
         if message.action_url:
-            actions.append(
-                {
-                    "type": "Action.OpenUrl",
-                    "title": "詳細を確認",
-                    "url": message.action_url,
-                }
-            )
+            action = {"type": "Action.OpenUrl", "title": "詳細を確認", "url": message.action_url}
+            actions_json = b',"actions":[' + orjson.dumps(action) + b"]"
 
-        card: dict[str, Any] = {
-            "type": "message",
-            "attachments": [
-                {
-                    "contentType": "application/vnd.microsoft.card.adaptive",
-                    "content": {
-                        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-                        "type": "AdaptiveCard",
-                        "version": "1.4",
-                        "body": body,
-                    },
-                }
-            ],
-        }
-
-        if actions:
-            card["attachments"][0]["content"]["actions"] = actions
-
-        return card
+        # 可変部分はorjsonでエンコード済みのため、断片間に挟んでもJSONとして正しい
+        p = _CARD_PARTS
+        return b"".join(
+            (
+                p[0],
+                orjson.dumps(message.title),
+                p[1],
+                self._color_json[message.priority],
+                p[2],
+                orjson.dumps(message.body),
+                p[3],
+                facts_json,
+                p[4],
+                actions_json,
+                p[5],
+            )
+        )
 
     async def health_check(self) -> bool:
         """Webhook URLが設定されているか確認"""
         return bool(self._webhook_url)
 
     async def close(self) -> None:
-        """クライアント切断"""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """プロバイダ終了処理（共有クライアントはアプリ終了時に close_teams_client で切断）"""
+
+
+class TeamsDispatcher:
+    """Teams通知の非同期送信キュー
+
+    ``enqueue`` はキュー投入のみで即時に戻り、ワーカータスクが共有クライアントで送信する。
+    送信完了を待つ必要がある呼び出し元は ``TeamsProvider.send`` を使う。
+    キュー満杯時は通知を破棄し、破棄件数を ``dropped`` に記録する。
+    """
+
+    def __init__(self, provider: TeamsProvider, workers: int = 4, max_queue_size: int = 1000) -> None:
+        self._provider = provider
+        self._num_workers = workers
+        self._queue: asyncio.Queue[tuple[str, bytes, str]] = asyncio.Queue(maxsize=max_queue_size)
+        self._workers: list[asyncio.Task[None]] = []
+        self.dropped = 0
+
+    def enqueue(self, message: NotificationMessage) -> bool:
+        """通知を送信キューに投入（投入できた場合True）"""
+        webhook_url = self._provider._webhook_url
+        if not webhook_url:
+            logger.warning("Teams: Webhook URLが未設定")
+            return False
+
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait((webhook_url, self._provider._build_adaptive_card_bytes(message), message.title))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Teams送信キュー満杯のため通知を破棄: title={}, dropped={}", message.title, self.dropped)
+            return False
+        return True
+
+    def _ensure_workers(self) -> None:
+        """ワーカータスクを起動（停止したものは再起動）"""
+        self._workers = [task for task in self._workers if not task.done()]
+        if len(self._workers) < self._num_workers:
+            loop = asyncio.get_running_loop()
+            self._workers.extend(
+                loop.create_task(self._worker()) for _ in range(self._num_workers - len(self._workers))
+            )
+
+    async def _worker(self) -> None:
+        """キューから取り出して送信"""
+        while True:
+            webhook_url, payload, title = await self._queue.get()
+            try:
+                await _post_webhook(webhook_url, payload, title)
+            finally:
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """キュー内の通知がすべて送信されるまで待機"""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """ワーカータスクを停止（未送信の通知は破棄）"""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
@@ -4,14 +4,44 @@
 予測リスク・クロス分析・プロセスマイニング結果を統合。
 """
 
+import asyncio
+import heapq
+import io
+from bisect import bisect_right
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from operator import itemgetter
+from typing import Any, Final
 
+import orjson
 from loguru import logger
 
+# レベル境界（各値以上で次のレベル）と対応するレベル
+_LEVEL_THRESHOLDS = (40.0, 60.0, 80.0)
+_LEVELS = ("低", "中", "高", "クリティカル")
 
-@dataclass
+# to_markdown_async でスレッドに逃がす要素数（セクション + 所見 + 推奨）の下限
+OFFLOAD_RENDER_THRESHOLD = 100
+
+# リスクトレンドの表示ラベル
+TREND_LABEL_JA: Final[dict[str, str]] = {"improving": "改善傾向", "stable": "安定", "worsening": "悪化傾向"}
+
+# 予測差分の矢印（(diff > 0) - (diff < 0) の符号 0 / 1 / -1 で引く）
+_TREND_ARROWS: Final = ("→", "↑", "↓")
+
+# 推奨アクション文面（{} はカテゴリ名・件数）
+_RECOMMENDATION_TEMPLATES = {
+    "overall_critical": "全体リスクがクリティカルレベルです。緊急の是正計画策定を推奨します。",
+    "overall_high": "全体リスクが高水準です。重点カテゴリの統制強化を検討してください。",
+    "category_critical": "'{}' カテゴリのリスクが非常に高い状態です。即座の対策を検討してください。",
+    "forecast_rising": "予測モデルにより今後のリスク上昇が見込まれています。予防的対策を検討してください。",
+    "process_issues": "プロセス分析で{}件の課題が検出されています。業務プロセスの見直しを推奨します。",
+    "acceptable": "現状のリスクレベルは許容範囲内です。引き続きモニタリングを継続してください。",
+}
+
+
+@dataclass(slots=True)
 class ReportSection:
     """レポートセクション"""
 
@@ -22,7 +52,7 @@ class ReportSection:
     data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportMetadata:
     """レポートメタデータ"""
 
@@ -39,7 +69,7 @@ class ReportMetadata:
     version: str = "1.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskIntelligenceReport:
     """リスクインテリジェンスレポート"""
 
@@ -49,49 +79,121 @@ class RiskIntelligenceReport:
     risk_trend: str = "stable"  # improving, stable, worsening
     key_findings: list[str] = field(default_factory=list)
     recommendations: list[str] = field(default_factory=list)
+    # section_type → 最初に一致するセクション（get_section初回に構築）
+    _index: dict[str, ReportSection] | None = field(default=None, init=False, repr=False, compare=False)
+    _index_key: tuple[int, int] = field(default=(0, -1), init=False, repr=False, compare=False)
+    # 直近のto_markdown結果と、その時点の入力キー（再配信時の再レンダリング回避）
+    _markdown: str | None = field(default=None, init=False, repr=False, compare=False)
+    _markdown_key: tuple[Any, ...] = field(default=(), init=False, repr=False, compare=False)
 
     @property
     def section_count(self) -> int:
         return len(self.sections)
 
     def get_section(self, section_type: str) -> ReportSection | None:
-        """セクションタイプで検索"""
-        for section in self.sections:
-            if section.section_type == section_type:
-                return section
-        return None
+        """セクションタイプで検索
 
-    def to_markdown(self) -> str:
-        """マークダウン形式で出力"""
-        lines = [
-            f"# {self.metadata.title}",
-            "",
-            f"**レポートID**: {self.metadata.report_id}",
-            f"**生成日時**: {self.metadata.generated_at}",
-            f"**対象期間**: {self.metadata.period_start} 〜 {self.metadata.period_end}",
-            f"**全体リスクスコア**: {self.overall_risk_score}",
-            f"**リスクトレンド**: {self.risk_trend}",
-            "",
-        ]
+        索引は sections の差し替え・件数変化で再構築する（要素の置換は検知しないため、
+        生成後のセクションは追加のみとすること）。
+        """
+        key = (id(self.sections), len(self.sections))
+        if self._index is None or self._index_key != key:
+            self._index = {s.section_type: s for s in reversed(self.sections)}
+            self._index_key = key
+        return self._index.get(section_type)
+
+    def _render_key(self) -> tuple[Any, ...]:
+        """マークダウン出力に影響するフィールドのキー（リストは差し替え・件数変化のみ検知）"""
+        metadata = self.metadata
+        return (
+            metadata.title,
+            metadata.report_id,
+            metadata.generated_at,
+            metadata.period_start,
+            metadata.period_end,
+            self.overall_risk_score,
+            self.risk_trend,
+            id(self.sections),
+            len(self.sections),
+            id(self.key_findings),
+            len(self.key_findings),
+            id(self.recommendations),
+            len(self.recommendations),
+        )
+
+    def _markdown_lines(self) -> Iterator[str]:
+        """マークダウンの各行（改行なし）を順に生成"""
+        metadata = self.metadata
+        yield f"# {metadata.title}"
+        yield ""
+        yield f"**レポートID**: {metadata.report_id}"
+        yield f"**生成日時**: {metadata.generated_at}"
+        yield f"**対象期間**: {metadata.period_start} 〜 {metadata.period_end}"
+        yield f"**全体リスクスコア**: {self.overall_risk_score}"
+        yield f"**リスクトレンド**: {self.risk_trend}"
+        yield ""
 
         if self.key_findings:
-            lines.append("## 主要所見")
-            for i, finding in enumerate(self.key_findings, 1):
-                lines.append(f"{i}. {finding}")
-            lines.append("")
+            yield "## 主要所見"
+            yield from (f"{i}. {finding}" for i, finding in enumerate(self.key_findings, 1))
+            yield ""
 
         for section in sorted(self.sections, key=lambda s: s.priority):
-            lines.append(f"## {section.title}")
-            lines.append(section.content)
-            lines.append("")
+            yield f"## {section.title}"
+            yield section.content
+            yield ""
 
         if self.recommendations:
-            lines.append("## 推奨アクション")
-            for i, rec in enumerate(self.recommendations, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
+            yield "## 推奨アクション"
+            yield from (f"{i}. {rec}" for i, rec in enumerate(self.recommendations, 1))
+            yield ""
+
+    def to_markdown_stream(self) -> Iterator[str]:
+        """マークダウンを行単位で逐次出力（StreamingResponse等で全体を保持せずに送出）
 
-        return "\n".join(lines)
+        連結結果は to_markdown と一致する。
+        """
+        lines = self._markdown_lines()
+        yield next(lines)
+        for line in lines:
+            yield f"\n{line}"
+
+    async def to_markdown_async(self) -> str:
+        """to_markdown の非同期版（大きなレポートはスレッドで描画しイベントループを塞がない）"""
+        if len(self.sections) + len(self.key_findings) + len(self.recommendations) < OFFLOAD_RENDER_THRESHOLD:
+            return self.to_markdown()
+        return await asyncio.to_thread(self.to_markdown)
+
+    def to_json(self) -> bytes:
+        """JSON（UTF-8バイト列）で出力
+
+        アンダースコアで始まる内部キャッシュ用フィールドは含まない。
+        セクションdataの未対応型（Decimal等）は文字列化する。
+        """
+        return orjson.dumps(self, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+    def to_markdown(self) -> str:
+        """マークダウン形式で出力
+
+        結果はインスタンスに保持し、入力が変わらなければ再利用する。
+        セクション本文等の要素をその場で書き換えた場合は検知しない。
+        """
+        key = self._render_key()
+        if self._markdown is not None and self._markdown_key == key:
+            return self._markdown
+
+        buf = io.StringIO()
+        buf.writelines(self.to_markdown_stream())
+        self._markdown = buf.getvalue()
+        self._markdown_key = key
+        return self._markdown
+
+
+def _format_category_forecast_line(category: str, current: float, predicted: float) -> str:
+    """カテゴリ別予測1行のフォーマット"""
+    diff = predicted - current
+    arrow = _TREND_ARROWS[(diff > 0) - (diff < 0)]
+    return f"- **{category}**: {current:.1f} → {predicted:.1f} ({arrow}{abs(diff):.1f})"
 
 
 class RiskIntelligenceReportGenerator:
@@ -101,9 +203,11 @@ class RiskIntelligenceReportGenerator:
     LLM統合は将来的に追加予定（現在はテンプレートベース）。
     """
 
-    def __init__(self, company_id: str = "", company_name: str = "") -> None:
+    def __init__(self, company_id: str = "", company_name: str = "", overview_top_n: int | None = None) -> None:
         self._company_id = company_id
         self._company_name = company_name
+        # リスク概観に表示する上位カテゴリ数（Noneなら全件）
+        self._overview_top_n = overview_top_n
 
     def generate_executive_summary(
         self,
@@ -124,8 +228,9 @@ class RiskIntelligenceReportGenerator:
                 "process_issues": [str],
             }
         """
-        now = datetime.now(tz=UTC).isoformat()
-        report_id = f"RPT-{now[:10].replace('-', '')}"
+        now_dt = datetime.now(tz=UTC)
+        now = now_dt.isoformat()
+        report_id = f"RPT-{now_dt:%Y%m%d}"
 
         sections: list[ReportSection] = []
 
@@ -137,7 +242,7 @@ class RiskIntelligenceReportGenerator:
         # 2. リスク概観セクション
         category_scores = risk_data.get("category_scores", {})
         if category_scores:
-            sections.append(self._build_risk_overview_section(category_scores))
+            sections.append(self._build_risk_overview_section(category_scores, top_n=self._overview_top_n))
 
         # 3. 予測リスクセクション
         forecast = risk_data.get("forecast", {})
@@ -204,8 +309,9 @@ class RiskIntelligenceReportGenerator:
                 "category_forecasts": {category: {current: float, predicted: float}},
             }
         """
-        now = datetime.now(tz=UTC).isoformat()
-        report_id = f"RPT-FC-{now[:10].replace('-', '')}"
+        now_dt = datetime.now(tz=UTC)
+        now = now_dt.isoformat()
+        report_id = f"RPT-FC-{now_dt:%Y%m%d}"
 
         sections: list[ReportSection] = []
 
@@ -280,11 +386,7 @@ class RiskIntelligenceReportGenerator:
 
     def _build_summary_section(self, overall_score: float, risk_trend: str) -> ReportSection:
         """サマリーセクション構築"""
-        trend_label = {
-            "improving": "改善傾向",
-            "stable": "安定",
-            "worsening": "悪化傾向",
-        }.get(risk_trend, "不明")
+        trend_label = TREND_LABEL_JA.get(risk_trend, "不明")
 
         level = self._score_to_level(overall_score)
 
@@ -302,16 +404,22 @@ class RiskIntelligenceReportGenerator:
             },
         )
 
-    def _build_risk_overview_section(self, category_scores: dict[str, float]) -> ReportSection:
-        """リスク概観セクション構築"""
-        lines = []
-        for category, score in sorted(category_scores.items(), key=lambda x: x[1], reverse=True):
-            level = self._score_to_level(score)
-            lines.append(f"- **{category}**: {score:.1f} ({level})")
+    def _build_risk_overview_section(
+        self,
+        category_scores: dict[str, float],
+        top_n: int | None = None,
+    ) -> ReportSection:
+        """リスク概観セクション構築（top_n指定時はスコア上位のみ表示、dataは全件）"""
+        if top_n is None:
+            items = sorted(category_scores.items(), key=itemgetter(1), reverse=True)
+        else:
+            items = heapq.nlargest(top_n, category_scores.items(), key=itemgetter(1))
 
         return ReportSection(
             title="リスクカテゴリ別概観",
-            content="\n".join(lines),
+            content="\n".join(
+                f"- **{category}**: {score:.1f} ({self._score_to_level(score)})" for category, score in items
+            ),
             section_type="risk_overview",
             priority=1,
             data=category_scores,
@@ -364,31 +472,31 @@ class RiskIntelligenceReportGenerator:
 
         overall = risk_data.get("overall_score", 0.0)
         if overall >= 80:
-            recommendations.append("全体リスクがクリティカルレベルです。緊急の是正計画策定を推奨します。")
+            recommendations.append(_RECOMMENDATION_TEMPLATES["overall_critical"])
         elif overall >= 60:
-            recommendations.append("全体リスクが高水準です。重点カテゴリの統制強化を検討してください。")
+            recommendations.append(_RECOMMENDATION_TEMPLATES["overall_high"])
 
         # カテゴリ別推奨
         category_scores = risk_data.get("category_scores", {})
-        for cat, score in category_scores.items():
-            if score >= 80:
-                recommendations.append(f"'{cat}' カテゴリのリスクが非常に高い状態です。即座の対策を検討してください。")
+        recommendations.extend(
+            _RECOMMENDATION_TEMPLATES["category_critical"].format(cat)
+            for cat, score in category_scores.items()
+            if score >= 80
+        )
 
         # 予測ベース推奨
         forecast = risk_data.get("forecast", {})
         predicted = forecast.get("predicted_score", 0.0)
         if predicted > overall * 1.2:
-            recommendations.append("予測モデルにより今後のリスク上昇が見込まれています。予防的対策を検討してください。")
+            recommendations.append(_RECOMMENDATION_TEMPLATES["forecast_rising"])
 
         # プロセスベース推奨
         process_issues = risk_data.get("process_issues", [])
         if len(process_issues) >= 3:
-            recommendations.append(
-                f"プロセス分析で{len(process_issues)}件の課題が検出されています。業務プロセスの見直しを推奨します。"
-            )
+            recommendations.append(_RECOMMENDATION_TEMPLATES["process_issues"].format(len(process_issues)))
 
         if not recommendations:
-            recommendations.append("現状のリスクレベルは許容範囲内です。引き続きモニタリングを継続してください。")
+            recommendations.append(_RECOMMENDATION_TEMPLATES["acceptable"])
 
         return recommendations
 
@@ -419,35 +527,17 @@ class RiskIntelligenceReportGenerator:
         confidence: float,
     ) -> str:
         """予測サマリーのフォーマット"""
-        lines = [f"現在のリスクスコア: **{current:.1f}**"]
-
-        if predicted:
-            for p in predicted:
-                month = p.get("month", "N/A")
-                score = p.get("score", 0.0)
-                lines.append(f"- {month}: {score:.1f}")
-
-        lines.append(f"\n予測信頼度: **{confidence:.0%}**")
-        return "\n".join(lines)
+        months = "".join(f"\n- {p.get('month', 'N/A')}: {p.get('score', 0.0):.1f}" for p in predicted)
+        return f"現在のリスクスコア: **{current:.1f}**{months}\n\n予測信頼度: **{confidence:.0%}**"
 
     def _format_category_forecasts(self, cat_forecasts: dict[str, Any]) -> str:
         """カテゴリ別予測のフォーマット"""
-        lines = []
-        for cat, data in cat_forecasts.items():
-            current = data.get("current", 0.0)
-            predicted = data.get("predicted", 0.0)
-            diff = predicted - current
-            arrow = "↑" if diff > 0 else "↓" if diff < 0 else "→"
-            lines.append(f"- **{cat}**: {current:.1f} → {predicted:.1f} ({arrow}{abs(diff):.1f})")
-        return "\n".join(lines)
+        return "\n".join(
+            _format_category_forecast_line(cat, data.get("current", 0.0), data.get("predicted", 0.0))
+            for cat, data in cat_forecasts.items()
+        )
 
     @staticmethod
     def _score_to_level(score: float) -> str:
         """スコアをリスクレベル文字列に変換"""
-        if score >= 80:
-            return "クリティカル"
-        if score >= 60:
-            return "高"
-        if score >= 40:
-            return "中"
-        return "低"
+        return _LEVELS[bisect_right(_LEVEL_THRESHOLDS, score)]
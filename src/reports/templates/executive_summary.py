@@ -4,13 +4,22 @@ RiskIntelligenceReportからボード向けフォーマットのサマリーを
 リスクヒートマップ、KPIテーブル、アクションアイテムを含む。
 """
 
+import asyncio
+import io
+from bisect import bisect_right
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import cached_property
 
-from src.reports.risk_intelligence import RiskIntelligenceReport
+from src.reports.risk_intelligence import OFFLOAD_RENDER_THRESHOLD, TREND_LABEL_JA, RiskIntelligenceReport
 
+# ヒートマップ・全体リスクのレベル判定（40/60/80以上で1段階上がる）
+_LEVEL_THRESHOLDS = (40.0, 60.0, 80.0)
+_LEVELS = ("low", "medium", "high", "critical")
 
-@dataclass
+
+@dataclass(slots=True)
 class KPIItem:
     """KPI指標"""
 
@@ -20,7 +29,7 @@ class KPIItem:
     target: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class HeatmapCell:
     """リスクヒートマップセル"""
 
@@ -30,7 +39,7 @@ class HeatmapCell:
     trend: str = "stable"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionItem:
     """アクションアイテム"""
 
@@ -43,7 +52,11 @@ class ActionItem:
 
 @dataclass
 class ExecutiveSummaryOutput:
-    """エグゼクティブサマリー出力"""
+    """エグゼクティブサマリー出力
+
+    kpis / heatmap / action_items / markdown は初回アクセス時に構築する
+    （cached_propertyのためslotsは使わない）。
+    """
 
     title: str
     generated_at: str
@@ -51,12 +64,50 @@ class ExecutiveSummaryOutput:
     overall_score: float
     overall_level: str
     risk_trend: str
-    kpis: list[KPIItem] = field(default_factory=list)
-    heatmap: list[HeatmapCell] = field(default_factory=list)
     key_findings: list[str] = field(default_factory=list)
-    action_items: list[ActionItem] = field(default_factory=list)
     recommendations: list[str] = field(default_factory=list)
-    markdown: str = ""
+    _report: RiskIntelligenceReport | None = field(default=None, repr=False, compare=False)
+    _extra_kpis: list[dict[str, str]] | None = field(default=None, repr=False, compare=False)
+
+    @cached_property
+    def kpis(self) -> list[KPIItem]:
+        if self._report is None:
+            return []
+        return ExecutiveSummaryTemplate._build_kpis(self._report, self._extra_kpis)
+
+    @cached_property
+    def heatmap(self) -> list[HeatmapCell]:
+        if self._report is None:
+            return []
+        return ExecutiveSummaryTemplate._build_heatmap(self._report)
+
+    @cached_property
+    def action_items(self) -> list[ActionItem]:
+        if self._report is None:
+            return []
+        return ExecutiveSummaryTemplate._build_action_items(self._report)
+
+    @cached_property
+    def markdown(self) -> str:
+        if self._report is None:
+            return ""
+        return ExecutiveSummaryTemplate._render_markdown(
+            report=self._report,
+            heatmap=self.heatmap,
+            kpis=self.kpis,
+            action_items=self.action_items,
+            overall_level=self.overall_level,
+            period=self.period,
+        )
+
+    async def markdown_async(self) -> str:
+        """markdown の非同期版（大きなレポートはスレッドで描画）"""
+        report = self._report
+        if report is None or "markdown" in self.__dict__:
+            return self.markdown
+        if len(report.sections) + len(report.key_findings) + len(report.recommendations) < OFFLOAD_RENDER_THRESHOLD:
+            return self.markdown
+        return await asyncio.to_thread(lambda: self.markdown)
 
 
 class ExecutiveSummaryTemplate:
@@ -79,39 +130,18 @@ class ExecutiveSummaryTemplate:
         now = datetime.now(tz=UTC).isoformat()
         period = f"{report.metadata.period_start} 〜 {report.metadata.period_end}"
 
-        # リスクヒートマップ構築
-        heatmap = ExecutiveSummaryTemplate._build_heatmap(report)
-
-        # KPI構築
-        kpis = ExecutiveSummaryTemplate._build_kpis(report, extra_kpis)
-
-        # アクションアイテム構築
-        action_items = ExecutiveSummaryTemplate._build_action_items(report)
-
-        # マークダウン生成
-        overall_level = ExecutiveSummaryTemplate._score_to_level(report.overall_risk_score)
-        markdown = ExecutiveSummaryTemplate._render_markdown(
-            report=report,
-            heatmap=heatmap,
-            kpis=kpis,
-            action_items=action_items,
-            overall_level=overall_level,
-            period=period,
-        )
-
+        # ヒートマップ・KPI・アクションアイテム・マークダウンは参照時に構築
         return ExecutiveSummaryOutput(
             title=f"エグゼクティブサマリー — {report.metadata.company_name or 'N/A'}",
             generated_at=now,
             period=period,
             overall_score=report.overall_risk_score,
-            overall_level=overall_level,
+            overall_level=ExecutiveSummaryTemplate._score_to_level(report.overall_risk_score),
             risk_trend=report.risk_trend,
-            kpis=kpis,
-            heatmap=heatmap,
             key_findings=report.key_findings,
-            action_items=action_items,
             recommendations=report.recommendations,
-            markdown=markdown,
+            _report=report,
+            _extra_kpis=extra_kpis,
         )
 
     @staticmethod
@@ -215,59 +245,62 @@ class ExecutiveSummaryTemplate:
         period: str,
     ) -> str:
         """マークダウン形式でレンダリング"""
-        lines: list[str] = []
+        lines = ExecutiveSummaryTemplate._markdown_lines(report, heatmap, kpis, action_items, overall_level, period)
+        buf = io.StringIO()
+        buf.write(next(lines))
+        for line in lines:
+            buf.write("\n")
+            buf.write(line)
+        return buf.getvalue()
+
+    @staticmethod
+    def _markdown_lines(
+        report: RiskIntelligenceReport,
+        heatmap: list[HeatmapCell],
+        kpis: list[KPIItem],
+        action_items: list[ActionItem],
+        overall_level: str,
+        period: str,
+    ) -> Iterator[str]:
+        """マークダウンの各行（改行なし）を順に生成"""
+        trend_label = TREND_LABEL_JA.get(report.risk_trend, report.risk_trend)
 
         # ヘッダー
-        lines.append(f"# エグゼクティブサマリー — {report.metadata.company_name or 'N/A'}")
-        lines.append("")
-        lines.append(f"**対象期間**: {period}")
-        lines.append(f"**全体リスク**: {report.overall_risk_score:.1f} ({overall_level})")
-        trend_label = {"improving": "改善傾向", "stable": "安定", "worsening": "悪化傾向"}.get(
-            report.risk_trend, report.risk_trend
-        )
-        lines.append(f"**トレンド**: {trend_label}")
-        lines.append("")
+        yield f"# エグゼクティブサマリー — {report.metadata.company_name or 'N/A'}"
+        yield ""
+        yield f"**対象期間**: {period}"
+        yield f"**全体リスク**: {report.overall_risk_score:.1f} ({overall_level})"
+        yield f"**トレンド**: {trend_label}"
+        yield ""
 
         # KPIテーブル
-        lines.append("## KPI指標")
-        lines.append("| 指標 | 値 | トレンド |")
-        lines.append("|------|-----|---------|")
-        for kpi in kpis:
-            lines.append(f"| {kpi.label} | {kpi.value} | {kpi.trend} |")
-        lines.append("")
+        yield "## KPI指標"
+        yield "| 指標 | 値 | トレンド |"
+        yield "|------|-----|---------|"
+        yield from (f"| {kpi.label} | {kpi.value} | {kpi.trend} |" for kpi in kpis)
+        yield ""
 
         # リスクヒートマップ
         if heatmap:
-            lines.append("## リスクヒートマップ")
-            lines.append("| カテゴリ | スコア | レベル |")
-            lines.append("|---------|--------|--------|")
-            for cell in heatmap:
-                lines.append(f"| {cell.category} | {cell.score:.1f} | {cell.level} |")
-            lines.append("")
+            yield "## リスクヒートマップ"
+            yield "| カテゴリ | スコア | レベル |"
+            yield "|---------|--------|--------|"
+            yield from (f"| {cell.category} | {cell.score:.1f} | {cell.level} |" for cell in heatmap)
+            yield ""
 
         # 主要所見
         if report.key_findings:
-            lines.append("## 主要所見")
-            for i, finding in enumerate(report.key_findings, 1):
-                lines.append(f"{i}. {finding}")
-            lines.append("")
+            yield "## 主要所見"
+            yield from (f"{i}. {finding}" for i, finding in enumerate(report.key_findings, 1))
+            yield ""
 
         # アクションアイテム
         if action_items:
-            lines.append("## アクションアイテム")
-            for item in action_items:
-                lines.append(f"- [{item.priority}] {item.title}")
-            lines.append("")
-
-        return "\n".join(lines)
+            yield "## アクションアイテム"
+            yield from (f"- [{item.priority}] {item.title}" for item in action_items)
+            yield ""
 
     @staticmethod
     def _score_to_level(score: float) -> str:
         """スコアをレベル文字列に変換"""
-        if score >= 80:
-            return "critical"
-        if score >= 60:
-            return "high"
-        if score >= 40:
-            return "medium"
-        return "low"
+        return _LEVELS[bisect_right(_LEVEL_THRESHOLDS, score)]
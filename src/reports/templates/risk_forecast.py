@@ -4,14 +4,43 @@
 信頼区間、カテゴリ別内訳、シナリオ分析セクションを含む。
 """
 
+import heapq
+import sys
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from enum import StrEnum
+from operator import attrgetter
 from typing import Any
 
 from src.reports.risk_intelligence import RiskIntelligenceReport
 
+# マークダウンのヘッダー部（period_line は対象期間行または空文字）
+_HEADER_TEMPLATE = (
+    "# {title}\n\n{period_line}**現在リスクスコア**: {current_score:.1f}\n**予測信頼度**: {confidence:.0%}"
+)
 
-@dataclass
+# 予測テーブルの行書式（% 演算子で展開する）
+_FORECAST_ROW = "| %s | %.1f | %.1f | %.1f |"
+_CATEGORY_ROW = "| %s | %.1f | %.1f | %s%.1f |"
+_forecast_row_fields = attrgetter("month", "predicted_score", "lower_bound", "upper_bound")
+
+
+class ForecastDirection(StrEnum):
+    """カテゴリ別予測の変化方向"""
+
+    UP = "up"
+    DOWN = "down"
+    STABLE = "stable"
+
+
+# 変化量の符号 (change > 1) - (change < -1) → 方向（-1 は末尾の DOWN を引く）
+_DIRECTION_BY_SIGN = (ForecastDirection.STABLE, ForecastDirection.UP, ForecastDirection.DOWN)
+
+# カテゴリ別予測の変化方向の矢印（stable は →）
+_DIRECTION_ARROWS = {ForecastDirection.UP: "↑", ForecastDirection.DOWN: "↓"}
+
+
+@dataclass(slots=True, frozen=True)
 class ForecastPoint:
     """予測ポイント"""
 
@@ -21,7 +50,7 @@ class ForecastPoint:
     upper_bound: float = 100.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CategoryForecast:
     """カテゴリ別予測"""
 
@@ -29,10 +58,10 @@ class CategoryForecast:
     current_score: float
     predicted_score: float
     change: float = 0.0
-    direction: str = "stable"  # up, down, stable
+    direction: ForecastDirection = ForecastDirection.STABLE
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScenarioAnalysis:
     """シナリオ分析"""
 
@@ -43,9 +72,12 @@ class ScenarioAnalysis:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskForecastOutput:
-    """予測リスクレポート出力"""
+    """予測リスクレポート出力
+
+    markdown は初回アクセス時に描画して保持する（構造化データのみ使う経路では描画しない）。
+    """
 
     title: str
     generated_at: str
@@ -57,7 +89,27 @@ class RiskForecastOutput:
     scenarios: list[ScenarioAnalysis] = field(default_factory=list)
     risk_factors: list[str] = field(default_factory=list)
     recommendations: list[str] = field(default_factory=list)
-    markdown: str = ""
+    _markdown: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def markdown(self) -> str:
+        if self._markdown is None:
+            object.__setattr__(self, "_markdown", self.render_markdown())
+        return self._markdown  # type: ignore[return-value]
+
+    def render_markdown(self) -> str:
+        """マークダウン形式でレンダリング（キャッシュしない）"""
+        return RiskForecastTemplate._render_markdown(
+            current_score=self.current_score,
+            confidence=self.confidence,
+            forecast_points=self.forecast_points,
+            cat_forecasts=self.category_forecasts,
+            scenarios=self.scenarios,
+            risk_factors=self.risk_factors,
+            recommendations=self.recommendations,
+            title=self.title,
+            period=self.period,
+        )
 
 
 class RiskForecastTemplate:
@@ -67,8 +119,13 @@ class RiskForecastTemplate:
     """
 
     @staticmethod
-    def render_from_report(report: RiskIntelligenceReport) -> RiskForecastOutput:
-        """RiskIntelligenceReportから予測レポートを生成"""
+    def render_from_report(report: RiskIntelligenceReport, now_iso: str | None = None) -> RiskForecastOutput:
+        """RiskIntelligenceReportから予測レポートを生成
+
+        Args:
+            report: 元レポート
+            now_iso: 生成日時（ISO 8601）。バッチ生成で共通の時刻を使う場合に指定
+        """
         forecast_section = report.get_section("forecast")
         forecast_data: dict[str, Any] = forecast_section.data if forecast_section else {}
 
@@ -84,6 +141,7 @@ class RiskForecastTemplate:
             period_start=report.metadata.period_start,
             period_end=report.metadata.period_end,
             company_name=report.metadata.company_name,
+            now_iso=now_iso,
         )
 
     @staticmethod
@@ -96,6 +154,7 @@ class RiskForecastTemplate:
         period_start: str = "",
         period_end: str = "",
         company_name: str = "",
+        now_iso: str | None = None,
     ) -> RiskForecastOutput:
         """生データから予測リスクレポートを生成
 
@@ -108,8 +167,9 @@ class RiskForecastTemplate:
             period_start: 期間開始
             period_end: 期間終了
             company_name: 企業名
+            now_iso: 生成日時（ISO 8601）。省略時は現在時刻
         """
-        now = datetime.now(tz=UTC).isoformat()
+        now = now_iso or datetime.now(tz=UTC).isoformat()
         period = f"{period_start} 〜 {period_end}" if period_start else ""
 
         # 予測ポイント構築
@@ -126,19 +186,6 @@ class RiskForecastTemplate:
             current_score, forecast_points, confidence, cat_forecasts
         )
 
-        # マークダウン生成
-        markdown = RiskForecastTemplate._render_markdown(
-            current_score=current_score,
-            confidence=confidence,
-            forecast_points=forecast_points,
-            cat_forecasts=cat_forecasts,
-            scenarios=scenarios,
-            risk_factors=risk_factors or [],
-            recommendations=recommendations,
-            company_name=company_name,
-            period=period,
-        )
-
         return RiskForecastOutput(
             title=f"予測リスクレポート — {company_name or 'N/A'}",
             generated_at=now,
@@ -150,7 +197,6 @@ class RiskForecastTemplate:
             scenarios=scenarios,
             risk_factors=risk_factors or [],
             recommendations=recommendations,
-            markdown=markdown,
         )
 
     @staticmethod
@@ -179,10 +225,10 @@ class RiskForecastTemplate:
             current = float(data.get("current", 0.0))
             predicted = float(data.get("predicted", 0.0))
             change = predicted - current
-            direction = "up" if change > 1.0 else "down" if change < -1.0 else "stable"
+            direction = _DIRECTION_BY_SIGN[(change > 1.0) - (change < -1.0)]
             forecasts.append(
                 CategoryForecast(
-                    category=str(cat),
+                    category=sys.intern(str(cat)),
                     current_score=current,
                     predicted_score=predicted,
                     change=change,
@@ -253,9 +299,13 @@ class RiskForecastTemplate:
                 recs.append("リスクスコアの改善が予測されています。現在の統制施策を継続してください。")
 
         # カテゴリベース
-        worsening_cats = [f for f in cat_forecasts if f.direction == "up" and f.change > 10.0]
+        worsening_cats = heapq.nlargest(
+            3,
+            (f for f in cat_forecasts if f.direction == ForecastDirection.UP and f.change > 10.0),
+            key=attrgetter("change"),
+        )
         if worsening_cats:
-            cat_names = "、".join(f.category for f in worsening_cats[:3])
+            cat_names = "、".join(f.category for f in worsening_cats)
             recs.append(f"以下のカテゴリでリスク上昇が顕著です: {cat_names}")
 
         if not recs:
@@ -272,64 +322,67 @@ class RiskForecastTemplate:
         scenarios: list[ScenarioAnalysis],
         risk_factors: list[str],
         recommendations: list[str],
-        company_name: str,
+        title: str,
         period: str,
     ) -> str:
         """マークダウン形式でレンダリング"""
-        lines: list[str] = []
-
-        # ヘッダー
-        lines.append(f"# 予測リスクレポート — {company_name or 'N/A'}")
-        lines.append("")
-        if period:
-            lines.append(f"**対象期間**: {period}")
-        lines.append(f"**現在リスクスコア**: {current_score:.1f}")
-        lines.append(f"**予測信頼度**: {confidence:.0%}")
-        lines.append("")
+        lines = [
+            _HEADER_TEMPLATE.format(
+                title=title,
+                period_line=f"**対象期間**: {period}\n" if period else "",
+                current_score=current_score,
+                confidence=confidence,
+            ),
+            "",
+        ]
 
         # 3ヶ月予測
         if forecast_points:
-            lines.append("## 3ヶ月リスク予測")
-            lines.append("| 月 | 予測スコア | 下限 | 上限 |")
-            lines.append("|----|----------|------|------|")
-            for fp in forecast_points:
-                lines.append(f"| {fp.month} | {fp.predicted_score:.1f} | {fp.lower_bound:.1f} | {fp.upper_bound:.1f} |")
-            lines.append("")
+            lines += [
+                "## 3ヶ月リスク予測",
+                "| 月 | 予測スコア | 下限 | 上限 |",
+                "|----|----------|------|------|",
+                *[_FORECAST_ROW % _forecast_row_fields(fp) for fp in forecast_points],
+                "",
+            ]
 
         # カテゴリ別予測
         if cat_forecasts:
-            lines.append("## カテゴリ別予測")
-            lines.append("| カテゴリ | 現在 | 予測 | 変化 |")
-            lines.append("|---------|------|------|------|")
-            for cf in cat_forecasts:
-                arrow = "↑" if cf.direction == "up" else "↓" if cf.direction == "down" else "→"
-                lines.append(
-                    f"| {cf.category} | {cf.current_score:.1f} "
-                    f"| {cf.predicted_score:.1f} | {arrow}{abs(cf.change):.1f} |"
-                )
-            lines.append("")
+            lines += [
+                "## カテゴリ別予測",
+                "| カテゴリ | 現在 | 予測 | 変化 |",
+                "|---------|------|------|------|",
+                *[
+                    _CATEGORY_ROW
+                    % (
+                        cf.category,
+                        cf.current_score,
+                        cf.predicted_score,
+                        _DIRECTION_ARROWS.get(cf.direction, "→"),
+                        abs(cf.change),
+                    )
+                    for cf in cat_forecasts
+                ],
+                "",
+            ]
 
         # シナリオ分析
         if scenarios:
-            lines.append("## シナリオ分析")
-            for s in scenarios:
-                lines.append(
+            lines += [
+                "## シナリオ分析",
+                *[
                     f"- **{s.label}** (確率 {s.probability:.0%}): スコア {s.predicted_score:.1f} — {s.description}"
-                )
-            lines.append("")
+                    for s in scenarios
+                ],
+                "",
+            ]
 
         # リスク要因
         if risk_factors:
-            lines.append("## リスク要因")
-            for f in risk_factors:
-                lines.append(f"- {f}")
-            lines.append("")
+            lines += ["## リスク要因", *[f"- {f}" for f in risk_factors], ""]
 
         # 推奨アクション
         if recommendations:
-            lines.append("## 推奨アクション")
-            for i, rec in enumerate(recommendations, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
+            lines += ["## 推奨アクション", *[f"{i}. {rec}" for i, rec in enumerate(recommendations, 1)], ""]
 
         return "\n".join(lines)
@@ -4,13 +4,14 @@
 対応業種: finance（金融）, manufacturing（製造）, it_services（IT）
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskItem:
     """テンプレートリスク項目"""
 
@@ -26,7 +27,7 @@ class RiskItem:
     tags: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ControlItem:
     """テンプレート統制項目"""
 
@@ -42,7 +43,7 @@ class ControlItem:
     regulatory_ref: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IndustryTemplateDefinition:
     """業種テンプレート定義"""
 
@@ -52,8 +53,20 @@ class IndustryTemplateDefinition:
     version: str = "1.0"
     description: str = ""
     regulatory_framework: str = ""
-    risks: list[RiskItem] = field(default_factory=list)
-    controls: list[ControlItem] = field(default_factory=list)
+    risks: Sequence[RiskItem] = field(default_factory=tuple)
+    controls: Sequence[ControlItem] = field(default_factory=tuple)
+    # register_template で確定するキャッシュ（登録後のテンプレートは不変として扱う）
+    _categories: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    # 構築時に作るカテゴリ別・リスクコード別インデックス
+    _risks_by_category: dict[str, list[RiskItem]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _controls_by_risk: dict[str, list[ControlItem]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for risk in self.risks:
+            self._risks_by_category.setdefault(risk.category, []).append(risk)
+        for control in self.controls:
+            self._controls_by_risk.setdefault(control.risk_code, []).append(control)
 
     @property
     def risk_count(self) -> int:
@@ -65,18 +78,23 @@ class IndustryTemplateDefinition:
 
     def get_risks_by_category(self, category: str) -> list[RiskItem]:
         """カテゴリ別リスク取得"""
-        return [r for r in self.risks if r.category == category]
+        return list(self._risks_by_category.get(category, ()))
 
     def get_controls_for_risk(self, risk_code: str) -> list[ControlItem]:
         """リスクコードに紐づく統制取得"""
-        return [c for c in self.controls if c.risk_code == risk_code]
+        return list(self._controls_by_risk.get(risk_code, ()))
 
     def get_categories(self) -> list[str]:
         """全カテゴリ一覧"""
+        if self._categories is not None:
+            return list(self._categories)
         return sorted({r.category for r in self.risks})
 
     def to_dict(self) -> dict[str, Any]:
         """辞書変換（API応答用）"""
+        if self._dict is not None:
+            # 呼び出し側の変更がレジストリのキャッシュに波及しないようコピーを返す
+            return {**self._dict, "categories": self.get_categories()}
         return {
             "industry_code": self.industry_code,
             "industry_name": self.industry_name,
@@ -91,13 +109,20 @@ class IndustryTemplateDefinition:
 
 
 # ── テンプレートレジストリ ──────────────────────────────
-_TEMPLATE_REGISTRY: dict[str, IndustryTemplateDefinition] = {}
+# 業種コード → リージョン → テンプレート
+_TEMPLATE_REGISTRY: dict[str, dict[str, IndustryTemplateDefinition]] = {}
+# load_all_templates でロード済みのテンプレート数（0 は未ロード）
+_loaded_count = 0
 
 
 def register_template(template: IndustryTemplateDefinition) -> None:
     """テンプレートをレジストリに登録"""
-    key = f"{template.industry_code}_{template.region}"
-    _TEMPLATE_REGISTRY[key] = template
+    # frozen のためキャッシュ属性は object.__setattr__ で設定する
+    object.__setattr__(template, "_categories", None)
+    object.__setattr__(template, "_dict", None)
+    object.__setattr__(template, "_categories", tuple(template.get_categories()))
+    object.__setattr__(template, "_dict", template.to_dict())
+    _TEMPLATE_REGISTRY.setdefault(template.industry_code, {})[template.region] = template
     logger.info(
         f"テンプレート登録: {template.industry_name} ({template.region}), "
         f"リスク={template.risk_count}, 統制={template.control_count}"
@@ -106,25 +131,32 @@ def register_template(template: IndustryTemplateDefinition) -> None:
 
 def get_template(industry_code: str, region: str = "JP") -> IndustryTemplateDefinition | None:
     """テンプレート取得"""
-    return _TEMPLATE_REGISTRY.get(f"{industry_code}_{region}")
+    regions = _TEMPLATE_REGISTRY.get(industry_code)
+    return regions.get(region) if regions else None
 
 
 def list_templates() -> list[dict[str, Any]]:
     """登録済みテンプレート一覧"""
-    return [t.to_dict() for t in _TEMPLATE_REGISTRY.values()]
+    return [t.to_dict() for regions in _TEMPLATE_REGISTRY.values() for t in regions.values()]
 
 
 def get_available_industries() -> list[str]:
     """利用可能な業種コード一覧"""
-    return sorted({t.industry_code for t in _TEMPLATE_REGISTRY.values()})
+    return sorted(_TEMPLATE_REGISTRY)
 
 
 def load_all_templates() -> int:
     """全業種テンプレートをロード
 
+    2回目以降の呼び出しは登録をスキップする。
+
     Returns:
         ロードしたテンプレート数
     """
+    global _loaded_count
+    if _loaded_count:
+        return _loaded_count
+
     from src.risk_templates.finance import get_finance_template
     from src.risk_templates.it_services import get_it_services_template
     from src.risk_templates.manufacturing import get_manufacturing_template
@@ -138,5 +170,6 @@ def load_all_templates() -> int:
     for template in templates:
         register_template(template)
 
-    logger.info(f"全テンプレートロード完了: {len(templates)}業種")
-    return len(templates)
+    _loaded_count = len(templates)
+    logger.info(f"全テンプレートロード完了: {_loaded_count}業種")
+    return _loaded_count
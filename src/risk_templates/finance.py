@@ -4,13 +4,15 @@
 金融業向けリスク・統制テンプレート。
 """
 
+from functools import lru_cache
+
 from src.risk_templates import (
     ControlItem,
     IndustryTemplateDefinition,
     RiskItem,
 )
 
-_FINANCE_RISKS: list[RiskItem] = [
+_FINANCE_RISKS: tuple[RiskItem, ...] = (
     # ── 財務プロセス ──
     RiskItem(
         risk_code="FIN-001",
@@ -135,9 +137,9 @@ _FINANCE_RISKS: list[RiskItem] = [
         applicable_assertions=["完全性"],
         tags=["j-sox", "it_gc", "bcp"],
     ),
-]
+)
 
-_FINANCE_CONTROLS: list[ControlItem] = [
+_FINANCE_CONTROLS: tuple[ControlItem, ...] = (
     # 売上計上
     ControlItem(
         control_code="FC-001",
@@ -238,11 +240,12 @@ _FINANCE_CONTROLS: list[ControlItem] = [
         description="日次バックアップジョブの実行結果確認。",
         automation_level="full_auto",
     ),
-]
+)
 
 
+@lru_cache(maxsize=1)
 def get_finance_template() -> IndustryTemplateDefinition:
-    """金融業テンプレートを生成"""
+    """金融業テンプレートを取得（初回呼び出し時のみ生成）"""
     return IndustryTemplateDefinition(
         industry_code="finance",
         industry_name="金融業",
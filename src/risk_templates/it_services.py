@@ -4,13 +4,15 @@ SaaS/クラウド事業者、システム開発会社向けの
 リスク項目・統制テンプレート。情報セキュリティ・開発管理中心。
 """
 
+from functools import lru_cache
+
 from src.risk_templates import (
     ControlItem,
     IndustryTemplateDefinition,
     RiskItem,
 )
 
-_IT_RISKS: list[RiskItem] = [
+_IT_RISKS: tuple[RiskItem, ...] = (
     # ── 情報セキュリティ ──
     RiskItem(
         risk_code="IT-001",
@@ -135,9 +137,9 @@ _IT_RISKS: list[RiskItem] = [
         applicable_assertions=["完全性", "権利と義務"],
         tags=["license", "oss", "compliance"],
     ),
-]
+)
 
-_IT_CONTROLS: list[ControlItem] = [
+_IT_CONTROLS: tuple[ControlItem, ...] = (
     # クラウドセキュリティ
     ControlItem(
         control_code="IC-001",
@@ -241,11 +243,12 @@ _IT_CONTROLS: list[ControlItem] = [
         recommended_sample_size=0,
         description="OSS・商用ライセンスのコンプライアンス棚卸。",
     ),
-]
+)
 
 
+@lru_cache(maxsize=1)
 def get_it_services_template() -> IndustryTemplateDefinition:
-    """IT業テンプレートを生成"""
+    """IT業テンプレートを取得（初回呼び出し時のみ生成）"""
     return IndustryTemplateDefinition(
         industry_code="it_services",
         industry_name="IT・SaaS",
@@ -4,13 +4,15 @@
 およびJ-SOX対応の統制手続きを定義。
 """
 
+from functools import lru_cache
+
 from src.risk_templates import (
     ControlItem,
     IndustryTemplateDefinition,
     RiskItem,
 )
 
-_MANUFACTURING_RISKS: list[RiskItem] = [
+_MANUFACTURING_RISKS: tuple[RiskItem, ...] = (
     # ── 在庫管理 ──
     RiskItem(
         risk_code="MFG-001",
@@ -112,9 +114,9 @@ _MANUFACTURING_RISKS: list[RiskItem] = [
         applicable_assertions=["存在性", "完全性"],
         tags=["j-sox", "it_gc", "change_mgmt"],
     ),
-]
+)
 
-_MANUFACTURING_CONTROLS: list[ControlItem] = [
+_MANUFACTURING_CONTROLS: tuple[ControlItem, ...] = (
     # 在庫管理
     ControlItem(
         control_code="MC-001",
@@ -202,11 +204,12 @@ _MANUFACTURING_CONTROLS: list[ControlItem] = [
         recommended_sample_size=25,
         description="MES/ERPシステム変更の承認フローとテスト記録確認。",
     ),
-]
+)
 
 
+@lru_cache(maxsize=1)
 def get_manufacturing_template() -> IndustryTemplateDefinition:
-    """製造業テンプレートを生成"""
+    """製造業テンプレートを取得（初回呼び出し時のみ生成）"""
     return IndustryTemplateDefinition(
         industry_code="manufacturing",
         industry_name="製造業",
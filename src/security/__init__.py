@@ -1,5 +1,30 @@
-from src.security.auth import AuthService
-from src.security.encryption import EncryptionService
-from src.security.rbac import RBACService
+"""セキュリティサービス
+
+各サービスは初回参照時に読み込む（PEP 562）。サブモジュールを直接使う呼び出し側は
+他サービスの依存（暗号ライブラリ等）を読み込まずに済む。
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.security.auth import AuthService
+    from src.security.encryption import EncryptionService
+    from src.security.rbac import RBACService
 
 __all__ = ["AuthService", "EncryptionService", "RBACService"]
+
+_LAZY_EXPORTS = {
+    "AuthService": "src.security.auth",
+    "EncryptionService": "src.security.encryption",
+    "RBACService": "src.security.rbac",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -1,14 +1,20 @@
 """監査証跡 — Append-Only操作ログ"""
 
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+import pydantic_core
 from loguru import logger
 from pydantic import BaseModel, Field
 
 from src.security.encryption import HashChain
 
+# ハッシュチェーンの本文から除くフィールド
+_CHAIN_EXCLUDED_FIELDS: set[str] = {"hash", "previous_hash"}
+
 
 class AuditEntry(BaseModel):
     """監査証跡エントリ"""
@@ -23,9 +29,65 @@ class AuditEntry(BaseModel):
     resource_id: str
     details: dict[str, Any] = Field(default_factory=dict)
     confidence: float | None = None  # Agent判断時の信頼度
-    hash: str = ""  # ハッシュチェーン値
+    hash: str = ""  # ハッシュチェーン値（BLAKE2b-256 の16進文字列）
     previous_hash: str = ""  # 前エントリのハッシュ
 
+    def chain_payload(self) -> bytes:
+        """ハッシュチェーンに入力する本文（フィールド宣言順のJSON、ハッシュ値を除く）"""
+        return self.model_dump_json(exclude=_CHAIN_EXCLUDED_FIELDS).encode()
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass(slots=True)
+class AuditEntryRecord:
+    """監査証跡エントリ（記録時の軽量表現）
+
+    サービス内部で生成する値は検証不要のため、pydantic の検証を通さずに保持する。
+    API/DB 境界で to_model() により AuditEntry へ変換する。
+    """
+
+    tenant_id: UUID
+    action: str
+    resource_type: str
+    resource_id: str
+    user_id: UUID | None = None
+    agent_name: str | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+    confidence: float | None = None
+    id: UUID = field(default_factory=uuid4)
+    timestamp: datetime = field(default_factory=_utc_now)
+    hash: str = ""
+    previous_hash: str = ""
+
+    def __post_init__(self) -> None:
+        # AuditEntry は confidence を float へ変換するため、整数で渡されても同じ表現に揃える
+        if self.confidence is not None:
+            self.confidence = float(self.confidence)
+
+    def chain_payload(self) -> bytes:
+        """ハッシュチェーンに入力する本文（AuditEntry.chain_payload と同一のバイト列）
+
+        details の set や64bit超の整数なども pydantic と同じ表現になるよう、
+        model_dump_json と同じシリアライザ（pydantic_core）で変換する。
+        """
+        return pydantic_core.to_json({name: getattr(self, name) for name in _CHAIN_FIELDS}, inf_nan_mode="null")
+
+    def to_json(self) -> bytes:
+        """全フィールドをJSONバイト列に変換（AuditEntry.model_dump_json と同一の表現）"""
+        return pydantic_core.to_json({name: getattr(self, name) for name in _MODEL_FIELDS}, inf_nan_mode="null")
+
+    def to_model(self) -> AuditEntry:
+        """検証済みの AuditEntry モデルに変換"""
+        return AuditEntry.model_validate({f.name: getattr(self, f.name) for f in fields(self)})
+
+
+# 直列化時のフィールド順（AuditEntry の宣言順に合わせる）
+_MODEL_FIELDS = tuple(AuditEntry.model_fields)
+_CHAIN_FIELDS = tuple(name for name in AuditEntry.model_fields if name not in _CHAIN_EXCLUDED_FIELDS)
+
 
 class AuditTrailService:
     """監査証跡サービス — 全操作のAppend-Only記録
@@ -36,7 +98,7 @@ class AuditTrailService:
 
     def __init__(self) -> None:
         self._hash_chain = HashChain()
-        self._buffer: list[AuditEntry] = []
+        self._buffer: list[AuditEntryRecord] = []
 
     def record(
         self,
@@ -48,7 +110,7 @@ class AuditTrailService:
         agent_name: str | None = None,
         details: dict[str, Any] | None = None,
         confidence: float | None = None,
-    ) -> AuditEntry:
+    ) -> AuditEntryRecord:
         """操作を記録
 
         Args:
@@ -61,7 +123,7 @@ class AuditTrailService:
             details: 追加詳細情報
             confidence: Agent判断の信頼度（0.0-1.0）
         """
-        entry = AuditEntry(
+        entry = AuditEntryRecord(
             tenant_id=tenant_id,
             user_id=user_id,
             agent_name=agent_name,
@@ -73,8 +135,7 @@ class AuditTrailService:
         )
 
         # ハッシュチェーンに追加
-        entry_data = entry.model_dump(exclude={"hash", "previous_hash"})
-        entry.hash = self._hash_chain.add_entry(entry_data)
+        entry.hash = self._hash_chain.add_entry(entry.chain_payload())
 
         self._buffer.append(entry)
 
@@ -89,7 +150,23 @@ class AuditTrailService:
 
         return entry
 
-    def flush(self) -> list[AuditEntry]:
+    def record_batch(self, records: Sequence[Mapping[str, Any]]) -> list[AuditEntryRecord]:
+        """複数の操作をまとめて記録
+
+        各要素は record() のキーワード引数と同じキーを持つ。ハッシュチェーンへの
+        追加はまとめて行い、ログはバッチ単位で1件だけ出力する。
+        """
+        entries = [AuditEntryRecord(**{**record, "details": record.get("details") or {}}) for record in records]
+        hashes = self._hash_chain.add_entries([entry.chain_payload() for entry in entries])
+        for entry, entry_hash in zip(entries, hashes, strict=True):
+            entry.hash = entry_hash
+        self._buffer.extend(entries)
+
+        logger.info("監査証跡一括記録", count=len(entries))
+
+        return entries
+
+    def flush(self) -> list[AuditEntryRecord]:
         """バッファをフラッシュしてエントリ一覧を返す（DB永続化用）"""
         entries = self._buffer.copy()
         self._buffer.clear()
@@ -105,7 +182,7 @@ class AuditTrailService:
         resource_type: str,
         resource_id: str,
         input_data: dict[str, Any] | None = None,
-    ) -> AuditEntry:
+    ) -> AuditEntryRecord:
         """Agent判断を記録（根拠・信頼度を含む）"""
         return self.record(
             tenant_id=tenant_id,
@@ -1,8 +1,12 @@
 """JWT認証サービス — トークン発行・検証"""
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import bcrypt
 import jwt
@@ -11,6 +15,13 @@ from pydantic import BaseModel
 
 from src.config.settings import get_settings
 
+# bcrypt が扱う入力長の上限（超過分は切り捨て）
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# 検証済みトークンキャッシュ（件数上限・保持秒数）
+_TOKEN_CACHE_MAXSIZE = 10_000
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+
 
 class TokenPayload(BaseModel):
     """JWTトークンペイロード"""
@@ -38,19 +49,36 @@ class AuthService:
 
     def __init__(self) -> None:
         self._settings = get_settings()
+        # JWT設定はインスタンス生成時に一度だけ解決する
+        self._jwt_key = self._settings.jwt_secret_key.encode("utf-8")
+        self._jwt_algorithm = self._settings.jwt_algorithm
+        self._jwt_algorithms = [self._jwt_algorithm]
+        self._access_ttl = timedelta(minutes=self._settings.jwt_access_token_expire_minutes)
+        self._refresh_ttl = timedelta(days=self._settings.jwt_refresh_token_expire_days)
+        self._access_expires_in = int(self._access_ttl.total_seconds())
+        # トークンダイジェスト -> (キャッシュ失効時刻, ペイロード)。LRU順
+        self._token_cache: OrderedDict[bytes, tuple[float, TokenPayload]] = OrderedDict()
 
     def hash_password(self, password: str) -> str:
         """パスワードをbcryptハッシュ化"""
-        pw_bytes = password.encode("utf-8")[:72]
-        salt = bcrypt.gensalt()
+        pw_bytes = password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES]
+        salt = bcrypt.gensalt(rounds=self._settings.bcrypt_rounds)
         hashed = bcrypt.hashpw(pw_bytes, salt)
         return hashed.decode("utf-8")
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """パスワード検証"""
-        pw_bytes = plain_password.encode("utf-8")[:72]
+        pw_bytes = plain_password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES]
         return bcrypt.checkpw(pw_bytes, hashed_password.encode("utf-8"))
 
+    async def hash_password_async(self, password: str) -> str:
+        """hash_password の非同期版（bcrypt はGILを解放するためワーカースレッドで実行）"""
+        return await asyncio.to_thread(self.hash_password, password)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """verify_password の非同期版（イベントループをブロックしない）"""
+        return await asyncio.to_thread(self.verify_password, plain_password, hashed_password)
+
     def create_token_pair(
         self,
         user_id: UUID,
@@ -58,8 +86,6 @@ class AuthService:
         role: str,
     ) -> TokenPair:
         """アクセス + リフレッシュトークンペアを発行"""
-        import uuid
-
         now = datetime.now(UTC)
 
         # アクセストークン
@@ -67,15 +93,15 @@ class AuthService:
             "sub": str(user_id),
             "tenant_id": str(tenant_id),
             "role": role,
-            "exp": now + timedelta(minutes=self._settings.jwt_access_token_expire_minutes),
+            "exp": now + self._access_ttl,
             "iat": now,
-            "jti": str(uuid.uuid4()),
+            "jti": str(uuid4()),
             "token_type": "access",
         }
         access_token = jwt.encode(
             access_payload,
-            self._settings.jwt_secret_key,
-            algorithm=self._settings.jwt_algorithm,
+            self._jwt_key,
+            algorithm=self._jwt_algorithm,
         )
 
         # リフレッシュトークン
@@ -83,15 +109,15 @@ class AuthService:
             "sub": str(user_id),
             "tenant_id": str(tenant_id),
             "role": role,
-            "exp": now + timedelta(days=self._settings.jwt_refresh_token_expire_days),
+            "exp": now + self._refresh_ttl,
             "iat": now,
-            "jti": str(uuid.uuid4()),
+            "jti": str(uuid4()),
             "token_type": "refresh",
         }
         refresh_token = jwt.encode(
             refresh_payload,
-            self._settings.jwt_secret_key,
-            algorithm=self._settings.jwt_algorithm,
+            self._jwt_key,
+            algorithm=self._jwt_algorithm,
         )
 
         logger.info(
@@ -104,7 +130,7 @@ class AuthService:
         return TokenPair(
             access_token=access_token,
             refresh_token=refresh_token,
-            expires_in=self._settings.jwt_access_token_expire_minutes * 60,
+            expires_in=self._access_expires_in,
         )
 
     def verify_token(self, token: str, expected_type: str = "access") -> TokenPayload:
@@ -115,15 +141,29 @@ class AuthService:
             jwt.InvalidTokenError: 不正なトークン
             ValueError: トークンタイプ不一致
         """
+        key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+        cached = self._token_cache.get(key)
+        if cached is not None and cached[0] > time.time():
+            self._token_cache.move_to_end(key)
+            token_payload = cached[1]
+        else:
+            if cached is not None:
+                del self._token_cache[key]
+            token_payload = self._decode_token(token)
+            self._cache_token(key, token_payload)
+
+        if token_payload.token_type != expected_type:
+            raise ValueError(f"Expected token type '{expected_type}', got '{token_payload.token_type}'")
+
+        return token_payload
+
+    def _decode_token(self, token: str) -> TokenPayload:
+        """JWTを署名検証してデコード"""
         payload: dict[str, Any] = jwt.decode(
             token,
-            self._settings.jwt_secret_key,
-            algorithms=[self._settings.jwt_algorithm],
+            self._jwt_key,
+            algorithms=self._jwt_algorithms,
         )
-
-        if payload.get("token_type") != expected_type:
-            raise ValueError(f"Expected token type '{expected_type}', got '{payload.get('token_type')}'")
-
         return TokenPayload(
             sub=payload["sub"],
             tenant_id=payload["tenant_id"],
@@ -131,9 +171,16 @@ class AuthService:
             exp=datetime.fromtimestamp(payload["exp"], tz=UTC),
             iat=datetime.fromtimestamp(payload["iat"], tz=UTC),
             jti=payload["jti"],
-            token_type=payload["token_type"],
+            token_type=payload.get("token_type", ""),
         )
 
+    def _cache_token(self, key: bytes, token_payload: TokenPayload) -> None:
+        """検証済みペイロードをキャッシュ（トークン有効期限を超えて保持しない）"""
+        deadline = min(time.time() + _TOKEN_CACHE_TTL_SECONDS, token_payload.exp.timestamp())
+        self._token_cache[key] = (deadline, token_payload)
+        if len(self._token_cache) > _TOKEN_CACHE_MAXSIZE:
+            self._token_cache.popitem(last=False)
+
 
 def verify_token(token: str) -> dict[str, Any]:
     """トークン検証ヘルパー（モジュールレベル）"""
@@ -4,6 +4,7 @@
 準拠状況を評価するチェッカー。リージョン設定に基づき適用フレームワークを選定。
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -34,9 +35,9 @@ class ComplianceStatus(StrEnum):
     NOT_ASSESSED = "not_assessed"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComplianceFinding:
-    """コンプライアンス所見"""
+    """コンプライアンス所見（不変のため定型所見は共有インスタンスを使う）"""
 
     control_id: str
     description: str
@@ -78,6 +79,222 @@ REGION_FRAMEWORKS: dict[str, list[ComplianceFramework]] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _ControlCheck:
+    """定型チェック項目（keys がすべて真なら充足、未充足なら減点して所見化）"""
+
+    keys: tuple[str, ...]
+    deduction: float
+    control_id: str
+    description: str
+    severity: str
+    recommendation: str
+    finding: ComplianceFinding = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "finding", ComplianceFinding(self.control_id, self.description, self.severity, self.recommendation)
+        )
+
+
+def _evaluate_checks(checks: tuple[_ControlCheck, ...], data: dict[str, Any]) -> tuple[float, list[ComplianceFinding]]:
+    """未充足のチェック項目を抽出し、減点後スコアと所見一覧を返す"""
+    get = data.get
+    score = 100.0
+    findings: list[ComplianceFinding] = []
+    for c in checks:
+        if not all(map(get, c.keys)):
+            score -= c.deduction
+            findings.append(c.finding)
+    return score, findings
+
+
+_SOC2_CHECKS = (
+    # CC6.1: 論理・物理アクセス制御
+    _ControlCheck(
+        ("access_control_enabled",),
+        20.0,
+        "CC6.1",
+        "論理的アクセス制御が未設定です",
+        "high",
+        "RBACの有効化と定期的な権限レビューを実施してください",
+    ),
+    # CC7.2: システム監視
+    _ControlCheck(
+        ("monitoring_enabled",),
+        10.0,
+        "CC7.2",
+        "システム監視が未有効化です",
+        "medium",
+        "監視ダッシュボードとアラートの設定を推奨します",
+    ),
+    # CC8.1: 変更管理
+    _ControlCheck(
+        ("change_management_enabled",),
+        10.0,
+        "CC8.1",
+        "変更管理プロセスが未文書化です",
+        "medium",
+        "変更管理手順書の作成と承認フローの導入を推奨します",
+    ),
+    # CC6.3: 暗号化
+    _ControlCheck(
+        ("encryption_at_rest",),
+        15.0,
+        "CC6.3",
+        "保存データの暗号化が未実施です",
+        "high",
+        "AES-256による保存データ暗号化を実施してください",
+    ),
+    # CC7.3: 監査ログ
+    _ControlCheck(
+        ("audit_trail_enabled",),
+        20.0,
+        "CC7.3",
+        "監査証跡が未有効化です",
+        "high",
+        "全操作の監査ログ記録を有効化してください",
+    ),
+)
+
+_ISO27001_CHECKS = (
+    # A.9: アクセス制御
+    _ControlCheck(
+        ("access_control_enabled",),
+        15.0,
+        "A.9.1",
+        "アクセス制御ポリシーが未策定です",
+        "high",
+        "アクセス制御ポリシーの策定と実装を推奨します",
+    ),
+    # A.10: 暗号化
+    _ControlCheck(
+        ("encryption_at_rest", "encryption_in_transit"),
+        15.0,
+        "A.10.1",
+        "暗号化対策が不完全です",
+        "high",
+        "保存時・転送時両方の暗号化を実施してください",
+    ),
+    # A.12: 運用セキュリティ
+    _ControlCheck(
+        ("monitoring_enabled",),
+        10.0,
+        "A.12.4",
+        "イベントログ・監視が不十分です",
+        "medium",
+        "ログ管理と監視体制の強化を推奨します",
+    ),
+)
+
+_GDPR_CHECKS = (
+    # Art.30: 処理活動記録
+    _ControlCheck(
+        ("processing_records",),
+        20.0,
+        "Art.30",
+        "データ処理活動の記録が不十分です",
+        "high",
+        "全データ処理活動の記録を作成・維持してください",
+    ),
+    # Art.32: セキュリティ措置
+    _ControlCheck(
+        ("encryption_at_rest",),
+        15.0,
+        "Art.32",
+        "個人データの暗号化措置が不十分です",
+        "high",
+        "個人データの暗号化・仮名化を実施してください",
+    ),
+    # Art.35: DPIA
+    _ControlCheck(
+        ("dpia_completed",),
+        10.0,
+        "Art.35",
+        "データ保護影響評価（DPIA）が未実施です",
+        "medium",
+        "高リスク処理についてDPIAを実施してください",
+    ),
+    # Art.17: 削除権
+    _ControlCheck(
+        ("data_deletion_capability",),
+        10.0,
+        "Art.17",
+        "データ削除権への対応が未実装です",
+        "medium",
+        "データ主体からの削除要求に対応するプロセスを構築してください",
+    ),
+)
+
+_PDPA_CHECKS = (
+    # 同意取得
+    _ControlCheck(
+        ("consent_management",),
+        20.0,
+        "PDPA-S13",
+        "個人データ収集時の同意管理が不十分です",
+        "high",
+        "同意管理フレームワークの導入を推奨します",
+    ),
+    # データ保護ポリシー
+    _ControlCheck(
+        ("data_protection_policy",),
+        15.0,
+        "PDPA-S24",
+        "データ保護ポリシーが未策定です",
+        "medium",
+        "組織のデータ保護ポリシーを策定・公開してください",
+    ),
+    # データ侵害通知
+    _ControlCheck(
+        ("breach_notification_process",),
+        15.0,
+        "PDPA-S26D",
+        "データ侵害通知プロセスが未整備です",
+        "high",
+        "PDPC/当事者への通知プロセスを構築してください",
+    ),
+)
+
+_PIPL_CHECKS = (
+    # データローカライゼーション
+    _ControlCheck(
+        ("data_localization",),
+        25.0,
+        "PIPL-Art.40",
+        "中国国内のデータローカライゼーション要件を満たしていません",
+        "high",
+        "中国国内でのデータ保管・処理体制を構築してください",
+    ),
+    # 越境データ移転
+    _ControlCheck(
+        ("cross_border_assessment",),
+        20.0,
+        "PIPL-Art.38",
+        "越境データ移転のセキュリティ評価が未実施です",
+        "high",
+        "CACによるセキュリティ評価または標準契約の締結を実施してください",
+    ),
+    # 個人情報保護責任者
+    _ControlCheck(
+        ("dpo_appointed",),
+        10.0,
+        "PIPL-Art.52",
+        "個人情報保護責任者が未任命です",
+        "medium",
+        "個人情報保護責任者の任命と連絡先の公開を推奨します",
+    ),
+)
+
+# A.18.1: データ居住地（リージョン設定に依存するため表とは別に判定）
+_DATA_RESIDENCY_FINDING = ComplianceFinding(
+    control_id="A.18.1",
+    description="データ居住地要件を満たしていない可能性があります",
+    severity="high",
+    recommendation="データ保管場所がリージョン要件を満たしているか確認してください",
+)
+
+
 class ComplianceChecker:
     """コンプライアンスチェッカー
 
@@ -88,310 +305,49 @@ class ComplianceChecker:
         """リージョンに適用されるフレームワーク一覧"""
         return REGION_FRAMEWORKS.get(region.upper(), [ComplianceFramework.SOC2])
 
-    def check_soc2(self, audit_data: dict[str, Any] | None = None) -> ComplianceCheckResult:
+    def check_soc2(
+        self, audit_data: dict[str, Any] | None = None, checked_at: str | None = None
+    ) -> ComplianceCheckResult:
         """SOC2 (Trust Service Criteria) チェック"""
-        data = audit_data or {}
-        findings: list[ComplianceFinding] = []
-        score = 100.0
-
-        # CC6.1: 論理・物理アクセス制御
-        if not data.get("access_control_enabled"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="CC6.1",
-                    description="論理的アクセス制御が未設定です",
-                    severity="high",
-                    recommendation="RBACの有効化と定期的な権限レビューを実施してください",
-                )
-            )
-            score -= 20.0
-
-        # CC7.2: システム監視
-        if not data.get("monitoring_enabled"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="CC7.2",
-                    description="システム監視が未有効化です",
-                    severity="medium",
-                    recommendation="監視ダッシュボードとアラートの設定を推奨します",
-                )
-            )
-            score -= 10.0
-
-        # CC8.1: 変更管理
-        if not data.get("change_management_enabled"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="CC8.1",
-                    description="変更管理プロセスが未文書化です",
-                    severity="medium",
-                    recommendation="変更管理手順書の作成と承認フローの導入を推奨します",
-                )
-            )
-            score -= 10.0
-
-        # CC6.3: 暗号化
-        if not data.get("encryption_at_rest"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="CC6.3",
-                    description="保存データの暗号化が未実施です",
-                    severity="high",
-                    recommendation="AES-256による保存データ暗号化を実施してください",
-                )
-            )
-            score -= 15.0
-
-        # CC7.3: 監査ログ
-        if not data.get("audit_trail_enabled"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="CC7.3",
-                    description="監査証跡が未有効化です",
-                    severity="high",
-                    recommendation="全操作の監査ログ記録を有効化してください",
-                )
-            )
-            score -= 20.0
-
-        status = self._score_to_status(score)
-        return ComplianceCheckResult(
-            framework="SOC2",
-            status=status,
-            score=max(0.0, score),
-            findings=findings,
-            checked_at=datetime.now(tz=UTC).isoformat(),
-        )
+        score, findings = _evaluate_checks(_SOC2_CHECKS, audit_data or {})
+        return self._build_result("SOC2", score, findings, checked_at)
 
-    def check_iso27001(self, audit_data: dict[str, Any] | None = None) -> ComplianceCheckResult:
+    def check_iso27001(
+        self, audit_data: dict[str, Any] | None = None, checked_at: str | None = None
+    ) -> ComplianceCheckResult:
         """ISO 27001 (ISMS) チェック"""
         data = audit_data or {}
-        findings: list[ComplianceFinding] = []
-        score = 100.0
-
-        # A.9: アクセス制御
-        if not data.get("access_control_enabled"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="A.9.1",
-                    description="アクセス制御ポリシーが未策定です",
-                    severity="high",
-                    recommendation="アクセス制御ポリシーの策定と実装を推奨します",
-                )
-            )
-            score -= 15.0
-
-        # A.10: 暗号化
-        if not data.get("encryption_at_rest") or not data.get("encryption_in_transit"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="A.10.1",
-                    description="暗号化対策が不完全です",
-                    severity="high",
-                    recommendation="保存時・転送時両方の暗号化を実施してください",
-                )
-            )
-            score -= 15.0
-
-        # A.12: 運用セキュリティ
-        if not data.get("monitoring_enabled"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="A.12.4",
-                    description="イベントログ・監視が不十分です",
-                    severity="medium",
-                    recommendation="ログ管理と監視体制の強化を推奨します",
-                )
-            )
-            score -= 10.0
-
-        # A.18: コンプライアンス
+        score, findings = _evaluate_checks(_ISO27001_CHECKS, data)
+
+        # A.18: コンプライアンス（データ居住地要件のあるリージョンのみ）
         if not data.get("data_residency_compliance"):
             region_config = REGION_CONFIGS.get(data.get("region", "JP"))
             if region_config and region_config.data_residency_required:
-                findings.append(
-                    ComplianceFinding(
-                        control_id="A.18.1",
-                        description="データ居住地要件を満たしていない可能性があります",
-                        severity="high",
-                        recommendation="データ保管場所がリージョン要件を満たしているか確認してください",
-                    )
-                )
+                findings.append(_DATA_RESIDENCY_FINDING)
                 score -= 15.0
 
-        status = self._score_to_status(score)
-        return ComplianceCheckResult(
-            framework="ISO27001",
-            status=status,
-            score=max(0.0, score),
-            findings=findings,
-            checked_at=datetime.now(tz=UTC).isoformat(),
-        )
+        return self._build_result("ISO27001", score, findings, checked_at)
 
-    def check_gdpr(self, audit_data: dict[str, Any] | None = None) -> ComplianceCheckResult:
+    def check_gdpr(
+        self, audit_data: dict[str, Any] | None = None, checked_at: str | None = None
+    ) -> ComplianceCheckResult:
         """GDPR (EU一般データ保護規則) チェック"""
-        data = audit_data or {}
-        findings: list[ComplianceFinding] = []
-        score = 100.0
-
-        # Art.30: 処理活動記録
-        if not data.get("processing_records"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="Art.30",
-                    description="データ処理活動の記録が不十分です",
-                    severity="high",
-                    recommendation="全データ処理活動の記録を作成・維持してください",
-                )
-            )
-            score -= 20.0
-
-        # Art.32: セキュリティ措置
-        if not data.get("encryption_at_rest"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="Art.32",
-                    description="個人データの暗号化措置が不十分です",
-                    severity="high",
-                    recommendation="個人データの暗号化・仮名化を実施してください",
-                )
-            )
-            score -= 15.0
-
-        # Art.35: DPIA
-        if not data.get("dpia_completed"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="Art.35",
-                    description="データ保護影響評価（DPIA）が未実施です",
-                    severity="medium",
-                    recommendation="高リスク処理についてDPIAを実施してください",
-                )
-            )
-            score -= 10.0
-
-        # Art.17: 削除権
-        if not data.get("data_deletion_capability"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="Art.17",
-                    description="データ削除権への対応が未実装です",
-                    severity="medium",
-                    recommendation="データ主体からの削除要求に対応するプロセスを構築してください",
-                )
-            )
-            score -= 10.0
-
-        status = self._score_to_status(score)
-        return ComplianceCheckResult(
-            framework="GDPR",
-            status=status,
-            score=max(0.0, score),
-            findings=findings,
-            checked_at=datetime.now(tz=UTC).isoformat(),
-        )
+        score, findings = _evaluate_checks(_GDPR_CHECKS, audit_data or {})
+        return self._build_result("GDPR", score, findings, checked_at)
 
-    def check_pdpa(self, audit_data: dict[str, Any] | None = None) -> ComplianceCheckResult:
+    def check_pdpa(
+        self, audit_data: dict[str, Any] | None = None, checked_at: str | None = None
+    ) -> ComplianceCheckResult:
         """PDPA (シンガポール個人データ保護法) チェック"""
-        data = audit_data or {}
-        findings: list[ComplianceFinding] = []
-        score = 100.0
-
-        # 同意取得
-        if not data.get("consent_management"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="PDPA-S13",
-                    description="個人データ収集時の同意管理が不十分です",
-                    severity="high",
-                    recommendation="同意管理フレームワークの導入を推奨します",
-                )
-            )
-            score -= 20.0
-
-        # データ保護ポリシー
-        if not data.get("data_protection_policy"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="PDPA-S24",
-                    description="データ保護ポリシーが未策定です",
-                    severity="medium",
-                    recommendation="組織のデータ保護ポリシーを策定・公開してください",
-                )
-            )
-            score -= 15.0
-
-        # データ侵害通知
-        if not data.get("breach_notification_process"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="PDPA-S26D",
-                    description="データ侵害通知プロセスが未整備です",
-                    severity="high",
-                    recommendation="PDPC/当事者への通知プロセスを構築してください",
-                )
-            )
-            score -= 15.0
-
-        status = self._score_to_status(score)
-        return ComplianceCheckResult(
-            framework="PDPA",
-            status=status,
-            score=max(0.0, score),
-            findings=findings,
-            checked_at=datetime.now(tz=UTC).isoformat(),
-        )
+        score, findings = _evaluate_checks(_PDPA_CHECKS, audit_data or {})
+        return self._build_result("PDPA", score, findings, checked_at)
 
-    def check_pipl(self, audit_data: dict[str, Any] | None = None) -> ComplianceCheckResult:
+    def check_pipl(
+        self, audit_data: dict[str, Any] | None = None, checked_at: str | None = None
+    ) -> ComplianceCheckResult:
         """PIPL (中国個人情報保護法) チェック"""
-        data = audit_data or {}
-        findings: list[ComplianceFinding] = []
-        score = 100.0
-
-        # データローカライゼーション
-        if not data.get("data_localization"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="PIPL-Art.40",
-                    description="中国国内のデータローカライゼーション要件を満たしていません",
-                    severity="high",
-                    recommendation="中国国内でのデータ保管・処理体制を構築してください",
-                )
-            )
-            score -= 25.0
-
-        # 越境データ移転
-        if not data.get("cross_border_assessment"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="PIPL-Art.38",
-                    description="越境データ移転のセキュリティ評価が未実施です",
-                    severity="high",
-                    recommendation="CACによるセキュリティ評価または標準契約の締結を実施してください",
-                )
-            )
-            score -= 20.0
-
-        # 個人情報保護責任者
-        if not data.get("dpo_appointed"):
-            findings.append(
-                ComplianceFinding(
-                    control_id="PIPL-Art.52",
-                    description="個人情報保護責任者が未任命です",
-                    severity="medium",
-                    recommendation="個人情報保護責任者の任命と連絡先の公開を推奨します",
-                )
-            )
-            score -= 10.0
-
-        status = self._score_to_status(score)
-        return ComplianceCheckResult(
-            framework="PIPL",
-            status=status,
-            score=max(0.0, score),
-            findings=findings,
-            checked_at=datetime.now(tz=UTC).isoformat(),
-        )
+        score, findings = _evaluate_checks(_PIPL_CHECKS, audit_data or {})
+        return self._build_result("PIPL", score, findings, checked_at)
 
     def check_all_frameworks(
         self,
@@ -399,29 +355,30 @@ class ComplianceChecker:
         audit_data: dict[str, Any] | None = None,
     ) -> list[ComplianceCheckResult]:
         """リージョンに適用される全フレームワークをチェック"""
-        frameworks = self.get_applicable_frameworks(region)
+        checkers = _REGION_CHECKERS.get(region.upper(), _DEFAULT_CHECKERS)
+        # 1回の呼び出しの結果は同じチェック時刻を共有する
+        checked_at = datetime.now(tz=UTC).isoformat()
         results: list[ComplianceCheckResult] = []
-
-        checker_map = {
-            ComplianceFramework.SOC2: self.check_soc2,
-            ComplianceFramework.ISO27001: self.check_iso27001,
-            ComplianceFramework.GDPR: self.check_gdpr,
-            ComplianceFramework.PDPA: self.check_pdpa,
-            ComplianceFramework.PIPL: self.check_pipl,
-            ComplianceFramework.JSOX: self.check_soc2,  # J-SOXはSOC2ベースで代替
-        }
-
-        for fw in frameworks:
-            checker = checker_map.get(fw)
-            if checker:
-                result = checker(audit_data)
-                if fw == ComplianceFramework.JSOX:
-                    result.framework = "J-SOX"
-                results.append(result)
-                logger.info("コンプライアンスチェック完了: {} = {} ({:.1f})", fw, result.status, result.score)
+        for label, checker in checkers:
+            result = checker(self, audit_data, checked_at)
+            result.framework = label
+            results.append(result)
+            logger.info("コンプライアンスチェック完了: {} = {} ({:.1f})", label, result.status, result.score)
 
         return results
 
+    def _build_result(
+        self, framework: str, score: float, findings: list[ComplianceFinding], checked_at: str | None = None
+    ) -> ComplianceCheckResult:
+        """減点後スコアからチェック結果を構築（checked_at 省略時は現在時刻）"""
+        return ComplianceCheckResult(
+            framework=framework,
+            status=self._score_to_status(score),
+            score=max(0.0, score),
+            findings=findings,
+            checked_at=checked_at or datetime.now(tz=UTC).isoformat(),
+        )
+
     @staticmethod
     def _score_to_status(score: float) -> ComplianceStatus:
         """スコアからステータスを判定"""
@@ -430,3 +387,26 @@ class ComplianceChecker:
         if score >= 50:
             return ComplianceStatus.PARTIAL
         return ComplianceStatus.NON_COMPLIANT
+
+
+# フレームワーク → チェック関数（J-SOXはSOC2ベースで代替）
+_FRAMEWORK_CHECKERS: dict[ComplianceFramework, Callable[..., ComplianceCheckResult]] = {
+    ComplianceFramework.SOC2: ComplianceChecker.check_soc2,
+    ComplianceFramework.ISO27001: ComplianceChecker.check_iso27001,
+    ComplianceFramework.GDPR: ComplianceChecker.check_gdpr,
+    ComplianceFramework.PDPA: ComplianceChecker.check_pdpa,
+    ComplianceFramework.PIPL: ComplianceChecker.check_pipl,
+    ComplianceFramework.JSOX: ComplianceChecker.check_soc2,
+}
+
+
+def _build_checkers(
+    frameworks: list[ComplianceFramework],
+) -> tuple[tuple[str, Callable[..., ComplianceCheckResult]], ...]:
+    """フレームワーク一覧を (表示名, チェック関数) のタプルに変換"""
+    return tuple((fw.value, _FRAMEWORK_CHECKERS[fw]) for fw in frameworks if fw in _FRAMEWORK_CHECKERS)
+
+
+# リージョン → (表示名, チェック関数) の並び（モジュール読込時に確定）
+_REGION_CHECKERS = {region: _build_checkers(frameworks) for region, frameworks in REGION_FRAMEWORKS.items()}
+_DEFAULT_CHECKERS = _build_checkers([ComplianceFramework.SOC2])
@@ -1,15 +1,40 @@
-"""暗号化ユーティリティ — AES-256-GCM + Fernet"""
+"""暗号化ユーティリティ — AES-256-GCM（旧形式 Fernet の復号に対応）"""
 
 import base64
 import hashlib
 import os
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+from itertools import chain
 from typing import Any
 
+import orjson
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from loguru import logger
 
 from src.config.settings import get_settings
 
+# AES-256-GCM 暗号文の形式: バージョン(1) + ノンス(12) + 暗号文 + タグ(16)
+_GCM_VERSION = b"\x01"
+_GCM_NONCE_BYTES = 12
+_GCM_HEADER_BYTES = len(_GCM_VERSION) + _GCM_NONCE_BYTES
+# encrypt_and_hash でハッシュ・暗号化を交互に適用する単位（キャッシュに収まる大きさ）
+_FUSED_CHUNK_BYTES = 1 << 20
+# 旧形式の Fernet トークン（先頭バイト 0x80）の Base64 表現の先頭文字
+_FERNET_TOKEN_PREFIX = "g"  # noqa: S105
+
+# ハッシュチェーン先頭エントリの直前ハッシュ
+_GENESIS_DIGEST = bytes(32)
+
+# 出力長を指定するアルゴリズム（チェーン値は既定の SHA-256 と同じ 32 バイト）
+_CHAIN_HASHERS: dict[str, Callable[[bytes], Any]] = {
+    "blake2b": partial(hashlib.blake2b, digest_size=32),
+}
+
 
 class EncryptionService:
     """データ暗号化・復号サービス"""
@@ -20,7 +45,11 @@ class EncryptionService:
         if not encryption_key:
             logger.warning("暗号化キー未設定 — 自動生成キーを使用（開発環境のみ）")
             encryption_key = Fernet.generate_key().decode()
-        self._fernet = Fernet(self._ensure_valid_key(encryption_key))
+        fernet_key = self._ensure_valid_key(encryption_key)
+        # 旧形式（Fernet）の暗号文は復号のみ対応
+        self._fernet = Fernet(fernet_key)
+        self._aead_key = self._derive_aead_key(fernet_key)
+        self._aead = AESGCM(self._aead_key)
 
     @staticmethod
     def _ensure_valid_key(key: str) -> bytes:
@@ -32,21 +61,50 @@ class EncryptionService:
         derived = hashlib.sha256(key.encode()).digest()
         return base64.urlsafe_b64encode(derived)
 
+    @staticmethod
+    def _derive_aead_key(fernet_key: bytes) -> bytes:
+        """FernetキーからAES-256-GCM用の鍵を派生（Fernetと鍵素材を共用しない）"""
+        hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"audit-agent:aes-256-gcm")
+        return hkdf.derive(base64.urlsafe_b64decode(fernet_key))
+
     def encrypt(self, plaintext: str) -> str:
         """文字列を暗号化してBase64文字列を返す"""
-        return self._fernet.encrypt(plaintext.encode()).decode()
+        return base64.urlsafe_b64encode(self.encrypt_bytes(plaintext.encode())).decode()
 
     def decrypt(self, ciphertext: str) -> str:
         """暗号化文字列を復号"""
-        return self._fernet.decrypt(ciphertext.encode()).decode()
+        if ciphertext.startswith(_FERNET_TOKEN_PREFIX):
+            return self._fernet.decrypt(ciphertext.encode()).decode()
+        return self.decrypt_bytes(base64.urlsafe_b64decode(ciphertext)).decode()
 
     def encrypt_bytes(self, data: bytes) -> bytes:
-        """バイト列を暗号化"""
-        return self._fernet.encrypt(data)
+        """バイト列をAES-256-GCMで暗号化"""
+        nonce = os.urandom(_GCM_NONCE_BYTES)
+        return _GCM_VERSION + nonce + self._aead.encrypt(nonce, data, None)
+
+    def encrypt_and_hash(self, data: bytes) -> tuple[bytes, str]:
+        """平文のSHA-256と暗号文を1パスで計算（encrypt_bytes と同じ形式の暗号文を返す）
+
+        チャンクごとにハッシュ更新と暗号化を続けて行い、キャッシュに載ったまま両方を処理する。
+        """
+        nonce = os.urandom(_GCM_NONCE_BYTES)
+        encryptor = Cipher(algorithms.AES(self._aead_key), modes.GCM(nonce)).encryptor()
+        hasher = hashlib.sha256()
+        view = memoryview(data)
+        parts = [_GCM_VERSION, nonce]
+        for start in range(0, len(view), _FUSED_CHUNK_BYTES):
+            chunk = view[start : start + _FUSED_CHUNK_BYTES]
+            hasher.update(chunk)
+            parts.append(encryptor.update(chunk))
+        parts.append(encryptor.finalize())
+        parts.append(encryptor.tag)
+        return b"".join(parts), hasher.hexdigest()
 
     def decrypt_bytes(self, data: bytes) -> bytes:
-        """バイト列を復号"""
-        return self._fernet.decrypt(data)
+        """バイト列を復号（旧形式のFernetトークンも受け付ける）"""
+        if data[:1] != _GCM_VERSION:
+            return self._fernet.decrypt(data)
+        return self._aead.decrypt(data[1:_GCM_HEADER_BYTES], data[_GCM_HEADER_BYTES:], None)
 
     @staticmethod
     def generate_key() -> str:
@@ -70,37 +128,64 @@ class HashChain:
     """ハッシュチェーン — 監査証跡の改ざん防止
 
     各エントリのハッシュに前エントリのハッシュを含めることで、
-    途中の改ざんを検出可能にする。
+    途中の改ざんを検出可能にする。既定は BLAKE2b-256（algorithm で変更可）。
     """
 
-    def __init__(self, algorithm: str = "sha256") -> None:
+    def __init__(self, algorithm: str = "blake2b") -> None:
         self._algorithm = algorithm
-        self._previous_hash = "0" * 64  # genesis
-
-    def add_entry(self, data: dict[str, Any]) -> str:
-        """新しいエントリをチェーンに追加してハッシュを返す"""
-        import json
-
-        entry_str = json.dumps(data, sort_keys=True, default=str)
-        combined = f"{self._previous_hash}:{entry_str}"
-        new_hash = hashlib.new(self._algorithm, combined.encode()).hexdigest()
-        self._previous_hash = new_hash
-        return new_hash
-
-    def verify_chain(self, entries: list[dict[str, Any]], hashes: list[str]) -> bool:
-        """チェーン全体の整合性を検証"""
-        import json
-
+        # hashlib.sha256 等の専用コンストラクタを直接使う（hashlib.new の名前解決を省く）
+        if algorithm in _CHAIN_HASHERS:
+            self._hasher: Callable[[bytes], Any] = _CHAIN_HASHERS[algorithm]
+        elif algorithm in hashlib.algorithms_guaranteed:
+            self._hasher = getattr(hashlib, algorithm)
+        else:
+            self._hasher = partial(hashlib.new, algorithm)
+        # 直前ハッシュは生のダイジェストで保持し、16進文字列は戻り値でのみ使う
+        self._previous_digest = _GENESIS_DIGEST
+
+    def _link(self, previous_digest: bytes, data: dict[str, Any] | bytes) -> bytes:
+        """直前ダイジェストとエントリ本文からリンクのダイジェストを計算
+
+        bytes はシリアライズ済みの本文としてそのまま使う。
+        dict はキー順を揃えたJSON（orjson）に変換する。
+        """
+        body = data if isinstance(data, bytes) else orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS)
+        digest: bytes = self._hasher(previous_digest + b":" + body).digest()
+        return digest
+
+    def add_entry(self, data: dict[str, Any] | bytes) -> str:
+        """新しいエントリをチェーンに追加してハッシュ（16進文字列）を返す"""
+        digest = self._link(self._previous_digest, data)
+        self._previous_digest = digest
+        return digest.hex()
+
+    def add_entries(self, entries: Iterable[dict[str, Any] | bytes]) -> list[str]:
+        """複数エントリを順にチェーンへ追加してハッシュ一覧を返す"""
+        link = self._link
+        digest = self._previous_digest
+        hashes: list[str] = []
+        for data in entries:
+            digest = link(digest, data)
+            hashes.append(digest.hex())
+        self._previous_digest = digest
+        return hashes
+
+    def verify_chain(self, entries: Sequence[dict[str, Any] | bytes], hashes: list[str]) -> bool:
+        """チェーン全体の整合性を検証
+
+        各リンクは記録済みの直前ハッシュから独立に再計算できるため、
+        全リンクが一致すれば逐次に畳み込んだ結果と同じになる。
+        """
         if len(entries) != len(hashes):
             return False
 
-        prev_hash = "0" * 64
-        for entry, expected_hash in zip(entries, hashes, strict=False):
-            entry_str = json.dumps(entry, sort_keys=True, default=str)
-            combined = f"{prev_hash}:{entry_str}"
-            computed_hash = hashlib.new(self._algorithm, combined.encode()).hexdigest()
-            if computed_hash != expected_hash:
-                return False
-            prev_hash = computed_hash
+        try:
+            expected_digests = [bytes.fromhex(h) for h in hashes]
+        except ValueError:
+            return False
 
-        return True
+        previous_digests = chain((_GENESIS_DIGEST,), expected_digests)
+        return all(
+            self._link(prev_digest, entry) == expected
+            for prev_digest, entry, expected in zip(previous_digests, entries, expected_digests, strict=False)
+        )
@@ -1,6 +1,8 @@
 """ロールベースアクセス制御（RBAC）"""
 
 from dataclasses import dataclass
+from functools import reduce
+from operator import or_
 
 from src.config.constants import UserRole
 
@@ -51,55 +53,74 @@ PERMISSIONS = {
 }
 
 # ── ロール別権限マッピング ────────────────────────────
-ROLE_PERMISSIONS: dict[UserRole, set[str]] = {
-    UserRole.ADMIN: set(PERMISSIONS.keys()),
-    UserRole.AUDITOR: {
-        "project:read",
-        "project:create",
-        "project:update",
-        "agent:execute",
-        "agent:configure",
-        "agent:approve",
-        "dialogue:read",
-        "dialogue:send",
-        "dialogue:approve",
-        "evidence:read",
-        "evidence:download",
-        "report:read",
-        "report:create",
-        "report:approve",
-    },
-    UserRole.AUDITEE_MANAGER: {
-        "project:read",
-        "dialogue:read",
-        "dialogue:send",
-        "dialogue:approve",
-        "evidence:read",
-        "evidence:upload",
-        "evidence:download",
-        "agent:execute",
-    },
-    UserRole.AUDITEE_USER: {
-        "project:read",
-        "dialogue:read",
-        "dialogue:send",
-        "evidence:read",
-        "evidence:upload",
-    },
-    UserRole.VIEWER: {
-        "project:read",
-        "dialogue:read",
-        "evidence:read",
-        "report:read",
-    },
-    UserRole.EXECUTIVE: {
-        "project:read",
-        "report:read",
-        "analytics:read",
-        "analytics:benchmark",
-        "analytics:portfolio",
-        "analytics:export",
-    },
+ROLE_PERMISSIONS: dict[UserRole, frozenset[str]] = {
+    UserRole.ADMIN: frozenset(PERMISSIONS),
+    UserRole.AUDITOR: frozenset(
+        {
+            "project:read",
+            "project:create",
+            "project:update",
+            "agent:execute",
+            "agent:configure",
+            "agent:approve",
+            "dialogue:read",
+            "dialogue:send",
+            "dialogue:approve",
+            "evidence:read",
+            "evidence:download",
+            "report:read",
+            "report:create",
+            "report:approve",
+        }
+    ),
+    UserRole.AUDITEE_MANAGER: frozenset(
+        {
+            "project:read",
+            "dialogue:read",
+            "dialogue:send",
+            "dialogue:approve",
+            "evidence:read",
+            "evidence:upload",
+            "evidence:download",
+            "agent:execute",
+        }
+    ),
+    UserRole.AUDITEE_USER: frozenset(
+        {
+            "project:read",
+            "dialogue:read",
+            "dialogue:send",
+            "evidence:read",
+            "evidence:upload",
+        }
+    ),
+    UserRole.VIEWER: frozenset(
+        {
+            "project:read",
+            "dialogue:read",
+            "evidence:read",
+            "report:read",
+        }
+    ),
+    UserRole.EXECUTIVE: frozenset(
+        {
+            "project:read",
+            "report:read",
+            "analytics:read",
+            "analytics:benchmark",
+            "analytics:portfolio",
+            "analytics:export",
+        }
+    ),
+}
+
+# JWT由来のロール文字列で直接引く（UserRole への変換を省く）
+_ROLE_PERMISSIONS_BY_NAME: dict[str, frozenset[str]] = {role.value: keys for role, keys in ROLE_PERMISSIONS.items()}
+
+# 権限キー -> ビット、ロール -> 権限ビットマスク（判定を整数ANDに落とす）
+_PERMISSION_BITS: dict[str, int] = {key: 1 << i for i, key in enumerate(PERMISSIONS)}
+_ROLE_MASKS: dict[str, int] = {
+    role: reduce(or_, (_PERMISSION_BITS[key] for key in keys), 0) for role, keys in _ROLE_PERMISSIONS_BY_NAME.items()
 }
 
 
@@ -108,19 +129,11 @@ class RBACService:
 
     def has_permission(self, role: str, permission_key: str) -> bool:
         """指定ロールが指定権限を持つか"""
-        try:
-            user_role = UserRole(role)
-        except ValueError:
-            return False
-        return permission_key in ROLE_PERMISSIONS.get(user_role, set())
+        return bool(_ROLE_MASKS.get(role, 0) & _PERMISSION_BITS.get(permission_key, 0))
 
-    def get_permissions(self, role: str) -> set[str]:
+    def get_permissions(self, role: str) -> frozenset[str]:
         """指定ロールの全権限を返す"""
-        try:
-            user_role = UserRole(role)
-        except ValueError:
-            return set()
-        return ROLE_PERMISSIONS.get(user_role, set())
+        return _ROLE_PERMISSIONS_BY_NAME.get(role, frozenset())
 
     def check_permission(self, role: str, permission_key: str) -> None:
         """権限チェック。不正アクセス時はPermissionError送出
@@ -1,13 +1,30 @@
 """S3 証跡ストレージ"""
 
+import asyncio
+from io import BytesIO
 from typing import Any
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from loguru import logger
 
 from src.config.settings import get_settings
 from src.security.encryption import EncryptionService
 
+_MB = 1024 * 1024
+
+# 接続再利用（並列転送のパート数分の接続をプールに保持）
+_CLIENT_CONFIG = Config(tcp_keepalive=True, max_pool_connections=50)
+
+# 8MB を超えるオブジェクトは 8MB 単位のパートに分けて並列転送
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * _MB,
+    multipart_chunksize=8 * _MB,
+    max_concurrency=10,
+    use_threads=True,
+)
+
 
 class S3Storage:
     """S3ベースの証跡ストレージ
@@ -24,6 +41,7 @@ class S3Storage:
             region_name=settings.aws_region,
             aws_access_key_id=settings.aws_access_key_id or None,
             aws_secret_access_key=settings.aws_secret_access_key or None,
+            config=_CLIENT_CONFIG,
         )
         self._evidence_bucket = settings.s3_bucket_evidence
         self._reports_bucket = settings.s3_bucket_reports
@@ -37,17 +55,34 @@ class S3Storage:
         metadata: dict[str, str] | None = None,
         encrypt: bool = True,
     ) -> dict[str, str]:
-        """証跡ファイルをS3にアップロード"""
-        s3_key = f"tenants/{tenant_id}/evidence/{file_name}"
+        """証跡ファイルをS3にアップロード
 
-        # ハッシュ計算
-        file_hash = EncryptionService.compute_hash(file_data)
+        ハッシュ計算・暗号化・転送はいずれもブロッキング処理のため、
+        まとめてワーカースレッドで実行する。
+        """
+        return await asyncio.to_thread(self._upload_evidence, file_data, file_name, tenant_id, metadata, encrypt)
 
-        # 暗号化
-        upload_data = self._encryption.encrypt_bytes(file_data) if encrypt else file_data
+    def _upload_evidence(
+        self,
+        file_data: bytes,
+        file_name: str,
+        tenant_id: str,
+        metadata: dict[str, str] | None,
+        encrypt: bool,
+    ) -> dict[str, str]:
+        """upload_evidence の同期実装"""
+        s3_key = f"tenants/{tenant_id}/evidence/{file_name}"
+
+        # ハッシュ計算（暗号化する場合は暗号化と同じパスで計算）
+        if encrypt:
+            upload_data, file_hash = self._encryption.encrypt_and_hash(file_data)
+        else:
+            upload_data, file_hash = file_data, EncryptionService.compute_hash(file_data)
 
         extra_args: dict[str, Any] = {
             "ServerSideEncryption": "aws:kms",
+            # パートごとにS3側でチェックサム検証
+            "ChecksumAlgorithm": "SHA256",
             "Metadata": {
                 "tenant_id": tenant_id,
                 "file_hash": file_hash,
@@ -56,11 +91,13 @@ class S3Storage:
             },
         }
 
-        self._client.put_object(
-            Bucket=self._evidence_bucket,
-            Key=s3_key,
-            Body=upload_data,
-            **extra_args,
+        # 閾値超過時はマルチパートで各パートを並列PUT
+        self._client.upload_fileobj(
+            BytesIO(upload_data),
+            self._evidence_bucket,
+            s3_key,
+            ExtraArgs=extra_args,
+            Config=_TRANSFER_CONFIG,
         )
 
         logger.info("証跡アップロード完了", s3_key=s3_key, file_hash=file_hash)
@@ -76,17 +113,19 @@ class S3Storage:
         s3_key: str,
         decrypt: bool = True,
     ) -> bytes:
-        """証跡ファイルをS3からダウンロード"""
-        response = self._client.get_object(
-            Bucket=self._evidence_bucket,
-            Key=s3_key,
-        )
-        data = response["Body"].read()
+        """証跡ファイルをS3からダウンロード（転送・復号はワーカースレッドで実行）"""
+        return await asyncio.to_thread(self._download_evidence, s3_key, decrypt)
+
+    def _download_evidence(self, s3_key: str, decrypt: bool) -> bytes:
+        """download_evidence の同期実装（大きなファイルはレンジGETで並列取得）"""
+        buffer = BytesIO()
+        self._client.download_fileobj(self._evidence_bucket, s3_key, buffer, Config=_TRANSFER_CONFIG)
+        data = buffer.getvalue()
 
         if decrypt:
             data = self._encryption.decrypt_bytes(data)
 
-        return data  # type: ignore[no-any-return]
+        return data
 
     def generate_presigned_url(
         self,
@@ -1,9 +1,17 @@
 """ベクトルDB — pgvector ベースのRAG検索"""
 
+import asyncio
+import hashlib
 import uuid as uuid_mod
-from typing import Any
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any, Literal
 
+import httpx
+import numpy as np
+import orjson
 from loguru import logger
+from pgvector import HalfVector
 from sqlalchemy import Column, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +20,30 @@ from src.config.settings import get_settings
 from src.db.base import Base, TimestampMixin
 from src.db.session import get_session
 
+# vector_documents への一括投入列（INSERT/COPY 共通の並び）
+_INSERT_COLUMNS = ("id", "tenant_id", "content", "metadata", "doc_type", "source_id", "embedding")
+_INSERT_SQL = text(
+    "INSERT INTO vector_documents "
+    "(id, tenant_id, content, metadata, doc_type, source_id, embedding) "
+    "VALUES (:id, :tenant_id, :content, :metadata, :doc_type, :source_id, :embedding)"
+)
+# SQLAlchemy の asyncpg アダプタは最初の文の実行時に BEGIN を送るため、
+# ドライバ接続を直接使う COPY の前に1文流してセッションのトランザクションを開始する
+_BEGIN_TRANSACTION_SQL = text("SELECT 1")
+
+# 検索モード → HNSW ef_search（候補リスト長。大きいほど再現率が上がり遅くなる）
+RecallMode = Literal["fast", "balanced", "accurate"]
+_EF_SEARCH_BY_RECALL_MODE: dict[str, int] = {"fast": 20, "balanced": 80, "accurate": 200}
+
+# 検索クエリ → pgvectorリテラル（クエリのダイジェストをキーとするLRU）
+_QUERY_EMBEDDING_CACHE_SIZE = 1024
+_QUERY_EMBEDDING_CACHE: OrderedDict[bytes, str] = OrderedDict()
+
+
+def _encode_vector(value: Any) -> bytes:
+    """COPY 用: 埋め込みを halfvec（FP16）のバイナリ表現に変換"""
+    return HalfVector(value).to_binary()
+
 
 class VectorDocument(Base, TimestampMixin):
     """ベクトル文書テーブル — pgvector HNSW索引付き"""
@@ -24,8 +56,8 @@ class VectorDocument(Base, TimestampMixin):
     metadata_ = Column("metadata", JSONB, default=dict)
     doc_type = Column(String(100), nullable=False)  # audit_standard, regulation, past_response, evidence
     source_id = Column(String(255), nullable=True)  # 元文書ID
-    # pgvector: embedding カラムはマイグレーションで追加
-    # embedding = Column(Vector(1536))  # text-embedding-3-small次元数
+    # pgvector: embedding カラムと HNSW 索引は infrastructure/scripts/init_db.py で追加
+    # embedding = Column(HALFVEC(1536))  # text-embedding-3-small次元数（FP16で格納）
 
 
 class VectorStore:
@@ -37,6 +69,8 @@ class VectorStore:
     """
 
     EMBEDDING_DIM = 1536  # text-embedding-3-small
+    EMBEDDING_BATCH_SIZE = 96  # 1リクエストあたりの入力数
+    EMBEDDING_CONCURRENCY = 16  # 同時リクエスト数の上限
 
     def __init__(self, session: AsyncSession | None = None) -> None:
         self._session = session
@@ -56,50 +90,98 @@ class VectorStore:
         Anthropicの場合、LLMで擬似的にEmbeddingを生成するか、
         OpenAI Embedding APIを使用。ここではOpenAI互換APIを使用。
         """
-        try:
-            import httpx
-
-            # OpenAI Embedding API互換エンドポイント
-            api_key = self._settings.azure_openai_api_key or self._settings.anthropic_api_key
-            if not api_key:
-                # フォールバック: 簡易ハッシュベースの疑似ベクトル
-                return self._fallback_embedding(text_content)
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/embeddings",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": "text-embedding-3-small",
-                        "input": text_content[:8000],  # トークン制限
-                    },
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    return data["data"][0]["embedding"]  # type: ignore[no-any-return]
+        embeddings = await self._generate_embeddings([text_content])
+        return embeddings[0]
+
+    async def _generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """複数テキストをまとめてベクトル化（入力順を保持）
+
+        EMBEDDING_BATCH_SIZE 件ずつ1リクエストにまとめ、最大 EMBEDDING_CONCURRENCY
+        リクエストを同一クライアント上で並行実行する。
+        """
+        # OpenAI Embedding API互換エンドポイント
+        api_key = self._settings.azure_openai_api_key or self._settings.anthropic_api_key
+        if not api_key or not texts:
+            # フォールバック: 簡易ハッシュベースの疑似ベクトル
+            return [self._fallback_embedding(t) for t in texts]
 
-            return self._fallback_embedding(text_content)
+        batch_size = self.EMBEDDING_BATCH_SIZE
+        semaphore = asyncio.Semaphore(self.EMBEDDING_CONCURRENCY)
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+
+            async def embed_batch(batch: list[str]) -> list[list[float]]:
+                async with semaphore:
+                    embeddings = await self._request_embeddings(client, api_key, batch)
+                    return embeddings or [self._fallback_embedding(t) for t in batch]
+
+            results = await asyncio.gather(
+                *(embed_batch(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size))
+            )
+
+        return [embedding for batch in results for embedding in batch]
+
+    async def _request_embeddings(
+        self, client: httpx.AsyncClient, api_key: str, texts: list[str]
+    ) -> list[list[float]] | None:
+        """1バッチ分のEmbedding APIリクエスト（失敗時は None）"""
+        try:
+            response = await client.post(
+                "https://api.openai.com/v1/embeddings",
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": "text-embedding-3-small",
+                    "input": [t[:8000] for t in texts],  # トークン制限
+                },
+            )
+            if response.status_code == 200:
+                data = sorted(response.json()["data"], key=itemgetter("index"))
+                return [item["embedding"] for item in data]
         except Exception as e:
             logger.warning("Embedding API エラー、フォールバック使用: {}", str(e))
-            return self._fallback_embedding(text_content)
+
+        return None
+
+    async def _query_embedding_literal(self, query: str) -> str:
+        """検索クエリのベクトルをpgvectorリテラル文字列で返す
+
+        API で得たベクトルは決定的なためプロセス内LRUにキャッシュする。
+        フォールバックのベクトルは一時的な失敗の可能性があるためキャッシュしない。
+        """
+        api_key = self._settings.azure_openai_api_key or self._settings.anthropic_api_key
+        if not api_key:
+            return str(self._fallback_embedding(query))
+
+        key = hashlib.blake2b(query.encode(), digest_size=16).digest()
+        cached = _QUERY_EMBEDDING_CACHE.get(key)
+        if cached is not None:
+            _QUERY_EMBEDDING_CACHE.move_to_end(key)
+            return cached
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            embeddings = await self._request_embeddings(client, api_key, [query])
+        if embeddings is None:
+            return str(self._fallback_embedding(query))
+
+        literal = str(embeddings[0])
+        _QUERY_EMBEDDING_CACHE[key] = literal
+        if len(_QUERY_EMBEDDING_CACHE) > _QUERY_EMBEDDING_CACHE_SIZE:
+            _QUERY_EMBEDDING_CACHE.popitem(last=False)
+        return literal
 
     def _fallback_embedding(self, text_content: str) -> list[float]:
         """フォールバック: ハッシュベースの疑似ベクトル生成
 
         本番ではEmbedding APIを使用すべき。開発/テスト環境用。
         """
-        import hashlib
-
-        hash_bytes = hashlib.sha512(text_content.encode()).digest()
-        # SHA-512 = 64 bytes → 必要な次元数に拡張
-        values: list[float] = []
-        for i in range(self.EMBEDDING_DIM):
-            byte_val = hash_bytes[i % len(hash_bytes)]
-            values.append((byte_val / 255.0) * 2 - 1)  # [-1, 1]に正規化
-        return values
+        hash_bytes = np.frombuffer(hashlib.sha512(text_content.encode()).digest(), dtype=np.uint8)
+        # SHA-512 = 64 bytes を[-1, 1]に正規化し、必要な次元数まで繰り返して拡張
+        values: list[float] = (hash_bytes / 255.0 * 2 - 1).tolist()
+        repeats = -(-self.EMBEDDING_DIM // len(values))
+        return (values * repeats)[: self.EMBEDDING_DIM]
 
     async def ensure_extension(self) -> None:
         """pgvector拡張が有効であることを確認"""
@@ -119,38 +201,59 @@ class VectorStore:
             tenant_id: テナントID
         """
         session = await self._get_session()
-        count = 0
-
-        for doc in documents:
-            content = doc.get("content", "")
-            if not content:
-                continue
-
-            embedding = await self._generate_embedding(content)
-            doc_id = str(uuid_mod.uuid4())
-
-            # pgvectorのベクトル型にINSERT
-            await session.execute(
-                text(
-                    "INSERT INTO vector_documents "
-                    "(id, tenant_id, content, metadata, doc_type, source_id, embedding) "
-                    "VALUES (:id, :tenant_id, :content, :metadata, :doc_type, :source_id, :embedding)"
-                ),
-                {
-                    "id": doc_id,
-                    "tenant_id": tenant_id,
-                    "content": content,
-                    "metadata": doc.get("metadata", {}),
-                    "doc_type": doc.get("doc_type", "general"),
-                    "source_id": doc.get("source_id"),
-                    "embedding": str(embedding),
-                },
+        docs = [doc for doc in documents if doc.get("content", "")]
+        embeddings = await self._generate_embeddings([doc["content"] for doc in docs])
+        rows: list[tuple[Any, ...]] = [
+            (
+                str(uuid_mod.uuid4()),
+                tenant_id,
+                doc["content"],
+                doc.get("metadata", {}),
+                doc.get("doc_type", "general"),
+                doc.get("source_id"),
+                embedding,
             )
-            count += 1
+            for doc, embedding in zip(docs, embeddings, strict=True)
+        ]
+
+        if rows:
+            await self._bulk_insert(session, rows)
 
         await session.commit()
-        logger.info("文書追加完了: {}件 (tenant: {})", count, tenant_id)
-        return count
+        logger.info("文書追加完了: {}件 (tenant: {})", len(rows), tenant_id)
+        return len(rows)
+
+    async def _bulk_insert(self, session: AsyncSession, rows: list[tuple[Any, ...]]) -> None:
+        """文書行を一括投入
+
+        asyncpg 接続では COPY（バイナリ）で1往復にまとめ、埋め込みは文字列化せず
+        pgvector のバイナリ形式で送る。それ以外のドライバでは executemany にフォールバック。
+        """
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver: Any = raw_connection.driver_connection
+
+        if hasattr(driver, "copy_records_to_table"):
+            # COPY が単独で自動コミットされないよう、先にトランザクションを開始しておく
+            await session.execute(_BEGIN_TRANSACTION_SQL)
+            # halfvec 型コーデックは COPY の間だけ登録（他クエリの文字列パラメータに影響させない）
+            await driver.set_type_codec(
+                "halfvec", encoder=_encode_vector, decoder=HalfVector.from_binary, format="binary"
+            )
+            try:
+                await driver.copy_records_to_table(
+                    "vector_documents",
+                    records=[(*row[:3], orjson.dumps(row[3]).decode(), *row[4:]) for row in rows],
+                    columns=list(_INSERT_COLUMNS),
+                )
+            finally:
+                await driver.reset_type_codec("halfvec")
+            return
+
+        await session.execute(
+            _INSERT_SQL,
+            [{**dict(zip(_INSERT_COLUMNS, row, strict=True)), "embedding": str(row[-1])} for row in rows],
+        )
 
     async def search(
         self,
@@ -159,19 +262,28 @@ class VectorStore:
         top_k: int = 5,
         filter_metadata: dict[str, Any] | None = None,
         doc_type: str | None = None,
+        recall_mode: RecallMode = "balanced",
     ) -> list[dict[str, Any]]:
         """セマンティック検索 — pgvector cosine distance
 
-        HNSWインデックスによる高速近傍検索。
+        HNSWインデックスによる高速近傍検索。recall_mode で速度と再現率を切り替える
+        （fast: UIの即時検索向け / accurate: 監査証跡の網羅的な検索向け）。
         """
         session = await self._get_session()
-        query_embedding = await self._generate_embedding(query)
+        query_embedding = await self._query_embedding_literal(query)
+
+        # SET LOCAL は現在のトランザクション内（後続のSELECT）にのみ適用される
+        ef_search = max(_EF_SEARCH_BY_RECALL_MODE[recall_mode], top_k)
+        await session.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+        if doc_type or filter_metadata:
+            # 絞り込み条件で候補が尽きないよう索引走査を継続（strict_order で距離順を維持）
+            await session.execute(text("SET LOCAL hnsw.iterative_scan = strict_order"))
 
         # pgvector cosine distance: <=> 演算子
         filter_clauses = ["tenant_id = :tenant_id"]
         params: dict[str, Any] = {
             "tenant_id": tenant_id,
-            "query_embedding": str(query_embedding),
+            "query_embedding": query_embedding,
             "top_k": top_k,
         }
 
@@ -184,10 +296,10 @@ class VectorStore:
         result = await session.execute(
             text(
                 f"SELECT id, content, metadata, doc_type, source_id, "  # noqa: S608
-                f"1 - (embedding <=> :query_embedding::vector) AS similarity "
+                f"1 - (embedding <=> :query_embedding::halfvec) AS similarity "
                 f"FROM vector_documents "
                 f"WHERE {where_clause} "
-                f"ORDER BY embedding <=> :query_embedding::vector "
+                f"ORDER BY embedding <=> :query_embedding::halfvec "
                 f"LIMIT :top_k"
             ),
             params,
@@ -1,6 +1,8 @@
 """Temporal Worker — Activity/Workflowを実行するワーカープロセス"""
 
 import asyncio
+import sys
+from collections.abc import Callable
 from typing import Any
 
 from loguru import logger
@@ -94,9 +96,23 @@ async def start_workflow(
     return str(handle.id)
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloopが利用可能ならそのループ生成関数を返す（Windowsは標準ループ）"""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> None:
     """エントリーポイント"""
-    asyncio.run(start_worker())
+    loop_factory = _event_loop_factory()
+    logger.info("イベントループ: {}", "uvloop" if loop_factory else "asyncio")
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(start_worker())
 
 
 if __name__ == "__main__":
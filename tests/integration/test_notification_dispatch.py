@@ -4,6 +4,7 @@ Slack/TeamsプロバイダとDispatcherの統合動作を確認。
 実際のWebhook送信は行わず、プロバイダ登録〜ディスパッチフローを検証。
 """
 
+import orjson
 import pytest
 
 from src.notifications.base import NotificationMessage, NotificationPriority
@@ -148,7 +149,7 @@ class TestTeamsProviderIntegration:
             action_url="https://example.com/action",
         )
 
-        payload = teams._build_adaptive_card(message)
+        payload = orjson.loads(teams._build_adaptive_card_bytes(message))
         assert payload["type"] == "message"
         assert len(payload["attachments"]) == 1
         content = payload["attachments"][0]["content"]
@@ -68,7 +68,7 @@ class TestGetCurrentUserWs:
             "role": "auditor",
         }
 
-        with patch("src.security.auth.verify_token", return_value=mock_payload):
+        with patch("src.api.dependencies.verify_token", return_value=mock_payload):
             from src.api.dependencies import get_current_user_ws
 
             result = await get_current_user_ws("valid.jwt.token")
@@ -81,7 +81,7 @@ class TestGetCurrentUserWs:
     @pytest.mark.asyncio
     async def test_invalid_token_returns_none(self) -> None:
         """不正なトークンは None を返す（例外をキャッチ）"""
-        with patch("src.security.auth.verify_token", side_effect=Exception("invalid token")):
+        with patch("src.api.dependencies.verify_token", side_effect=Exception("invalid token")):
             from src.api.dependencies import get_current_user_ws
 
             result = await get_current_user_ws("bad.token.here")
@@ -94,7 +94,7 @@ class TestGetCurrentUserWs:
         # sub / tenant_id / role が存在しないペイロード
         mock_payload: dict = {}
 
-        with patch("src.security.auth.verify_token", return_value=mock_payload):
+        with patch("src.api.dependencies.verify_token", return_value=mock_payload):
             from src.api.dependencies import get_current_user_ws
 
             result = await get_current_user_ws("some.token")
@@ -108,7 +108,7 @@ class TestGetCurrentUserWs:
     async def test_exception_is_logged_and_none_returned(self) -> None:
         """例外発生時に logger.debug が呼ばれ None が返る"""
         with (
-            patch("src.security.auth.verify_token", side_effect=ValueError("jwt error")),
+            patch("src.api.dependencies.verify_token", side_effect=ValueError("jwt error")),
             patch("src.api.dependencies.logger") as mock_logger,
         ):
             from src.api.dependencies import get_current_user_ws
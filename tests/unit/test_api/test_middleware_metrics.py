@@ -0,0 +1,79 @@
+"""メトリクスミドルウェアテスト"""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+
+from src.api.middleware.metrics import UNMATCHED_ENDPOINT, PrometheusMiddleware
+
+
+def _create_test_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        return {"item_id": item_id}
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    return app
+
+
+def _count(endpoint: str, status_code: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "http_requests_total",
+        {"method": "GET", "endpoint": endpoint, "status_code": status_code},
+    )
+    return value or 0.0
+
+
+def _observations(endpoint: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count",
+        {"method": "GET", "endpoint": endpoint},
+    )
+    return value or 0.0
+
+
+@pytest.mark.unit
+class TestPrometheusMiddleware:
+    async def test_records_route_template(self) -> None:
+        """パスパラメータではなくルートテンプレートでラベル付けされる"""
+        before_count = _count("/items/{item_id}", "200")
+        before_obs = _observations("/items/{item_id}")
+
+        transport = ASGITransport(app=_create_test_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/items/a")
+            await client.get("/items/b")
+
+        assert _count("/items/{item_id}", "200") - before_count == 2
+        assert _observations("/items/{item_id}") - before_obs == 2
+
+    async def test_unmatched_route(self) -> None:
+        """ルート不一致は固定ラベルに集約される"""
+        before = _count(UNMATCHED_ENDPOINT, "404")
+
+        transport = ASGITransport(app=_create_test_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get("/missing/path")
+
+        assert resp.status_code == 404
+        assert _count(UNMATCHED_ENDPOINT, "404") - before == 1
+
+    async def test_unhandled_exception_recorded_as_500(self) -> None:
+        """下流の例外も status_code=500 として件数・処理時間を記録"""
+        before_count = _count("/boom", "500")
+        before_obs = _observations("/boom")
+
+        transport = ASGITransport(app=_create_test_app(), raise_app_exceptions=False)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get("/boom")
+
+        assert resp.status_code == 500
+        assert _count("/boom", "500") - before_count == 1
+        assert _observations("/boom") - before_obs == 1
@@ -1,6 +1,7 @@
 """Settings テスト"""
 
 import pytest
+from pydantic import ValidationError
 
 from src.config.settings import Settings
 
@@ -62,3 +63,9 @@ class TestSettings:
         """デバッグモードデフォルト"""
         s = Settings()
         assert isinstance(s.app_debug, bool)
+
+    @pytest.mark.parametrize("rounds", [3, 32])
+    def test_bcrypt_rounds_out_of_range_rejected(self, rounds: int) -> None:
+        """bcryptの許容範囲外のコスト係数は読込時に拒否"""
+        with pytest.raises(ValidationError):
+            Settings(bcrypt_rounds=rounds)
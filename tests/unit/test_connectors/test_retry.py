@@ -7,6 +7,7 @@ import httpx
 import pytest
 
 from src.connectors.base import CircuitBreaker, CircuitBreakerOpenError
+from src.monitoring.metrics import connector_request_child
 
 
 @pytest.mark.unit
@@ -81,8 +82,10 @@ class TestCircuitBreakerDecorator:
         mock_response.raise_for_status = MagicMock()
         conn._client.get = AsyncMock(return_value=mock_response)
 
+        before = connector_request_child("sap", "search", "success")._value.get()
         await conn.search("test")
         assert conn.circuit_breaker._failure_count == 0
+        assert connector_request_child("sap", "search", "success")._value.get() == before + 1
 
     @pytest.mark.asyncio
     async def test_circuit_breaker_open_raises(self) -> None:
@@ -209,11 +212,14 @@ class TestConnectorRetry:
             side_effect=httpx.ConnectError("Connection refused"),
         )
 
+        before = connector_request_child("sap", "search", "failure")._value.get()
         with pytest.raises(httpx.ConnectError):
             await conn.search("test")
 
-        # 失敗がサーキットブレーカーに記録される
+        # 失敗がサーキットブレーカーとメトリクスに記録される（リトライの試行ごと）
         assert conn.circuit_breaker._failure_count > 0
+        after = connector_request_child("sap", "search", "failure")._value.get()
+        assert after - before == conn._client.get.call_count
 
 
 @pytest.mark.unit
@@ -1,5 +1,6 @@
 """プロセスマイニング テスト"""
 
+from datetime import UTC, datetime
 from typing import Any
 
 import pytest
@@ -369,6 +370,27 @@ class TestDeviationDetection:
         assert result.conformance_rate == 1.0
 
 
+@pytest.mark.unit
+class TestGroupByCase:
+    """ケースグループ化テスト"""
+
+    def test_bulk_sort_matches_small_path(self) -> None:
+        """大規模ログの一括ソートは小規模ログと同じ順序・ケース順になる"""
+        miner = ProcessMiner()
+        activities = ["完了", "転記", "承認", "入力"]
+        event_log = [
+            _make_event(f"C{i % 300:03d}", activities[i % 4], f"2025-01-01T{(3 - i % 4) + 9:02d}:00:00")
+            for i in range(1200)
+        ]
+
+        bulk = miner._group_by_case(event_log)
+
+        assert list(bulk) == list(dict.fromkeys(e["case_id"] for e in event_log))
+        for case_id, events in bulk.items():
+            expected = sorted((e for e in event_log if e["case_id"] == case_id), key=lambda e: e["timestamp"])
+            assert events == expected
+
+
 @pytest.mark.unit
 class TestDurationCalculation:
     """時間差計算テスト"""
@@ -388,6 +410,11 @@ class TestDurationCalculation:
         duration = ProcessMiner._calc_duration_hours("invalid", "also-invalid")
         assert duration == 0.0
 
+    def test_calc_duration_non_string(self) -> None:
+        """文字列以外のタイムスタンプ（None、datetime）は0.0を返す"""
+        assert ProcessMiner._calc_duration_hours(None, "2025-01-01T12:00:00") == 0.0  # type: ignore[arg-type]
+        assert ProcessMiner._calc_duration_hours(datetime(2025, 1, 1, tzinfo=UTC), "2025-01-01T12:00:00") == 0.0  # type: ignore[arg-type]
+
 
 @pytest.mark.unit
 class TestDataclasses:
@@ -56,6 +56,16 @@ class TestRiskScorer:
         assert score_mid < score_high
         assert score_high < score_very_high
 
+    def test_rule_based_amount_boundary_is_exclusive(self) -> None:
+        """閾値ちょうどの金額は下位区間として扱う"""
+        scorer = RiskScorer()
+
+        at_threshold = scorer._score_rule_based({"amount": 10_000_000})
+        above_threshold = scorer._score_rule_based({"amount": 10_000_001})
+
+        assert at_threshold == 40.0
+        assert above_threshold == 50.0
+
     def test_batch_score(self) -> None:
         """バッチスコアリング"""
         scorer = RiskScorer()
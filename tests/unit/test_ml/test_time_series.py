@@ -107,3 +107,34 @@ class TestTimeSeriesAnalyzer:
         )
 
         assert 0.0 <= result["anomaly_probability"] <= 1.0
+
+    async def test_analyze_fast_detects_spike(self) -> None:
+        """加法モデルでスパイクを異常として検出"""
+        values, timestamps = create_time_series(n=60, noise_level=1.0)
+        values[40] += 50.0
+        analyzer = TimeSeriesAnalyzer()
+
+        result = await analyzer.detect_anomaly_trend(series_data=values, timestamps=timestamps)
+
+        assert 40 in [a["index"] for a in result["anomalies"]]
+        assert len(result["forecast"]) == 30
+        assert result["trend"] > 0
+
+    async def test_analyze_fast_weekly_seasonality(self) -> None:
+        """週次季節性の振幅を推定"""
+        import numpy as np
+        import pandas as pd
+
+        t = np.arange(56)
+        values = 100 + 10 * np.sin(2 * np.pi * t / 7)
+        df = pd.DataFrame({"ds": pd.date_range("2025-01-01", periods=56, freq="D"), "y": values})
+
+        result = TimeSeriesAnalyzer()._analyze_fast(df, season_length=7)
+
+        assert result["seasonality"] == pytest.approx(10 / np.sqrt(2), rel=0.05)
+        assert result["anomalies"] == []
+        assert result["forecast"][0]["predicted"] == pytest.approx(100 + 10 * np.sin(2 * np.pi * 56 / 7), abs=0.5)
+
+    def test_prophet_is_opt_in(self) -> None:
+        """Prophetは明示指定時のみ使用"""
+        assert TimeSeriesAnalyzer()._use_prophet is False
@@ -161,3 +161,29 @@ class TestHealthChecker:
         result = await checker.check_all()
         assert result.status == HealthStatus.HEALTHY
         assert len(result.components) == 0
+
+    async def test_check_all_multiple_endpoints(self) -> None:
+        """複数のDB/Redisエンドポイントを名前付きで並行チェック"""
+        checker = HealthChecker()
+
+        with patch.object(checker, "check_database") as mock_db, patch.object(checker, "check_redis") as mock_redis:
+            mock_db.side_effect = lambda engine, name="postgresql": ComponentHealth(
+                name=name, status=HealthStatus.HEALTHY
+            )
+            mock_redis.side_effect = lambda client, name="redis": ComponentHealth(
+                name=name, status=HealthStatus.HEALTHY
+            )
+
+            result = await checker.check_all(
+                engine=MagicMock(),
+                engines=[MagicMock(), MagicMock()],
+                redis_clients=[MagicMock()],
+            )
+
+            assert [c.name for c in result.components] == [
+                "postgresql",
+                "postgresql_0",
+                "postgresql_1",
+                "redis_0",
+            ]
+            assert result.status == HealthStatus.HEALTHY
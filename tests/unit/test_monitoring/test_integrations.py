@@ -61,6 +61,14 @@ class TestDatadogMetrics:
             metrics = DatadogMetrics()
             assert metrics._statsd is None
 
+    def test_constant_tags_resolved_at_init(self) -> None:
+        """定数タグは初期化時にタプルとして確定する"""
+        with patch("src.monitoring.integrations.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(dd_service="audit-agent", dd_env="test")
+            metrics = DatadogMetrics()
+        assert metrics._constant_tags == ("service:audit-agent", "env:test")
+        assert not hasattr(metrics, "_settings")
+
     def test_increment_without_statsd(self) -> None:
         """StatsDなしのインクリメント（no-op）"""
         with patch("src.monitoring.integrations.get_settings") as mock_settings:
@@ -90,6 +98,81 @@ class TestDatadogMetrics:
             metrics = DatadogMetrics()
             metrics.timing("test.timing", 500.0)
 
+    def test_emit_is_queued_until_flush(self) -> None:
+        """メトリクスはキューに積まれ、flushでまとめて送信"""
+        with patch("src.monitoring.integrations.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock()
+            metrics = DatadogMetrics()
+            client = MagicMock()
+            metrics._statsd = client
+
+            metrics.increment("test.counter", tags=["a:b"])
+            metrics.gauge("test.gauge", 42.0)
+            client.increment.assert_not_called()
+
+            metrics.flush()
+
+            client.__enter__.assert_called_once()
+            client.increment.assert_called_once_with("test.counter", 1, tags=["a:b"])
+            client.gauge.assert_called_once_with("test.gauge", 42.0, tags=None)
+            assert len(metrics._queue) == 0
+
+    def test_queue_overflow_counts_dropped(self) -> None:
+        """キュー溢れ時は破棄件数を送信"""
+        with patch("src.monitoring.integrations.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock()
+            metrics = DatadogMetrics(max_queue_size=2, flush_threshold=100)
+            client = MagicMock()
+            metrics._statsd = client
+
+            for _ in range(5):
+                metrics.increment("test.counter")
+            assert len(metrics._queue) == 2
+
+            metrics.flush()
+
+            client.increment.assert_any_call(DatadogMetrics.DROPPED_METRIC, 3)
+
+    async def test_background_flusher(self) -> None:
+        """イベントループ上ではバックグラウンドタスクが送信"""
+        import asyncio
+
+        with patch("src.monitoring.integrations.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock()
+            metrics = DatadogMetrics(flush_interval_s=0.01)
+            client = MagicMock()
+            metrics._statsd = client
+
+            metrics.timing("test.timing", 12.5)
+            await asyncio.sleep(0.05)
+
+            client.timing.assert_called_once_with("test.timing", 12.5, tags=None)
+            metrics.close()
+
+    async def test_close_stops_flusher_and_flushes(self) -> None:
+        """close()でバックグラウンドタスクを停止し、残りを送信してatexit登録を解除"""
+        import asyncio
+
+        with (
+            patch("src.monitoring.integrations.get_settings") as mock_settings,
+            patch("src.monitoring.integrations.atexit") as mock_atexit,
+        ):
+            mock_settings.return_value = MagicMock()
+            metrics = DatadogMetrics(flush_interval_s=60.0)
+            client = MagicMock()
+            metrics._statsd = client
+
+            metrics.gauge("test.gauge", 1.0)
+            task = metrics._flusher_task
+            metrics.close()
+            await asyncio.sleep(0)
+
+            assert task is not None and task.cancelled()
+            assert metrics._flusher_task is None
+            client.gauge.assert_called_once_with("test.gauge", 1.0, tags=None)
+            mock_atexit.register.assert_called_once_with(metrics.flush)
+            mock_atexit.unregister.assert_called_once_with(metrics.flush)
+
 
 @pytest.mark.unit
 class TestLangSmithTracer:
@@ -133,6 +216,41 @@ class TestLangSmithTracer:
                 tokens_used=100,
             )
 
+    def test_trace_agent_uses_cached_run_tree(self) -> None:
+        """RunTreeクラスは初期化時に一度だけ解決される"""
+        with patch("src.monitoring.integrations.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(langchain_api_key="ls-test-key", langchain_project="proj")
+            tracer = LangSmithTracer()
+            assert tracer._run_tree_cls is not None
+            assert tracer._project == "proj"
+
+            run_tree_cls = MagicMock()
+            tracer._run_tree_cls = run_tree_cls
+            tracer.trace_agent_execution(
+                agent_name="test_agent",
+                input_data={"q": "test"},
+                output_data={"a": "result"},
+            )
+            assert tracer.flush(timeout=1.0) is True
+
+            run_tree_cls.assert_called_once()
+            assert run_tree_cls.call_args.kwargs["name"] == "agent:test_agent"
+            run_tree_cls.return_value.end.assert_called_once_with(outputs={"a": "result"})
+            run_tree_cls.return_value.post.assert_called_once()
+
+    def test_trace_queue_full_drops(self) -> None:
+        """キュー満杯時はトレースを破棄して件数を記録"""
+        with patch("src.monitoring.integrations.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(langchain_api_key="")
+            tracer = LangSmithTracer(max_queue_size=1)
+            tracer._enabled = True
+
+            tracer.trace_llm_call(model="claude-sonnet", prompt="p", response="r")
+            tracer.trace_llm_call(model="claude-sonnet", prompt="p", response="r")
+
+            assert tracer._trace_queue.qsize() == 1
+            assert tracer._dropped == 1
+
 
 @pytest.mark.unit
 class TestGetVersion:
@@ -5,7 +5,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.monitoring.logging import _json_formatter, setup_logging
+from src.monitoring.logging import (
+    _file_json_formatter,
+    _json_formatter,
+    _json_sink,
+    _stamp_context,
+    _stdout_json_sink,
+    setup_logging,
+)
 
 
 def _make_record(
@@ -75,10 +82,11 @@ class TestJsonFormatter:
         assert parsed["user"] == "alice"
 
     def test_extra_correlation_id_excluded(self) -> None:
-        """extra の correlation_id / tenant_id はスキップされる（重複防止）"""
+        """bind された correlation_id / tenant_id はコンテキスト変数の値で上書きされる"""
         import orjson
 
         record = _make_record(extra={"correlation_id": "SHOULD_SKIP", "tenant_id": "SHOULD_SKIP"})
+        _stamp_context(record)
         result = _json_formatter(record)
 
         # correlation_id は context var から取得されるので extra の値で上書きされない
@@ -138,6 +146,7 @@ class TestJsonFormatter:
         ten_token = tenant_id_var.set("ten-xyz")
         try:
             record = _make_record()
+            _stamp_context(record)
             result = _json_formatter(record)
             parsed = orjson.loads(result.strip())
             assert parsed["correlation_id"] == "corr-abc"
@@ -156,6 +165,50 @@ class TestJsonFormatter:
         assert parsed["message"] == "テストメッセージ"
 
 
+@pytest.mark.unit
+class TestJsonSink:
+    """バイト列sinkのテスト"""
+
+    def test_json_sink_returns_bytes_with_newline(self) -> None:
+        """改行付きJSONバイト列を返す"""
+        import orjson
+
+        result = _json_sink(_make_record(message="bytes"))
+        assert isinstance(result, bytes)
+        assert result.endswith(b"\n")
+        assert orjson.loads(result)["message"] == "bytes"
+
+    def test_stdout_sink_writes_bytes_to_buffer(self) -> None:
+        """標準出力のバッファへ直接書き込む"""
+        stdout = MagicMock()
+        message = MagicMock(record=_make_record(message="to-stdout"))
+
+        with patch("src.monitoring.logging.sys.stdout", stdout):
+            _stdout_json_sink(message)
+
+        written = stdout.buffer.write.call_args.args[0]
+        assert written == _json_sink(message.record)
+
+    def test_file_formatter_survives_loguru_template(self) -> None:
+        """ファイル用フォーマッタはloguruのテンプレート解釈後に元のJSONへ戻る"""
+        import io
+
+        from loguru import logger
+
+        sink = io.StringIO()
+        handler_id = logger.add(sink, format=_file_json_formatter)
+        try:
+            logger.info("<b>{}</b>", "braces", payload="{x}")
+        finally:
+            logger.remove(handler_id)
+
+        import orjson
+
+        parsed = orjson.loads(sink.getvalue().strip())
+        assert parsed["message"] == "<b>braces</b>"
+        assert parsed["payload"] == "{x}"
+
+
 @pytest.mark.unit
 class TestSetupLoggingExtra:
     """setup_logging 未カバー分岐のテスト"""
@@ -1,18 +1,26 @@
 """Prometheus Metrics テスト"""
 
+from unittest.mock import patch
+
 import pytest
 
 from src.monitoring.metrics import (
     agent_confidence_score,
+    agent_execution_child,
     agent_execution_duration_seconds,
     agent_executions_total,
     app_info,
+    connector_duration_child,
+    connector_request_child,
+    create_metrics_app,
     db_pool_size,
     dialogue_messages_total,
     escalations_total,
+    http_request_child,
     http_request_duration_seconds,
     http_requests_total,
     llm_cost_total,
+    llm_request_child,
     llm_requests_total,
     llm_tokens_total,
 )
@@ -23,8 +31,10 @@ class TestPrometheusMetrics:
     """Prometheusメトリクスの定義テスト"""
 
     def test_app_info_exists(self) -> None:
-        """アプリ情報メトリクスが存在"""
-        assert app_info is not None
+        """アプリ情報はラベル付きゲージ（値1）として記録可能"""
+        app_info.labels(version="0.0.0-test", environment="test").set(1)
+        assert app_info._multiprocess_mode == "liveall"
+        assert app_info.labels(version="0.0.0-test", environment="test")._value.get() == 1
 
     def test_http_metrics(self) -> None:
         """HTTPメトリクスが正常にインクリメント可能"""
@@ -88,3 +98,37 @@ class TestPrometheusMetrics:
     def test_db_metrics(self) -> None:
         """DBメトリクスが正常に設定可能"""
         db_pool_size.labels(pool_name="default").set(10)
+
+    def test_cached_child_metrics(self) -> None:
+        """子メトリクスヘルパーは同一ラベルで同一オブジェクトを返す"""
+        child = http_request_child("GET", "/api/v1/health", "200")
+        assert child is http_request_child("GET", "/api/v1/health", "200")
+        assert child is http_requests_total.labels(method="GET", endpoint="/api/v1/health", status_code="200")
+
+        before = llm_requests_total.labels(provider="anthropic", model="m", status="success")._value.get()
+        llm_request_child("anthropic", "m", "success").inc()
+        after = llm_requests_total.labels(provider="anthropic", model="m", status="success")._value.get()
+        assert after == before + 1
+
+        agent_execution_child("auditor_planner", "success").inc()
+        connector_request_child("sap", "GET", "success").inc()
+        assert connector_duration_child("sap", "GET") is connector_duration_child("sap", "GET")
+
+
+@pytest.mark.unit
+class TestMetricsApp:
+    """/metrics アプリ生成テスト"""
+
+    def test_single_process_uses_default_registry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """PROMETHEUS_MULTIPROC_DIR未設定時は既定レジストリ"""
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        with patch("src.monitoring.metrics.multiprocess.MultiProcessCollector") as mock_collector:
+            assert create_metrics_app() is not None
+            mock_collector.assert_not_called()
+
+    def test_multiprocess_mode_aggregates_workers(self, monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+        """PROMETHEUS_MULTIPROC_DIR設定時はマルチプロセス集約レジストリ"""
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        with patch("src.monitoring.metrics.multiprocess.MultiProcessCollector") as mock_collector:
+            assert create_metrics_app() is not None
+            mock_collector.assert_called_once()
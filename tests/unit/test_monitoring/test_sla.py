@@ -1,5 +1,7 @@
 """SLA監視テスト"""
 
+import random
+
 import pytest
 
 from src.monitoring.sla import (
@@ -58,7 +60,7 @@ class TestSLAMonitor:
             tenant_id="t-001",
         )
         monitor.record_metric(record)
-        assert len(monitor._records["t-001:api_response_time"]) == 1
+        assert len(monitor._records[("t-001", SLAMetricType.API_RESPONSE_TIME)]) == 1
 
     def test_get_targets_enterprise(self) -> None:
         """Enterprise Tier目標"""
@@ -211,3 +213,41 @@ class TestSLAMonitor:
         monitor.reset()
         assert monitor._records == {}
         assert monitor._violations == []
+
+    def test_rolling_window_evicts_oldest(self) -> None:
+        """保持件数を超えた古いレコードは集計から除外"""
+        monitor = SLAMonitor(max_records_per_metric=2)
+        for value in (5000.0, 100.0, 200.0):
+            monitor.record_metric(
+                SLARecord(
+                    metric=SLAMetricType.API_RESPONSE_TIME,
+                    value=value,
+                    tenant_id="t-001",
+                )
+            )
+
+        assert len(monitor._records[("t-001", SLAMetricType.API_RESPONSE_TIME)]) == 2
+        assert monitor.evaluate("t-001", tier="enterprise") == []
+        summary = monitor.get_summary("t-001")
+        assert summary["metrics"]["api_response_time"] == {"count": 2, "avg": 150.0, "min": 100.0, "max": 200.0}
+
+    def test_incremental_min_max_matches_window(self) -> None:
+        """逐次維持するmin/maxは保持中レコードの実値と一致"""
+        rng = random.Random(0)
+        monitor = SLAMonitor(max_records_per_metric=5)
+        key = ("t-001", SLAMetricType.LLM_LATENCY)
+        for _ in range(50):
+            monitor.record_metric(
+                SLARecord(metric=SLAMetricType.LLM_LATENCY, value=rng.uniform(0, 1000), tenant_id="t-001")
+            )
+            values = [r.value for r in monitor._records[key]]
+            stats = monitor.get_summary("t-001")["metrics"]["llm_latency"]
+            assert stats["min"] == round(min(values), 2)
+            assert stats["max"] == round(max(values), 2)
+
+    def test_flat_targets_match_tier_targets(self) -> None:
+        """平坦化テーブルはTier別SLA目標と一致"""
+        for tier, targets in SLAMonitor.TIER_TARGETS.items():
+            assert SLAMonitor._TIER_TARGETS_FLAT[tier] == tuple(
+                (t.metric, t.threshold_ms, t.threshold_percent) for t in targets
+            )
@@ -0,0 +1,53 @@
+"""通知メッセージのテスト"""
+
+import pytest
+
+from src.notifications.base import NotificationMessage, NotificationPriority
+
+
+class TestNotificationMessage:
+    """NotificationMessageテスト"""
+
+    def test_defaults(self):
+        msg = NotificationMessage(title="タイトル", body="本文")
+        assert msg.priority == NotificationPriority.MEDIUM
+        assert msg.tenant_id == ""
+        assert msg.action_url is None
+
+    def test_metadata_not_shared(self):
+        """metadataのデフォルトはインスタンスごとに別オブジェクト"""
+        first = NotificationMessage(title="a", body="b")
+        second = NotificationMessage(title="c", body="d")
+        first.metadata["key"] = "value"
+        assert second.metadata == {}
+
+    def test_slots(self):
+        msg = NotificationMessage(title="a", body="b")
+        assert not hasattr(msg, "__dict__")
+        with pytest.raises(AttributeError):
+            msg.unknown = 1  # type: ignore[attr-defined]
+
+    def test_from_dict(self):
+        msg = NotificationMessage.from_dict(
+            {
+                "title": "リスク検知",
+                "body": "本文",
+                "priority": "critical",
+                "tenant_id": "tenant-001",
+                "source": "risk_alert",
+                "action_url": "https://example.com",
+            }
+        )
+        assert msg.priority == NotificationPriority.CRITICAL
+        assert msg.tenant_id == "tenant-001"
+        assert msg.action_url == "https://example.com"
+
+    def test_from_dict_invalid_priority(self):
+        """不正な優先度はMEDIUMにフォールバック"""
+        msg = NotificationMessage.from_dict({"title": "a", "body": "b", "priority": "urgent"})
+        assert msg.priority == NotificationPriority.MEDIUM
+
+    def test_from_dict_empty(self):
+        msg = NotificationMessage.from_dict({})
+        assert msg.title == ""
+        assert msg.action_url is None
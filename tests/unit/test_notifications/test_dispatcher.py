@@ -1,5 +1,8 @@
 """通知ディスパッチャーのテスト"""
 
+import asyncio
+import time
+
 import pytest
 
 from src.notifications.base import BaseNotificationProvider, NotificationMessage, NotificationPriority
@@ -7,7 +10,9 @@ from src.notifications.dispatcher import NotificationDispatcher
 
 
 class FakeProvider(BaseNotificationProvider):
-    """テスト用のフェイクプロバイダ"""
+    """テスト用のフェイクプロバイダ（Webhook型を模擬）"""
+
+    is_tenant_agnostic = True
 
     def __init__(self, name: str = "fake", succeed: bool = True) -> None:
         self._name = name
@@ -26,9 +31,29 @@ class FakeProvider(BaseNotificationProvider):
         return self._succeed
 
 
+class SlowProvider(FakeProvider):
+    """送信に時間がかかるプロバイダ"""
+
+    def __init__(self, name: str, delay: float) -> None:
+        super().__init__(name=name)
+        self._delay = delay
+
+    async def send(self, message: NotificationMessage, channel: str) -> bool:
+        await asyncio.sleep(self._delay)
+        return await super().send(message, channel)
+
+
+class ChannelProvider(FakeProvider):
+    """テナント別チャンネルが必要なプロバイダ"""
+
+    is_tenant_agnostic = False
+
+
 class ErrorProvider(BaseNotificationProvider):
     """送信時にエラーを発生させるプロバイダ"""
 
+    is_tenant_agnostic = True
+
     @property
     def provider_name(self) -> str:
         return "error"
@@ -145,6 +170,25 @@ class TestDispatch:
         _, channel = slack_fake.sent_messages[0]
         assert channel == ""
 
+    @pytest.mark.asyncio
+    async def test_dispatch_skips_provider_without_tenant_channel(self, dispatcher, slack_fake, sample_message):
+        """チャンネル未設定のテナント依存プロバイダには送信しない"""
+        email = ChannelProvider(name="email")
+        dispatcher.register_provider(slack_fake)
+        dispatcher.register_provider(email)
+        results = await dispatcher.dispatch(sample_message)
+        assert results == {"slack": True}
+        assert email.sent_messages == []
+
+    @pytest.mark.asyncio
+    async def test_dispatch_sends_to_provider_with_tenant_channel(self, dispatcher, sample_message):
+        email = ChannelProvider(name="email")
+        dispatcher.register_provider(email)
+        dispatcher.set_tenant_channel("tenant-001", "email", "audit@example.com")
+        results = await dispatcher.dispatch(sample_message)
+        assert results == {"email": True}
+        assert email.sent_messages[0][1] == "audit@example.com"
+
     @pytest.mark.asyncio
     async def test_dispatch_failing_provider(self, dispatcher, failing_provider, sample_message):
         dispatcher.register_provider(failing_provider)
@@ -165,6 +209,44 @@ class TestDispatch:
         assert results["slack"] is True
         assert results["failing"] is False
 
+    @pytest.mark.asyncio
+    async def test_dispatch_runs_providers_concurrently(self, dispatcher, sample_message):
+        for name in ("slack", "teams", "email"):
+            dispatcher.register_provider(SlowProvider(name=name, delay=0.1))
+
+        start = time.monotonic()
+        results = await dispatcher.dispatch(sample_message)
+        elapsed = time.monotonic() - start
+
+        assert results == {"slack": True, "teams": True, "email": True}
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_dispatch_limits_concurrency_per_provider(self, sample_message):
+        """プロバイダごとの同時送信数が上限を超えない"""
+        dispatcher = NotificationDispatcher()
+        provider = SlowProvider(name="slack", delay=0.05)
+        dispatcher.register_provider(provider, max_concurrent=2)
+
+        in_flight = 0
+        peak = 0
+        original_send = provider.send
+
+        async def tracking_send(message, channel):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await original_send(message, channel)
+            finally:
+                in_flight -= 1
+
+        provider.send = tracking_send
+        results = await asyncio.gather(*(dispatcher.dispatch(sample_message) for _ in range(6)))
+
+        assert all(r == {"slack": True} for r in results)
+        assert peak == 2
+
 
 class TestConvenienceMethods:
     """ヘルパーメソッドテスト"""
@@ -1,12 +1,20 @@
 """Slack通知プロバイダのテスト"""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import httpx
+import orjson
 import pytest
 
 from src.notifications.base import NotificationMessage, NotificationPriority
-from src.notifications.slack import SlackProvider
+from src.notifications.slack import SlackProvider, _get_slack_client, shutdown_slack_client
+
+
+@pytest.fixture(autouse=True)
+async def _reset_shared_client():
+    yield
+    await shutdown_slack_client()
 
 
 @pytest.fixture
@@ -116,6 +124,26 @@ class TestSlackBuildPayload:
         # header + body + fields(priorityのみ)
         assert len(payload["blocks"]) >= 2
 
+    def test_priority_attrs_precomputed(self, slack_provider):
+        """優先度由来の固定文字列は初期化時に算出済み"""
+        assert slack_provider._priority_attrs[NotificationPriority.MEDIUM] == (
+            ":warning:",
+            "#daa520",
+            "*優先度:* medium",
+        )
+        assert set(slack_provider._priority_attrs) == set(NotificationPriority)
+
+    def test_unknown_priority_uses_default_attrs(self, slack_provider, sample_message):
+        """未知の優先度は既定の絵文字・カラーで構築し、優先度はそのまま表示"""
+        unknown = NotificationMessage(title="不明", body="本文", priority="urgent")
+        payload = slack_provider._build_payload(unknown)
+        assert payload["blocks"][0]["text"]["text"] == ":bell: 不明"
+        assert payload["attachments"][0]["color"] == "#cccccc"
+        assert {"type": "mrkdwn", "text": "*優先度:* urgent"} in payload["blocks"][2]["fields"]
+
+        batch = slack_provider._build_batch_payload([unknown, sample_message])
+        assert batch["attachments"][0]["color"] == SlackProvider.PRIORITY_COLOR[NotificationPriority.HIGH]
+
 
 class TestSlackSend:
     """送信テスト"""
@@ -129,6 +157,9 @@ class TestSlackSend:
             result = await slack_provider.send(sample_message)
             assert result is True
             mock_post.assert_called_once()
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert orjson.loads(kwargs["content"]) == slack_provider._build_payload(sample_message)
 
     @pytest.mark.asyncio
     async def test_send_empty_webhook_returns_false(self, empty_provider, sample_message):
@@ -156,6 +187,97 @@ class TestSlackSend:
             assert result is False
 
 
+class TestSlackCoalescing:
+    """まとめ送信テスト"""
+
+    @pytest.mark.asyncio
+    async def test_burst_sent_as_single_post(self, slack_provider, sample_message):
+        """窓内の複数メッセージは1回のPOSTにまとまる"""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = lambda: None
+
+        with patch.object(httpx.AsyncClient, "post", return_value=mock_response) as mock_post:
+            results = await asyncio.gather(*(slack_provider.send(sample_message) for _ in range(3)))
+        await slack_provider.close()
+
+        assert results == [True, True, True]
+        mock_post.assert_called_once()
+        blocks = orjson.loads(mock_post.call_args.kwargs["content"])["blocks"]
+        assert sum(1 for b in blocks if b["type"] == "divider") == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_split_at_max_messages(self, sample_message):
+        """最大件数を超えると複数回に分けて送信"""
+        provider = SlackProvider(webhook_url="https://hooks.slack.com/x", coalesce_max_messages=2)
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = lambda: None
+
+        with patch.object(httpx.AsyncClient, "post", return_value=mock_response) as mock_post:
+            await asyncio.gather(*(provider.send(sample_message) for _ in range(4)))
+        await provider.close()
+
+        assert mock_post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_critical_bypasses_queue(self, slack_provider):
+        """CRITICALは待たずに即時送信"""
+        critical = NotificationMessage(title="緊急", body="本文", priority=NotificationPriority.CRITICAL)
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = lambda: None
+
+        with patch.object(httpx.AsyncClient, "post", return_value=mock_response) as mock_post:
+            assert await slack_provider.send(critical) is True
+            mock_post.assert_called_once()
+        assert slack_provider._coalesce_task is None
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_all_callers(self, slack_provider, sample_message):
+        """まとめ送信の失敗は全呼び出し元にFalseで返る"""
+        with patch.object(httpx.AsyncClient, "post", side_effect=httpx.ConnectError("refused")):
+            results = await asyncio.gather(slack_provider.send(sample_message), slack_provider.send(sample_message))
+        await slack_provider.close()
+
+        assert results == [False, False]
+
+    @pytest.mark.asyncio
+    async def test_build_error_resolves_batch_and_keeps_loop(self, slack_provider, sample_message):
+        """ペイロード構築の例外はバッチ全体にFalseを返し、後続の送信は継続"""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = lambda: None
+
+        with patch.object(httpx.AsyncClient, "post", return_value=mock_response) as mock_post:
+            with patch.object(slack_provider, "_build_batch_payload", side_effect=KeyError("urgent")):
+                results = await asyncio.wait_for(
+                    asyncio.gather(slack_provider.send(sample_message), slack_provider.send(sample_message)),
+                    timeout=2.0,
+                )
+            assert results == [False, False]
+            assert await asyncio.wait_for(slack_provider.send(sample_message), timeout=2.0) is True
+        await slack_provider.close()
+
+        mock_post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_resolves_pending_messages(self, sample_message):
+        """close()時に未送信のメッセージはFalseで解決される"""
+        provider = SlackProvider(webhook_url="https://hooks.slack.com/x", coalesce_window_s=10.0)
+
+        with patch.object(httpx.AsyncClient, "post") as mock_post:
+            pending = [asyncio.ensure_future(provider.send(sample_message)) for _ in range(3)]
+            await asyncio.sleep(0)
+            await provider.close()
+            results = await asyncio.wait_for(asyncio.gather(*pending), timeout=2.0)
+
+        assert results == [False, False, False]
+        mock_post.assert_not_called()
+        assert provider._coalesce_task is None
+        assert provider._coalesce_queue is None
+
+    def test_batch_payload_uses_highest_priority_color(self, slack_provider, sample_message, minimal_message):
+        payload = slack_provider._build_batch_payload([minimal_message, sample_message])
+        assert payload["attachments"][0]["color"] == SlackProvider.PRIORITY_COLOR[NotificationPriority.HIGH]
+
+
 class TestSlackHealthCheck:
     """ヘルスチェックテスト"""
 
@@ -168,16 +290,26 @@ class TestSlackHealthCheck:
         assert await empty_provider.health_check() is False
 
 
-class TestSlackClose:
-    """クライアント終了テスト"""
+class TestSlackSharedClient:
+    """共有クライアントテスト"""
 
     @pytest.mark.asyncio
-    async def test_close_without_client(self, slack_provider):
-        await slack_provider.close()
-        assert slack_provider._client is None
+    async def test_client_shared_across_providers(self):
+        first = await _get_slack_client()
+        second = await _get_slack_client()
+        assert first is second
+        await shutdown_slack_client()
 
     @pytest.mark.asyncio
-    async def test_close_with_client(self, slack_provider):
-        slack_provider._client = httpx.AsyncClient()
-        await slack_provider.close()
-        assert slack_provider._client is None
+    async def test_shutdown_without_client(self):
+        await shutdown_slack_client()
+        await shutdown_slack_client()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_recreates_client(self):
+        first = await _get_slack_client()
+        await shutdown_slack_client()
+        assert first.is_closed
+        second = await _get_slack_client()
+        assert second is not first
+        await shutdown_slack_client()
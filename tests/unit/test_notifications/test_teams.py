@@ -1,12 +1,40 @@
 """Teams通知プロバイダのテスト"""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import orjson
 import pytest
+from tenacity import wait_none
 
 from src.notifications.base import NotificationMessage, NotificationPriority
-from src.notifications.teams import TeamsProvider
+from src.notifications.http_clients import close_teams_client, get_teams_client
+from src.notifications.teams import (
+    MAX_RETRY_AFTER_S,
+    TeamsDispatcher,
+    TeamsProvider,
+    _post_with_retry,
+    _RetryableStatusError,
+    _wait_retry_after,
+)
+
+
+@pytest.fixture(autouse=True)
+async def _reset_shared_client():
+    yield
+    await close_teams_client()
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_wait():
+    """リトライ待機を無効化"""
+    with patch.object(_post_with_retry.retry, "wait", wait_none()):
+        yield
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("POST", "https://teams.test"))
 
 
 @pytest.fixture
@@ -53,20 +81,21 @@ class TestTeamsBuildAdaptiveCard:
     """Adaptive Card構築テスト"""
 
     def test_card_envelope_structure(self, teams_provider, sample_message):
-        card = teams_provider._build_adaptive_card(sample_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(sample_message))
         assert card["type"] == "message"
         assert len(card["attachments"]) == 1
         assert card["attachments"][0]["contentType"] == "application/vnd.microsoft.card.adaptive"
 
     def test_adaptive_card_schema(self, teams_provider, sample_message):
-        card = teams_provider._build_adaptive_card(sample_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(sample_message))
         content = card["attachments"][0]["content"]
         assert content["type"] == "AdaptiveCard"
-        assert content["version"] == "1.4"
+        assert content["version"] == "1.5"
+        assert content["msteams"] == {"width": "Full"}
         assert "$schema" in content
 
     def test_title_text_block(self, teams_provider, sample_message):
-        card = teams_provider._build_adaptive_card(sample_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(sample_message))
         body = card["attachments"][0]["content"]["body"]
         title_block = body[0]
         assert title_block["type"] == "TextBlock"
@@ -74,21 +103,21 @@ class TestTeamsBuildAdaptiveCard:
         assert title_block["weight"] == "Bolder"
 
     def test_body_text_block(self, teams_provider, sample_message):
-        card = teams_provider._build_adaptive_card(sample_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(sample_message))
         body = card["attachments"][0]["content"]["body"]
         body_block = body[1]
         assert body_block["text"] == "テスト本文です"
         assert body_block["wrap"] is True
 
     def test_fact_set_with_metadata(self, teams_provider, sample_message):
-        card = teams_provider._build_adaptive_card(sample_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(sample_message))
         body = card["attachments"][0]["content"]["body"]
         fact_set = body[2]
         assert fact_set["type"] == "FactSet"
         assert len(fact_set["facts"]) == 3  # source, tenant_id, priority
 
     def test_fact_set_values(self, teams_provider, sample_message):
-        card = teams_provider._build_adaptive_card(sample_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(sample_message))
         body = card["attachments"][0]["content"]["body"]
         facts = body[2]["facts"]
         titles = [f["title"] for f in facts]
@@ -97,7 +126,7 @@ class TestTeamsBuildAdaptiveCard:
         assert "優先度" in titles
 
     def test_action_url_present(self, teams_provider, sample_message):
-        card = teams_provider._build_adaptive_card(sample_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(sample_message))
         content = card["attachments"][0]["content"]
         assert "actions" in content
         action = content["actions"][0]
@@ -105,24 +134,36 @@ class TestTeamsBuildAdaptiveCard:
         assert action["url"] == "https://app.example.com/approval/456"
 
     def test_no_action_without_url(self, teams_provider, minimal_message):
-        card = teams_provider._build_adaptive_card(minimal_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(minimal_message))
         content = card["attachments"][0]["content"]
         assert "actions" not in content
 
+    def test_payload_is_minified(self, teams_provider, sample_message):
+        payload = teams_provider._build_adaptive_card_bytes(sample_message)
+        assert payload == orjson.dumps(orjson.loads(payload))
+
+    def test_special_characters_escaped(self, teams_provider):
+        """引用符・改行・$を含む値もJSONとして正しく埋め込まれる"""
+        msg = NotificationMessage(title='金額 "$1,000" 超過', body="1行目\n2行目 ${title}", source="risk_alert")
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(msg))
+        body = card["attachments"][0]["content"]["body"]
+        assert body[0]["text"] == '金額 "$1,000" 超過'
+        assert body[1]["text"] == "1行目\n2行目 ${title}"
+
     def test_priority_color_high(self, teams_provider, sample_message):
-        card = teams_provider._build_adaptive_card(sample_message)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(sample_message))
         body = card["attachments"][0]["content"]["body"]
         assert body[0]["color"] == "attention"
 
     def test_priority_color_low(self, teams_provider):
         msg = NotificationMessage(title="情報", body="低優先度", priority=NotificationPriority.LOW)
-        card = teams_provider._build_adaptive_card(msg)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(msg))
         body = card["attachments"][0]["content"]["body"]
         assert body[0]["color"] == "good"
 
     def test_priority_color_medium(self, teams_provider):
         msg = NotificationMessage(title="注意", body="中優先度", priority=NotificationPriority.MEDIUM)
-        card = teams_provider._build_adaptive_card(msg)
+        card = orjson.loads(teams_provider._build_adaptive_card_bytes(msg))
         body = card["attachments"][0]["content"]["body"]
         assert body[0]["color"] == "warning"
 
@@ -140,6 +181,16 @@ class TestTeamsSend:
             assert result is True
             mock_post.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_send_posts_serialized_bytes(self, teams_provider, sample_message):
+        """シリアライズ済みバイト列をcontentで送信"""
+        with patch.object(httpx.AsyncClient, "post", return_value=_response(200)) as mock_post:
+            assert await teams_provider.send(sample_message) is True
+        kwargs = mock_post.call_args.kwargs
+        assert "json" not in kwargs
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert orjson.loads(kwargs["content"])["type"] == "message"
+
     @pytest.mark.asyncio
     async def test_send_empty_webhook_returns_false(self, empty_provider, sample_message):
         result = await empty_provider.send(sample_message)
@@ -166,6 +217,44 @@ class TestTeamsSend:
             assert result is False
 
 
+class TestTeamsRetry:
+    """再送テスト"""
+
+    @pytest.mark.asyncio
+    async def test_network_error_retried_three_times(self, teams_provider, sample_message):
+        with patch.object(httpx.AsyncClient, "post", side_effect=httpx.ConnectError("refused")) as mock_post:
+            assert await teams_provider.send(sample_message) is False
+        assert mock_post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_after_429_then_success(self, teams_provider, sample_message):
+        responses = [_response(429, {"Retry-After": "1"}), _response(200)]
+        with patch.object(httpx.AsyncClient, "post", side_effect=responses) as mock_post:
+            assert await teams_provider.send(sample_message) is True
+        assert mock_post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_5xx_retried(self, teams_provider, sample_message):
+        responses = [_response(503), _response(502), _response(200)]
+        with patch.object(httpx.AsyncClient, "post", side_effect=responses) as mock_post:
+            assert await teams_provider.send(sample_message) is True
+        assert mock_post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_4xx_not_retried(self, teams_provider, sample_message):
+        with patch.object(httpx.AsyncClient, "post", return_value=_response(400)) as mock_post:
+            assert await teams_provider.send(sample_message) is False
+        assert mock_post.call_count == 1
+
+    def test_wait_honors_retry_after(self):
+        """Retry-After指定時はその秒数（上限あり）待機"""
+        state = MagicMock()
+        state.outcome.exception.return_value = _RetryableStatusError(429, 5.0)
+        assert _wait_retry_after(state) == 5.0
+        state.outcome.exception.return_value = _RetryableStatusError(429, 600.0)
+        assert _wait_retry_after(state) == MAX_RETRY_AFTER_S
+
+
 class TestTeamsHealthCheck:
     """ヘルスチェックテスト"""
 
@@ -178,16 +267,71 @@ class TestTeamsHealthCheck:
         assert await empty_provider.health_check() is False
 
 
-class TestTeamsClose:
-    """クライアント終了テスト"""
+class TestTeamsSharedClient:
+    """共有クライアントテスト"""
+
+    def test_client_shared(self):
+        assert get_teams_client() is get_teams_client()
 
     @pytest.mark.asyncio
-    async def test_close_without_client(self, teams_provider):
+    async def test_provider_close_keeps_shared_client(self, teams_provider):
+        """プロバイダのcloseでは共有クライアントを切断しない"""
+        client = get_teams_client()
         await teams_provider.close()
-        assert teams_provider._client is None
+        assert not client.is_closed
 
     @pytest.mark.asyncio
-    async def test_close_with_client(self, teams_provider):
-        teams_provider._client = httpx.AsyncClient()
-        await teams_provider.close()
-        assert teams_provider._client is None
+    async def test_close_recreates_client(self):
+        first = get_teams_client()
+        await close_teams_client()
+        assert first.is_closed
+        assert get_teams_client() is not first
+
+    @pytest.mark.asyncio
+    async def test_close_without_client(self):
+        await close_teams_client()
+        await close_teams_client()
+
+
+class TestTeamsDispatcher:
+    """非同期送信キューテスト"""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_returns_immediately_and_sends(self, teams_provider, sample_message):
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = lambda: None
+        dispatcher = TeamsDispatcher(teams_provider, workers=2)
+
+        with patch.object(httpx.AsyncClient, "post", return_value=mock_response) as mock_post:
+            assert dispatcher.enqueue(sample_message) is True
+            assert dispatcher.enqueue(sample_message) is True
+            await dispatcher.join()
+            assert mock_post.call_count == 2
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_drops_when_full(self, teams_provider, sample_message):
+        """キュー満杯時は破棄して件数を記録"""
+        blocker = asyncio.Event()
+
+        async def slow_post(*args, **kwargs):
+            await blocker.wait()
+            response = AsyncMock()
+            response.raise_for_status = lambda: None
+            return response
+
+        dispatcher = TeamsDispatcher(teams_provider, workers=1, max_queue_size=1)
+        with patch.object(httpx.AsyncClient, "post", side_effect=slow_post):
+            assert dispatcher.enqueue(sample_message) is True
+            await asyncio.sleep(0)  # ワーカーが1件目を取り出す
+            assert dispatcher.enqueue(sample_message) is True
+            assert dispatcher.enqueue(sample_message) is False
+            assert dispatcher.dropped == 1
+            blocker.set()
+            await dispatcher.join()
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_without_webhook(self, empty_provider, sample_message):
+        dispatcher = TeamsDispatcher(empty_provider)
+        assert dispatcher.enqueue(sample_message) is False
@@ -1,5 +1,7 @@
 """ExecutiveSummaryTemplate テスト"""
 
+from unittest.mock import patch
+
 import pytest
 
 from src.reports.risk_intelligence import (
@@ -146,6 +148,32 @@ class TestExecutiveSummaryTemplate:
         assert "## アクションアイテム" in result.markdown
         assert "テスト株式会社" in result.markdown
 
+    def test_render_defers_section_building(self, sample_report: RiskIntelligenceReport) -> None:
+        """ヒートマップ・アクションアイテムは参照されるまで構築しない"""
+        with (
+            patch.object(
+                ExecutiveSummaryTemplate, "_build_heatmap", wraps=ExecutiveSummaryTemplate._build_heatmap
+            ) as heatmap,
+            patch.object(
+                ExecutiveSummaryTemplate, "_build_action_items", wraps=ExecutiveSummaryTemplate._build_action_items
+            ) as action_items,
+        ):
+            result = ExecutiveSummaryTemplate.render(sample_report)
+            assert heatmap.call_count == 0
+            assert action_items.call_count == 0
+
+            _ = result.heatmap
+            _ = result.heatmap
+            assert heatmap.call_count == 1
+            assert action_items.call_count == 0
+
+    async def test_markdown_async_matches_sync(self, sample_report: RiskIntelligenceReport) -> None:
+        """非同期描画は同期版と同じマークダウンを返す"""
+        expected = ExecutiveSummaryTemplate.render(sample_report).markdown
+        result = ExecutiveSummaryTemplate.render(sample_report)
+
+        assert await result.markdown_async() == expected
+
     def test_render_empty_report(self, empty_report: RiskIntelligenceReport) -> None:
         """空レポートのレンダリング"""
         result = ExecutiveSummaryTemplate.render(empty_report)
@@ -171,3 +199,10 @@ class TestExecutiveSummaryTemplate:
     def test_score_to_level_low(self) -> None:
         """低レベル判定"""
         assert ExecutiveSummaryTemplate._score_to_level(20.0) == "low"
+
+    def test_score_to_level_boundaries(self) -> None:
+        """境界値は上位レベルに含まれる"""
+        assert ExecutiveSummaryTemplate._score_to_level(80.0) == "critical"
+        assert ExecutiveSummaryTemplate._score_to_level(60.0) == "high"
+        assert ExecutiveSummaryTemplate._score_to_level(40.0) == "medium"
+        assert ExecutiveSummaryTemplate._score_to_level(39.9) == "low"
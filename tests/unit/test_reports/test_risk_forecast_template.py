@@ -1,5 +1,9 @@
 """RiskForecastTemplate テスト"""
 
+import sys
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+
 import pytest
 
 from src.reports.risk_intelligence import (
@@ -8,6 +12,8 @@ from src.reports.risk_intelligence import (
     RiskIntelligenceReport,
 )
 from src.reports.templates.risk_forecast import (
+    CategoryForecast,
+    ForecastDirection,
     RiskForecastOutput,
     RiskForecastTemplate,
 )
@@ -129,6 +135,18 @@ class TestRiskForecastTemplate:
         ops_forecast = next(f for f in result.category_forecasts if f.category == "運用リスク")
         assert ops_forecast.direction == "down"
 
+    def test_category_forecast_direction_enum_and_interned_names(self) -> None:
+        """方向は ForecastDirection、カテゴリ名は intern 済み"""
+        name = "".join(["access_", "control"])
+        result = RiskForecastTemplate.render(
+            current_score=50.0,
+            category_forecasts={name: {"current": 40.0, "predicted": 60.0}},
+        )
+
+        forecast = result.category_forecasts[0]
+        assert forecast.direction is ForecastDirection.UP
+        assert forecast.category is sys.intern("access_control")
+
     def test_category_forecast_stable(self, forecast_data: dict) -> None:
         """カテゴリ予測の安定方向"""
         result = RiskForecastTemplate.render(
@@ -180,6 +198,16 @@ class TestRiskForecastTemplate:
         )
         assert any("上昇" in r or "顕著" in r for r in result.recommendations)
 
+    def test_recommendations_list_top_three_worsening_categories(self) -> None:
+        """上昇幅の大きい上位3カテゴリのみ推奨に含める"""
+        cat_forecasts = [
+            CategoryForecast(category=f"cat{i}", current_score=0.0, predicted_score=delta, change=delta, direction="up")
+            for i, delta in enumerate([12.0, 40.0, 5.0, 25.0, 30.0])
+        ]
+        recs = RiskForecastTemplate._generate_recommendations(50.0, [], 0.9, cat_forecasts)
+
+        assert "以下のカテゴリでリスク上昇が顕著です: cat1、cat4、cat3" in recs
+
     def test_recommendations_stable(self) -> None:
         """安定時の推奨"""
         result = RiskForecastTemplate.render(
@@ -206,6 +234,17 @@ class TestRiskForecastTemplate:
         assert "## シナリオ分析" in result.markdown
         assert "## リスク要因" in result.markdown
 
+    def test_markdown_rendered_lazily(self, forecast_data: dict) -> None:
+        """マークダウンは初回参照時に一度だけ描画される"""
+        with patch.object(
+            RiskForecastTemplate, "_render_markdown", wraps=RiskForecastTemplate._render_markdown
+        ) as render_markdown:
+            result = RiskForecastTemplate.render(**forecast_data)
+            assert render_markdown.call_count == 0
+
+            assert result.markdown == result.markdown
+            assert render_markdown.call_count == 1
+
     def test_render_from_report(self, sample_forecast_report: RiskIntelligenceReport) -> None:
         """RiskIntelligenceReportからの生成"""
         result = RiskForecastTemplate.render_from_report(sample_forecast_report)
@@ -214,6 +253,23 @@ class TestRiskForecastTemplate:
         assert result.current_score == 55.0
         assert "テスト企業" in result.title
 
+    def test_output_is_frozen(self, forecast_data: dict) -> None:
+        """出力データクラスは不変"""
+        result = RiskForecastTemplate.render(**forecast_data)
+
+        with pytest.raises(FrozenInstanceError):
+            result.current_score = 0.0  # type: ignore[misc]
+        with pytest.raises(FrozenInstanceError):
+            result.forecast_points[0].predicted_score = 0.0  # type: ignore[misc]
+
+    def test_shared_timestamp(self, sample_forecast_report: RiskIntelligenceReport) -> None:
+        """バッチ生成時は指定した生成日時を使う"""
+        now_iso = "2026-01-31T00:00:00+00:00"
+        first = RiskForecastTemplate.render_from_report(sample_forecast_report, now_iso=now_iso)
+        second = RiskForecastTemplate.render(current_score=10.0, now_iso=now_iso)
+
+        assert first.generated_at == second.generated_at == now_iso
+
     def test_default_bounds_when_not_specified(self) -> None:
         """信頼区間のデフォルト値"""
         result = RiskForecastTemplate.render(
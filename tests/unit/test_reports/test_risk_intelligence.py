@@ -1,10 +1,15 @@
 """リスクインテリジェンスレポート テスト"""
 
+import asyncio
+from decimal import Decimal
 from typing import Any
+from unittest.mock import patch
 
+import orjson
 import pytest
 
 from src.reports.risk_intelligence import (
+    OFFLOAD_RENDER_THRESHOLD,
     ReportMetadata,
     ReportSection,
     RiskIntelligenceReport,
@@ -124,6 +129,35 @@ class TestReportDataclasses:
         )
         assert report.get_section("nonexistent") is None
 
+    def test_report_get_section_first_match_and_append(self) -> None:
+        """同一タイプは先頭を返し、追加後の検索にも追従"""
+        report = RiskIntelligenceReport(
+            metadata=ReportMetadata("RPT", "Test", "test"),
+            sections=[
+                ReportSection("First", "content", "summary"),
+                ReportSection("Second", "content", "summary"),
+            ],
+        )
+        assert report.get_section("summary").title == "First"
+        assert report.get_section("forecast") is None
+
+        report.sections.append(ReportSection("Forecast", "content", "forecast"))
+        assert report.get_section("forecast").title == "Forecast"
+
+    def test_dataclasses_use_slots(self) -> None:
+        """値オブジェクトはインスタンス辞書を持たない"""
+        section = ReportSection("A", "a", "summary")
+        report = RiskIntelligenceReport(metadata=ReportMetadata("RPT", "Test", "test"), sections=[section])
+        for obj in (section, report, report.metadata):
+            assert not hasattr(obj, "__dict__")
+
+    def test_report_index_excluded_from_eq_and_repr(self) -> None:
+        report = RiskIntelligenceReport(metadata=ReportMetadata("RPT", "Test", "test"), sections=[])
+        other = RiskIntelligenceReport(metadata=ReportMetadata("RPT", "Test", "test"), sections=[])
+        report.get_section("summary")
+        assert report == other
+        assert "_index" not in repr(report)
+
 
 @pytest.mark.unit
 class TestExecutiveSummaryGeneration:
@@ -163,6 +197,18 @@ class TestExecutiveSummaryGeneration:
         overview = report.get_section("risk_overview")
         assert overview is not None
 
+    def test_risk_overview_top_n(self) -> None:
+        """上位N件指定時は概観をスコア上位に絞り、dataは全件保持"""
+        gen = RiskIntelligenceReportGenerator(overview_top_n=2)
+        report = gen.generate_executive_summary(_sample_risk_data())
+
+        overview = report.get_section("risk_overview")
+        lines = overview.content.split("\n")
+        assert len(lines) == 2
+        assert "financial_process" in lines[0]
+        assert "access_control" in lines[1]
+        assert len(overview.data) == 3
+
     def test_forecast_section(self) -> None:
         """予測セクション"""
         gen = RiskIntelligenceReportGenerator()
@@ -321,6 +367,78 @@ class TestMarkdownOutput:
 
         assert "推奨アクション" in md
 
+    def test_markdown_stream_matches_markdown(self) -> None:
+        """ストリーム出力の連結はto_markdownと一致"""
+        gen = RiskIntelligenceReportGenerator()
+        report = gen.generate_executive_summary(_sample_risk_data())
+
+        chunks = list(report.to_markdown_stream())
+        assert len(chunks) > 1
+        assert "".join(chunks) == report.to_markdown()
+
+    async def test_to_markdown_async_small_report_inline(self) -> None:
+        """小さなレポートはスレッドを使わずに描画"""
+        gen = RiskIntelligenceReportGenerator()
+        report = gen.generate_executive_summary(_sample_risk_data())
+
+        with patch("src.reports.risk_intelligence.asyncio.to_thread") as to_thread:
+            md = await report.to_markdown_async()
+        to_thread.assert_not_called()
+        assert md == report.to_markdown()
+
+    async def test_to_markdown_async_large_report_offloaded(self) -> None:
+        """閾値以上のレポートはスレッドで描画"""
+        report = RiskIntelligenceReport(
+            metadata=ReportMetadata("RPT", "Test", "test"),
+            sections=[],
+            key_findings=[f"所見{i}" for i in range(OFFLOAD_RENDER_THRESHOLD)],
+        )
+        with patch("src.reports.risk_intelligence.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            md = await report.to_markdown_async()
+        to_thread.assert_called_once()
+        assert md == report.to_markdown()
+
+    def test_to_json(self) -> None:
+        """JSON出力は公開フィールドのみを含む"""
+        gen = RiskIntelligenceReportGenerator()
+        report = gen.generate_executive_summary(_sample_risk_data())
+        report.to_markdown()
+        report.get_section("summary")
+
+        data = orjson.loads(report.to_json())
+        assert data["metadata"]["report_id"] == report.metadata.report_id
+        assert data["overall_risk_score"] == 72.0
+        assert len(data["sections"]) == report.section_count
+        assert not any(key.startswith("_") for key in data)
+
+    def test_to_json_stringifies_unsupported_values(self) -> None:
+        report = RiskIntelligenceReport(
+            metadata=ReportMetadata("RPT", "Test", "test"),
+            sections=[ReportSection("A", "a", "summary", data={"amount": Decimal("1.50")})],
+        )
+        data = orjson.loads(report.to_json())
+        assert data["sections"][0]["data"]["amount"] == "1.50"
+
+    def test_markdown_reused_when_unchanged(self) -> None:
+        """入力が変わらなければ同一の文字列を返す"""
+        gen = RiskIntelligenceReportGenerator()
+        report = gen.generate_executive_summary(_sample_risk_data())
+
+        assert report.to_markdown() is report.to_markdown()
+
+    def test_markdown_rerendered_after_change(self) -> None:
+        """スコア変更・所見追加後は再レンダリング"""
+        gen = RiskIntelligenceReportGenerator()
+        report = gen.generate_executive_summary(_sample_risk_data())
+        report.to_markdown()
+
+        report.overall_risk_score = 12.5
+        report.key_findings.append("追加所見")
+        md = report.to_markdown()
+
+        assert "12.5" in md
+        assert "追加所見" in md
+
 
 @pytest.mark.unit
 class TestForecastReport:
@@ -334,6 +452,17 @@ class TestForecastReport:
         assert report.metadata.report_type == "risk_forecast"
         assert report.overall_risk_score == 65.0
 
+    def test_report_ids_use_generation_date(self) -> None:
+        """レポートIDは生成日（UTC、YYYYMMDD）から採番"""
+        gen = RiskIntelligenceReportGenerator()
+        summary = gen.generate_executive_summary(_sample_risk_data())
+        forecast = gen.generate_risk_forecast_report(_sample_forecast_data())
+
+        date_part = summary.metadata.generated_at[:10].replace("-", "")
+        assert summary.metadata.report_id == f"RPT-{date_part}"
+        assert forecast.metadata.report_id.startswith("RPT-FC-")
+        assert len(forecast.metadata.report_id) == len("RPT-FC-") + 8
+
     def test_forecast_sections(self) -> None:
         """予測レポートのセクション"""
         gen = RiskIntelligenceReportGenerator()
@@ -401,6 +530,30 @@ class TestForecastReport:
 
         assert any("30%以上" in r for r in report.recommendations)
 
+    def test_category_forecast_arrows(self) -> None:
+        """カテゴリ別予測の矢印（上昇・下降・横ばい）"""
+        gen = RiskIntelligenceReportGenerator()
+        content = gen._format_category_forecasts(
+            {
+                "up": {"current": 40.0, "predicted": 55.5},
+                "down": {"current": 60.0, "predicted": 50.0},
+                "flat": {"current": 30.0, "predicted": 30.0},
+            }
+        )
+
+        assert content.splitlines() == [
+            "- **up**: 40.0 → 55.5 (↑15.5)",
+            "- **down**: 60.0 → 50.0 (↓10.0)",
+            "- **flat**: 30.0 → 30.0 (→0.0)",
+        ]
+
+    def test_forecast_summary_lists_months(self) -> None:
+        """予測サマリーに月別スコアと信頼度を含む"""
+        gen = RiskIntelligenceReportGenerator()
+        content = gen._format_forecast_summary(50.0, [{"month": "2025-04", "score": 55.0}], 0.8)
+
+        assert content == "現在のリスクスコア: **50.0**\n- 2025-04: 55.0\n\n予測信頼度: **80%**"
+
 
 @pytest.mark.unit
 class TestScoreToLevel:
@@ -417,3 +570,11 @@ class TestScoreToLevel:
 
     def test_low(self) -> None:
         assert RiskIntelligenceReportGenerator._score_to_level(20) == "低"
+
+    def test_boundaries_inclusive(self) -> None:
+        """境界値は上位レベルに含まれる"""
+        assert RiskIntelligenceReportGenerator._score_to_level(80) == "クリティカル"
+        assert RiskIntelligenceReportGenerator._score_to_level(79.99) == "高"
+        assert RiskIntelligenceReportGenerator._score_to_level(60) == "高"
+        assert RiskIntelligenceReportGenerator._score_to_level(40) == "中"
+        assert RiskIntelligenceReportGenerator._score_to_level(39.99) == "低"
@@ -1,5 +1,8 @@
 """業種別リスクテンプレートのテスト"""
 
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+
 import pytest
 
 from src.risk_templates import (
@@ -12,6 +15,9 @@ from src.risk_templates import (
     load_all_templates,
     register_template,
 )
+from src.risk_templates.finance import get_finance_template
+from src.risk_templates.it_services import get_it_services_template
+from src.risk_templates.manufacturing import get_manufacturing_template
 
 
 @pytest.mark.unit
@@ -30,6 +36,12 @@ class TestRiskItem:
         assert item.default_likelihood == 3
         assert item.default_impact == 3
 
+    def test_risk_item_is_frozen(self) -> None:
+        item = RiskItem(risk_code="TEST-003", risk_name="不変リスク", category="cat")
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            item.risk_name = "変更"  # type: ignore[misc]
+
     def test_risk_item_with_all_fields(self) -> None:
         item = RiskItem(
             risk_code="TEST-002",
@@ -129,6 +141,14 @@ class TestIndustryTemplateDefinition:
         empty = tmpl.get_controls_for_risk("T-999")
         assert len(empty) == 0
 
+    def test_lookups_return_copies(self) -> None:
+        """取得結果を変更しても内部インデックスに影響しない"""
+        tmpl = self._make_template()
+        tmpl.get_risks_by_category("cat1").clear()
+        tmpl.get_controls_for_risk("T-001").clear()
+        assert [r.risk_code for r in tmpl.get_risks_by_category("cat1")] == ["T-001", "T-002"]
+        assert [c.control_code for c in tmpl.get_controls_for_risk("T-001")] == ["TC-001", "TC-002"]
+
     def test_get_categories(self) -> None:
         tmpl = self._make_template()
         cats = tmpl.get_categories()
@@ -159,6 +179,39 @@ class TestTemplateRegistry:
         assert result is not None
         assert result.industry_code == "reg_test"
 
+    def test_register_caches_dict_and_categories(self) -> None:
+        """登録時に辞書・カテゴリ一覧を確定し、呼び出しごとにコピーを返す"""
+        tmpl = IndustryTemplateDefinition(
+            industry_code="cache_test",
+            industry_name="キャッシュテスト",
+            risks=[RiskItem(risk_code="C-001", risk_name="リスク", category="cat1")],
+        )
+        register_template(tmpl)
+
+        assert tmpl._categories == ("cat1",)
+        assert tmpl.to_dict() in list_templates()
+
+        # 返り値を変更してもレジストリのキャッシュには影響しない
+        tmpl.get_categories().append("injected")
+        d = tmpl.to_dict()
+        d["extra"] = True
+        d["categories"].append("injected")
+        assert tmpl.get_categories() == ["cat1"]
+        assert "extra" not in tmpl.to_dict()
+        assert tmpl.to_dict()["categories"] == ["cat1"]
+
+    def test_get_template_by_region(self) -> None:
+        """同一業種でもリージョンごとに別テンプレートを保持する"""
+        jp = IndustryTemplateDefinition(industry_code="region_test", industry_name="JP版", region="JP")
+        sg = IndustryTemplateDefinition(industry_code="region_test", industry_name="SG版", region="SG")
+        register_template(jp)
+        register_template(sg)
+
+        assert get_template("region_test", "JP") is jp
+        assert get_template("region_test", "SG") is sg
+        assert get_template("region_test", "US") is None
+        assert get_available_industries().count("region_test") == 1
+
     def test_get_template_not_found(self) -> None:
         result = get_template("nonexistent_industry", "XX")
         assert result is None
@@ -171,6 +224,19 @@ class TestTemplateRegistry:
         count = load_all_templates()
         assert count == 3
 
+    def test_load_all_templates_registers_once(self) -> None:
+        """2回目以降のロードは再登録しない"""
+        load_all_templates()
+        with patch("src.risk_templates.register_template") as register:
+            assert load_all_templates() == 3
+        register.assert_not_called()
+
+    def test_template_getters_return_cached_instance(self) -> None:
+        """業種テンプレートは一度だけ生成される"""
+        assert get_finance_template() is get_finance_template()
+        assert get_manufacturing_template() is get_manufacturing_template()
+        assert get_it_services_template() is get_it_services_template()
+
     def test_get_available_industries_after_load(self) -> None:
         load_all_templates()
         industries = get_available_industries()
@@ -1,10 +1,13 @@
 """Audit Trail テスト"""
 
+from datetime import UTC, date, datetime
+from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 
-from src.security.audit_trail import AuditTrailService
+from src.security.audit_trail import AuditEntry, AuditEntryRecord, AuditTrailService
+from src.security.encryption import HashChain
 
 
 @pytest.mark.unit
@@ -111,6 +114,94 @@ class TestAuditTrailService:
         assert len(entry1.hash) == 64
         assert len(entry2.hash) == 64
 
+    def test_recorded_entries_verify_from_payload(self, audit_trail: AuditTrailService) -> None:
+        """記録済みエントリは本文バイト列からチェーン検証できる"""
+        tenant_id = uuid4()
+        for i in range(3):
+            audit_trail.record(
+                tenant_id=tenant_id,
+                action="update",
+                resource_type="finding",
+                resource_id=f"find-{i}",
+                details={"seq": i},
+            )
+        entries = audit_trail.flush()
+        payloads = [e.chain_payload() for e in entries]
+
+        assert b'"hash"' not in payloads[0]
+        assert HashChain().verify_chain(payloads, [e.hash for e in entries]) is True
+        assert HashChain().verify_chain(payloads[::-1], [e.hash for e in entries]) is False
+
+    def test_record_batch_matches_sequential_chain(self, audit_trail: AuditTrailService) -> None:
+        """一括記録は1件ずつ記録した場合と同じチェーンを構成する"""
+        tenant_id = uuid4()
+        first = audit_trail.record(tenant_id=tenant_id, action="create", resource_type="project", resource_id="p-0")
+        batch = audit_trail.record_batch(
+            [
+                {"tenant_id": tenant_id, "action": "update", "resource_type": "project", "resource_id": "p-1"},
+                {
+                    "tenant_id": tenant_id,
+                    "action": "execute",
+                    "resource_type": "agent_decision",
+                    "resource_id": "d-1",
+                    "agent_name": "auditor_planner",
+                    "details": {"step": 1},
+                    "confidence": 0.9,
+                },
+            ]
+        )
+
+        entries = audit_trail.flush()
+        assert entries == [first, *batch]
+        assert batch[1].details == {"step": 1}
+        assert batch[0].details == {}
+        assert HashChain().verify_chain([e.chain_payload() for e in entries], [e.hash for e in entries]) is True
+
+    def test_record_converts_to_validated_model(self, audit_trail: AuditTrailService) -> None:
+        """記録は軽量レコードで保持し、境界でAuditEntryへ変換できる"""
+        entry = audit_trail.record(
+            tenant_id=uuid4(),
+            agent_name="auditor_planner",
+            action="execute",
+            resource_type="agent_decision",
+            resource_id="d-1",
+            details={"金額": 1500000.5, "items": [1, 2]},
+            confidence=0.85,
+        )
+        model = entry.to_model()
+
+        assert isinstance(entry, AuditEntryRecord)
+        assert isinstance(model, AuditEntry)
+        assert model.hash == entry.hash
+        assert model.chain_payload() == entry.chain_payload()
+        assert entry.to_json() == model.model_dump_json().encode()
+
+    def test_record_payload_parity_with_mixed_details(self, audit_trail: AuditTrailService) -> None:
+        """set・64bit超の整数・日付などを含むdetailsでもpydanticと同一のバイト列"""
+        entry = audit_trail.record(
+            tenant_id=uuid4(),
+            action="update",
+            resource_type="finding",
+            resource_id="f-1",
+            details={
+                "tags": {1, 2},
+                "frozen": frozenset({"a"}),
+                "big": 2**70,
+                "pair": (1, "x"),
+                "amount": Decimal("1.10"),
+                "at": datetime(2026, 1, 1, tzinfo=UTC),
+                "day": date(2026, 1, 1),
+                "ref": uuid4(),
+                "nested": {"items": [{3}], "none": None},
+                "nan": float("nan"),
+            },
+            confidence=1,
+        )
+        model = entry.to_model()
+
+        assert entry.chain_payload() == model.chain_payload()
+        assert entry.to_json() == model.model_dump_json().encode()
+
     def test_record_without_optional_fields(self, audit_trail: AuditTrailService) -> None:
         """オプショナルフィールドなしの記録"""
         tenant_id = uuid4()
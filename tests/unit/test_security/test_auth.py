@@ -1,10 +1,13 @@
 """認証サービス テスト"""
 
+import asyncio
+from unittest.mock import patch
 from uuid import uuid4
 
+import jwt
 import pytest
 
-from src.security.auth import AuthService
+from src.security.auth import AuthService, verify_token
 
 
 @pytest.fixture
@@ -24,6 +27,14 @@ class TestAuthService:
         assert hashed != password
         assert hashed.startswith("$2b$")
 
+    def test_hash_password_uses_configured_rounds(self, auth_service: AuthService) -> None:
+        """設定したbcryptコスト係数でハッシュ化されるテスト"""
+        auth_service._settings = auth_service._settings.model_copy(update={"bcrypt_rounds": 4})
+        hashed = auth_service.hash_password("SecurePassword123!")
+
+        assert hashed.startswith("$2b$04$")
+        assert auth_service.verify_password("SecurePassword123!", hashed)
+
     def test_verify_password(self, auth_service: AuthService) -> None:
         """パスワード検証テスト"""
         password = "SecurePassword123!"
@@ -32,6 +43,17 @@ class TestAuthService:
         assert auth_service.verify_password(password, hashed) is True
         assert auth_service.verify_password("WrongPassword", hashed) is False
 
+    async def test_password_async_variants(self, auth_service: AuthService) -> None:
+        """非同期版はワーカースレッドでbcryptを実行する"""
+        password = "SecurePassword123!"
+        with patch("src.security.auth.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            hashed = await auth_service.hash_password_async(password)
+            assert await auth_service.verify_password_async(password, hashed) is True
+            assert await auth_service.verify_password_async("WrongPassword", hashed) is False
+
+        assert to_thread.call_count == 3
+        assert auth_service.verify_password(password, hashed) is True
+
     def test_create_token_pair(self, auth_service: AuthService) -> None:
         """トークンペア発行テスト"""
         user_id = uuid4()
@@ -44,6 +66,14 @@ class TestAuthService:
         assert pair.token_type == "bearer"
         assert pair.expires_in > 0
 
+    def test_token_pair_uses_precomputed_settings(self, auth_service: AuthService) -> None:
+        """初期化時に解決したJWT設定でトークンが発行されるテスト"""
+        settings = auth_service._settings
+        pair = auth_service.create_token_pair(uuid4(), uuid4(), "admin")
+
+        assert pair.expires_in == settings.jwt_access_token_expire_minutes * 60
+        assert verify_token(pair.access_token)["token_type"] == "access"
+
     def test_verify_access_token(self, auth_service: AuthService) -> None:
         """アクセストークン検証テスト"""
         user_id = uuid4()
@@ -74,3 +104,32 @@ class TestAuthService:
 
         with pytest.raises(ValueError, match="Expected token type"):
             auth_service.verify_token(pair.refresh_token, expected_type="access")
+
+    def test_verify_token_cache(self, auth_service: AuthService) -> None:
+        """検証済みトークンの再検証はデコードを省略するテスト"""
+        pair = auth_service.create_token_pair(uuid4(), uuid4(), "admin")
+        first = auth_service.verify_token(pair.access_token)
+
+        with patch("src.security.auth.jwt.decode") as mock_decode:
+            assert auth_service.verify_token(pair.access_token) is first
+            with pytest.raises(ValueError, match="Expected token type"):
+                auth_service.verify_token(pair.access_token, expected_type="refresh")
+        mock_decode.assert_not_called()
+
+    def test_verify_token_cache_skips_invalid(self, auth_service: AuthService) -> None:
+        """不正なトークンはキャッシュしないテスト"""
+        with pytest.raises(jwt.InvalidTokenError):
+            auth_service.verify_token("not-a-token")
+        assert len(auth_service._token_cache) == 0
+
+    def test_verify_token_cache_expiry(self, auth_service: AuthService) -> None:
+        """キャッシュ保持期限切れ後は再デコードするテスト"""
+        pair = auth_service.create_token_pair(uuid4(), uuid4(), "admin")
+        auth_service.verify_token(pair.access_token)
+
+        with (
+            patch("src.security.auth.time.time", return_value=9_999_999_999.0),
+            patch("src.security.auth.jwt.decode", wraps=jwt.decode) as mock_decode,
+        ):
+            auth_service.verify_token(pair.access_token)
+        mock_decode.assert_called_once()
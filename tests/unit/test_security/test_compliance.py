@@ -1,7 +1,12 @@
 """ComplianceChecker テスト"""
 
+import dataclasses
+import threading
+from unittest.mock import patch
+
 import pytest
 
+from src.security import compliance
 from src.security.compliance import (
     ComplianceChecker,
     ComplianceCheckResult,
@@ -199,6 +204,44 @@ class TestComplianceChecker:
         frameworks = [r.framework for r in results]
         assert "PIPL" in frameworks
 
+    def test_check_all_follows_region_order(self, checker: ComplianceChecker) -> None:
+        """適用フレームワークの順に結果を返し、未知リージョンはSOC2のみ"""
+        results = checker.check_all_frameworks("eu")
+        assert [r.framework for r in results] == [fw.value for fw in checker.get_applicable_frameworks("EU")]
+        assert [r.framework for r in checker.check_all_frameworks("XX")] == ["SOC2"]
+
+    def test_check_all_runs_checkers_in_calling_thread(self, checker: ComplianceChecker) -> None:
+        """各フレームワークのチェックは呼び出し元スレッドで順に実行され、結果は適用順"""
+        seen_threads: list[str] = []
+
+        def record_thread(
+            self: ComplianceChecker, audit_data: dict | None = None, checked_at: str | None = None
+        ) -> ComplianceCheckResult:
+            seen_threads.append(threading.current_thread().name)
+            return ComplianceChecker.check_soc2(self, audit_data, checked_at)
+
+        region_checkers = (("SOC2", record_thread), ("ISO27001", ComplianceChecker.check_iso27001))
+        with patch.dict(compliance._REGION_CHECKERS, {"HK": region_checkers}):
+            results = checker.check_all_frameworks("HK")
+
+        assert [r.framework for r in results] == ["SOC2", "ISO27001"]
+        assert seen_threads == [threading.current_thread().name]
+
+    def test_check_all_shares_checked_at(self, checker: ComplianceChecker) -> None:
+        """一括チェックの結果は同じチェック時刻を持つ"""
+        results = checker.check_all_frameworks("EU")
+        assert len({r.checked_at for r in results}) == 1
+        assert results[0].checked_at != ""
+
+    def test_findings_are_shared_immutable_instances(self, checker: ComplianceChecker) -> None:
+        """定型所見は呼び出し間で共有される不変インスタンス"""
+        first = checker.check_soc2({})
+        second = checker.check_soc2({})
+
+        assert all(a is b for a, b in zip(first.findings, second.findings, strict=True))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.findings[0].severity = "low"  # type: ignore[misc]
+
     # ── ステータス判定 ────────────────────────────────
 
     def test_score_to_status_compliant(self) -> None:
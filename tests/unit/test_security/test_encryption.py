@@ -1,6 +1,14 @@
 """暗号化サービス テスト"""
 
+import hashlib
+from datetime import UTC, datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import orjson
 import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
 
 from src.security.encryption import EncryptionService, HashChain
 
@@ -31,6 +39,47 @@ class TestEncryptionService:
         assert encrypted != data
         assert decrypted == data
 
+    def test_aes_gcm_format(self) -> None:
+        """AES-256-GCM形式（バージョン + 12バイトノンス + 16バイトタグ）で暗号化"""
+        service = EncryptionService(key="test-key-for-encryption-testing!!")
+        data = b"binary evidence data"
+
+        encrypted = service.encrypt_bytes(data)
+
+        assert encrypted[:1] == b"\x01"
+        assert len(encrypted) == 1 + 12 + len(data) + 16
+        assert service.encrypt_bytes(data) != encrypted  # ノンスは毎回異なる
+
+    def test_aes_gcm_detects_tampering(self) -> None:
+        """改竄された暗号文の復号は失敗"""
+        service = EncryptionService(key="test-key-for-encryption-testing!!")
+        encrypted = bytearray(service.encrypt_bytes(b"binary evidence data"))
+        encrypted[-1] ^= 0x01
+
+        with pytest.raises(InvalidTag):
+            service.decrypt_bytes(bytes(encrypted))
+
+    def test_encrypt_and_hash(self) -> None:
+        """1パスで計算したハッシュ・暗号文が個別計算と一致"""
+        service = EncryptionService(key="test-key-for-encryption-testing!!")
+        data = bytes(range(256)) * 9000  # 複数チャンクにまたがる長さ
+
+        encrypted, file_hash = service.encrypt_and_hash(data)
+
+        assert file_hash == EncryptionService.compute_hash(data)
+        assert encrypted[:1] == b"\x01"
+        assert len(encrypted) == 1 + 12 + len(data) + 16
+        assert service.decrypt_bytes(encrypted) == data
+
+    def test_decrypt_legacy_fernet(self) -> None:
+        """旧形式のFernet暗号文も復号できる"""
+        key = EncryptionService.generate_key()
+        service = EncryptionService(key=key)
+        legacy = Fernet(key.encode())
+
+        assert service.decrypt(legacy.encrypt("機密データ".encode()).decode()) == "機密データ"
+        assert service.decrypt_bytes(legacy.encrypt(b"evidence")) == b"evidence"
+
     def test_compute_hash(self) -> None:
         """ハッシュ計算テスト"""
         data = b"test data for hashing"
@@ -65,6 +114,40 @@ class TestHashChain:
         assert hash1 != hash2
         assert len(hash1) == 64
 
+    def test_default_algorithm_is_blake2b_256(self) -> None:
+        """既定アルゴリズムはBLAKE2b（32バイト出力）"""
+        data = {"action": "create"}
+        expected = hashlib.blake2b(bytes(32) + b":" + orjson.dumps(data), digest_size=32).hexdigest()
+
+        assert HashChain().add_entry(data) == expected
+
+    def test_dict_entries_sorted_and_native_types(self) -> None:
+        """dictはキー順に依存せず、UUID・datetimeもそのまま扱える"""
+        entry_id = uuid4()
+        at = datetime(2026, 1, 1, tzinfo=UTC)
+        forward = HashChain().add_entry({"a": 1, "id": entry_id, "at": at})
+        reverse = HashChain().add_entry({"at": at, "id": entry_id, "a": 1})
+
+        assert forward == reverse
+
+    @pytest.mark.parametrize("algorithm", ["blake2b", "sha256", "sha512"])
+    def test_hasher_bound_without_hashlib_new(self, algorithm: str) -> None:
+        """既知アルゴリズムはエントリ毎に hashlib.new を経由しない"""
+        with patch("src.security.encryption.hashlib.new") as hashlib_new:
+            chain = HashChain(algorithm)
+            hashes = [chain.add_entry({"seq": i}) for i in range(3)]
+            assert HashChain(algorithm).verify_chain([{"seq": i} for i in range(3)], hashes) is True
+        hashlib_new.assert_not_called()
+
+    def test_sha256_chain_still_verifiable(self) -> None:
+        """SHA-256で記録したチェーンも検証可能"""
+        entries = [{"action": "create"}, {"action": "update"}]
+        chain = HashChain("sha256")
+        hashes = [chain.add_entry(e) for e in entries]
+
+        assert HashChain("sha256").verify_chain(entries, hashes) is True
+        assert HashChain().verify_chain(entries, hashes) is False
+
     def test_verify_chain(self) -> None:
         """チェーン検証テスト"""
         chain = HashChain()
@@ -94,3 +177,26 @@ class TestHashChain:
 
         verifier = HashChain()
         assert verifier.verify_chain(tampered_entries, hashes) is False
+
+    def test_detect_tampered_hash(self) -> None:
+        """途中のハッシュ値の改ざん検出テスト"""
+        chain = HashChain()
+        entries = [{"action": "create", "seq": i} for i in range(4)]
+        hashes = [chain.add_entry(e) for e in entries]
+
+        tampered_hashes = hashes.copy()
+        tampered_hashes[1] = "f" * 64
+
+        verifier = HashChain()
+        assert verifier.verify_chain(entries, tampered_hashes) is False
+        assert verifier.verify_chain([], []) is True
+        assert verifier.verify_chain(entries[:1], ["not-hex"]) is False
+
+    def test_non_guaranteed_algorithm(self) -> None:
+        """hashlib.new経由のアルゴリズムでも検証可能"""
+        chain = HashChain("SHA256")
+        entries = [{"action": "create"}, {"action": "update"}]
+        hashes = [chain.add_entry(e) for e in entries]
+
+        assert HashChain("SHA256").verify_chain(entries, hashes) is True
+        assert hashes == [HashChain("sha256").add_entry(entries[0]), hashes[1]]
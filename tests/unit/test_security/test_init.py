@@ -0,0 +1,47 @@
+"""src.security パッケージの遅延エクスポート テスト"""
+
+import importlib
+import sys
+
+import pytest
+
+import src.security
+from src.security.auth import AuthService
+from src.security.encryption import EncryptionService
+from src.security.rbac import RBACService
+
+
+@pytest.mark.unit
+class TestLazyExports:
+    """遅延エクスポート テスト"""
+
+    def test_exports_resolve_to_submodule_classes(self) -> None:
+        """公開名はサブモジュールのクラスを返す"""
+        assert src.security.AuthService is AuthService
+        assert src.security.EncryptionService is EncryptionService
+        assert src.security.RBACService is RBACService
+
+    def test_star_import(self) -> None:
+        """from src.security import * で全公開名を取得できる"""
+        namespace: dict = {}
+        exec("from src.security import *", namespace)
+        assert {"AuthService", "EncryptionService", "RBACService"} <= namespace.keys()
+
+    def test_unknown_attribute(self) -> None:
+        """未定義名は AttributeError"""
+        with pytest.raises(AttributeError):
+            _ = src.security.NoSuchService  # type: ignore[attr-defined]
+
+    def test_package_import_does_not_load_services(self) -> None:
+        """パッケージ読込時点ではサービスモジュールを読み込まない"""
+        saved = {name: mod for name, mod in sys.modules.items() if name.startswith("src.security")}
+        for name in saved:
+            del sys.modules[name]
+        try:
+            importlib.import_module("src.security")
+            assert "src.security.auth" not in sys.modules
+            assert "src.security.encryption" not in sys.modules
+        finally:
+            for name in [n for n in sys.modules if n.startswith("src.security")]:
+                del sys.modules[name]
+            sys.modules.update(saved)
@@ -2,7 +2,8 @@
 
 import pytest
 
-from src.security.rbac import Permission, RBACService
+from src.config.constants import UserRole
+from src.security.rbac import PERMISSIONS, ROLE_PERMISSIONS, Permission, RBACService
 
 
 @pytest.mark.unit
@@ -52,12 +53,31 @@ class TestRBACService:
         """無効なロール"""
         assert not rbac_service.has_permission("nonexistent", "project:read")
 
+    def test_unknown_permission(self, rbac_service: RBACService) -> None:
+        """未定義の権限キーは拒否"""
+        assert not rbac_service.has_permission("admin", "project:archive")
+
+    def test_bitmask_matches_role_permissions(self, rbac_service: RBACService) -> None:
+        """ビットマスク判定が権限マッピングと一致"""
+        for role, keys in ROLE_PERMISSIONS.items():
+            assert isinstance(keys, frozenset)
+            for key in PERMISSIONS:
+                assert rbac_service.has_permission(role, key) is (key in keys)
+
     def test_get_permissions(self, rbac_service: RBACService) -> None:
         """権限一覧取得"""
         perms = rbac_service.get_permissions("auditor")
         assert "project:read" in perms
         assert "agent:execute" in perms
 
+    def test_role_string_and_enum_equivalent(self, rbac_service: RBACService) -> None:
+        """ロール文字列とUserRoleで同じ権限を返す"""
+        for role in UserRole:
+            assert rbac_service.get_permissions(role.value) is rbac_service.get_permissions(role)
+            assert rbac_service.has_permission(role.value, "project:read") is rbac_service.has_permission(
+                role, "project:read"
+            )
+
     def test_get_permissions_invalid_role(self, rbac_service: RBACService) -> None:
         """無効ロールの権限一覧は空"""
         perms = rbac_service.get_permissions("invalid")
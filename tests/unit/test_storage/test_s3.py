@@ -1,5 +1,6 @@
 """S3ストレージテスト"""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -30,6 +31,7 @@ class TestS3Storage:
 
                 mock_enc = MagicMock()
                 mock_enc.encrypt_bytes.side_effect = lambda d: b"encrypted:" + d
+                mock_enc.encrypt_and_hash.side_effect = lambda d: (b"encrypted:" + d, "abc123hash")
                 mock_enc.decrypt_bytes.side_effect = lambda d: d.replace(b"encrypted:", b"")
                 mock_enc_cls.return_value = mock_enc
                 mock_enc_cls.compute_hash.return_value = "abc123hash"
@@ -52,7 +54,24 @@ class TestS3Storage:
         assert "file_hash" in result
         assert "t-001" in result["s3_path"]
         assert "test.pdf" in result["s3_path"]
-        storage._client.put_object.assert_called_once()
+        storage._client.upload_fileobj.assert_called_once()
+        args = storage._client.upload_fileobj.call_args
+        assert args.args[0].getvalue() == b"encrypted:test data"
+        assert args.args[1:] == ("test-evidence-bucket", "tenants/t-001/evidence/test.pdf")
+        assert args.kwargs["ExtraArgs"]["ChecksumAlgorithm"] == "SHA256"
+        assert args.kwargs["Config"].multipart_threshold == 8 * 1024 * 1024
+
+    async def test_transfers_run_off_event_loop(self, storage: "S3Storage") -> None:  # noqa: F821
+        """S3転送はイベントループ外のスレッドで実行"""
+        threads: list[threading.Thread] = []
+        storage._client.upload_fileobj.side_effect = lambda *a, **kw: threads.append(threading.current_thread())
+        storage._client.download_fileobj.side_effect = lambda *a, **kw: threads.append(threading.current_thread())
+
+        await storage.upload_evidence(file_data=b"data", file_name="doc.pdf", tenant_id="t-001")
+        await storage.download_evidence("key")
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
 
     async def test_upload_evidence_no_encrypt(self, storage: "S3Storage") -> None:  # noqa: F821
         """暗号化なしアップロード"""
@@ -64,6 +83,7 @@ class TestS3Storage:
         )
         # encrypt=Falseなので暗号化サービスは呼ばれない
         storage._encryption.encrypt_bytes.assert_not_called()
+        storage._encryption.encrypt_and_hash.assert_not_called()
 
     async def test_upload_evidence_with_metadata(self, storage: "S3Storage") -> None:  # noqa: F821
         """メタデータ付きアップロード"""
@@ -77,18 +97,19 @@ class TestS3Storage:
 
     async def test_download_evidence(self, storage: "S3Storage") -> None:  # noqa: F821
         """証跡ダウンロード"""
-        mock_body = MagicMock()
-        mock_body.read.return_value = b"encrypted:file content"
-        storage._client.get_object.return_value = {"Body": mock_body}
+        storage._client.download_fileobj.side_effect = lambda bucket, key, fileobj, **_: fileobj.write(
+            b"encrypted:file content"
+        )
 
         data = await storage.download_evidence("tenants/t-001/evidence/test.pdf")
         assert data == b"file content"
+        args = storage._client.download_fileobj.call_args
+        assert args.args[:2] == ("test-evidence-bucket", "tenants/t-001/evidence/test.pdf")
+        assert args.kwargs["Config"].multipart_chunksize == 8 * 1024 * 1024
 
     async def test_download_evidence_no_decrypt(self, storage: "S3Storage") -> None:  # noqa: F821
         """復号なしダウンロード"""
-        mock_body = MagicMock()
-        mock_body.read.return_value = b"raw data"
-        storage._client.get_object.return_value = {"Body": mock_body}
+        storage._client.download_fileobj.side_effect = lambda bucket, key, fileobj, **_: fileobj.write(b"raw data")
 
         data = await storage.download_evidence("key", decrypt=False)
         assert data == b"raw data"
@@ -1,8 +1,15 @@
 """ベクトルストアテスト"""
 
+import hashlib
+import json
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
 import pytest
 
-from src.storage.vector import VectorStore
+from src.storage import vector
+from src.storage.vector import RecallMode, VectorStore
 
 
 @pytest.mark.unit
@@ -36,6 +43,13 @@ class TestVectorStoreFallbackEmbedding:
         e2 = store._fallback_embedding("テキストB")
         assert e1 != e2
 
+    def test_fallback_embedding_values(self) -> None:
+        """ハッシュ値の各バイトを正規化して64次元周期で繰り返す"""
+        store = VectorStore.__new__(VectorStore)
+        digest = hashlib.sha512("テスト".encode()).digest()
+        embedding = store._fallback_embedding("テスト")
+        assert embedding == [(digest[i % 64] / 255.0) * 2 - 1 for i in range(VectorStore.EMBEDDING_DIM)]
+
     def test_fallback_embedding_empty_string(self) -> None:
         """空文字列でも正常にベクトル生成"""
         store = VectorStore.__new__(VectorStore)
@@ -50,3 +64,210 @@ class TestVectorStoreConstants:
     def test_embedding_dim(self) -> None:
         """エンベディング次元数"""
         assert VectorStore.EMBEDDING_DIM == 1536
+
+
+def _store_with_driver(driver: object) -> tuple[VectorStore, AsyncMock]:
+    """指定ドライバ接続を返すモックセッション付きのストア"""
+    raw_connection = MagicMock(driver_connection=driver)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    session = AsyncMock()
+    session.connection = AsyncMock(return_value=connection)
+
+    store = VectorStore.__new__(VectorStore)
+    store._session = session
+    store._generate_embeddings = AsyncMock(  # type: ignore[method-assign]
+        side_effect=lambda contents: [[float(len(c))] * 3 for c in contents]
+    )
+    return store, session
+
+
+@pytest.mark.unit
+class TestVectorStoreAddDocuments:
+    """文書一括投入テスト"""
+
+    async def test_copy_with_asyncpg(self) -> None:
+        """asyncpg接続ではCOPYで1回にまとめて投入"""
+        driver = MagicMock(spec=["set_type_codec", "reset_type_codec", "copy_records_to_table"])
+        driver.set_type_codec = AsyncMock()
+        driver.reset_type_codec = AsyncMock()
+        store, session = _store_with_driver(driver)
+        # COPY 実行時点でセッション側のトランザクションが開始済みであること
+        driver.copy_records_to_table = AsyncMock(
+            side_effect=lambda *args, **kwargs: session.execute.assert_awaited_once_with(vector._BEGIN_TRANSACTION_SQL)
+        )
+
+        count = await store.add_documents(
+            [
+                {"content": "規程A", "metadata": {"k": "v"}},
+                {"content": ""},
+                {"content": "規程BB", "doc_type": "regulation"},
+            ],
+            tenant_id="t-1",
+        )
+
+        assert count == 2
+        driver.copy_records_to_table.assert_awaited_once()
+        records = driver.copy_records_to_table.await_args.kwargs["records"]
+        assert [r[2] for r in records] == ["規程A", "規程BB"]
+        assert records[0][3] == '{"k":"v"}'
+        assert records[1][4] == "regulation"
+        assert records[1][6] == [4.0, 4.0, 4.0]
+        driver.reset_type_codec.assert_awaited_once_with("halfvec")
+        session.execute.assert_awaited_once_with(vector._BEGIN_TRANSACTION_SQL)
+        session.commit.assert_awaited_once()
+
+    async def test_executemany_fallback(self) -> None:
+        """asyncpg以外のドライバでは executemany で投入"""
+        store, session = _store_with_driver(object())
+
+        count = await store.add_documents([{"content": "a"}, {"content": "bb"}], tenant_id="t-1")
+
+        assert count == 2
+        session.execute.assert_awaited_once()
+        params = session.execute.await_args.args[1]
+        assert [p["content"] for p in params] == ["a", "bb"]
+        assert params[0]["embedding"] == "[1.0, 1.0, 1.0]"
+
+    async def test_no_documents(self) -> None:
+        """投入対象がなければDBに書き込まない"""
+        store, session = _store_with_driver(object())
+
+        assert await store.add_documents([{"content": ""}], tenant_id="t-1") == 0
+        session.connection.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestVectorStoreBatchEmbedding:
+    """Embeddingバッチ生成テスト"""
+
+    async def test_batches_preserve_order(self) -> None:
+        """バッチ分割して並行リクエストし、入力順で結果を返す"""
+        requests: list[list[str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            inputs = json.loads(request.content)["input"]
+            requests.append(inputs)
+            if "fail" in inputs:
+                return httpx.Response(500)
+            # API のレスポンス順は index で示される
+            data = [{"index": i, "embedding": [float(len(t))]} for i, t in enumerate(inputs)]
+            return httpx.Response(200, json={"data": data[::-1]})
+
+        store = VectorStore.__new__(VectorStore)
+        store._settings = MagicMock(azure_openai_api_key="key")
+        store.EMBEDDING_BATCH_SIZE = 2
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch("src.storage.vector.httpx.AsyncClient", return_value=client):
+            embeddings = await store._generate_embeddings(["a", "bb", "ccc", "fail", "eeeee"])
+
+        assert sorted(requests) == [["a", "bb"], ["ccc", "fail"], ["eeeee"]]
+        assert embeddings[:2] == [[1.0], [2.0]]
+        assert embeddings[2] == store._fallback_embedding("ccc")
+        assert embeddings[4] == [5.0]
+
+    async def test_without_api_key_uses_fallback(self) -> None:
+        """APIキー未設定ならリクエストせずフォールバック"""
+        store = VectorStore.__new__(VectorStore)
+        store._settings = MagicMock(azure_openai_api_key="", anthropic_api_key="")
+
+        with patch("src.storage.vector.httpx.AsyncClient") as mock_client:
+            embeddings = await store._generate_embeddings(["a", "b"])
+
+        mock_client.assert_not_called()
+        assert embeddings == [store._fallback_embedding("a"), store._fallback_embedding("b")]
+
+
+@pytest.mark.unit
+class TestVectorStoreQueryEmbeddingCache:
+    """検索クエリEmbeddingキャッシュテスト"""
+
+    @pytest.fixture
+    def api_calls(self) -> Iterator[list[str]]:
+        """Embedding APIをモックし、送信されたクエリを記録"""
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(json.loads(request.content)["input"][0])
+            return httpx.Response(200, json={"data": [{"index": 0, "embedding": [0.5, 0.25]}]})
+
+        async_client = httpx.AsyncClient
+
+        def client_factory(**_: object) -> httpx.AsyncClient:
+            return async_client(transport=httpx.MockTransport(handler))
+
+        with (
+            patch.dict(vector._QUERY_EMBEDDING_CACHE, clear=True),
+            patch("src.storage.vector.httpx.AsyncClient", side_effect=client_factory),
+        ):
+            yield calls
+
+    @pytest.fixture
+    def store(self) -> VectorStore:
+        store = VectorStore.__new__(VectorStore)
+        store._settings = MagicMock(azure_openai_api_key="key")
+        return store
+
+    async def test_repeated_query_hits_cache(self, store: VectorStore, api_calls: list[str]) -> None:
+        """同じクエリの2回目はAPIを呼ばない"""
+        first = await store._query_embedding_literal("統制の一覧")
+        second = await store._query_embedding_literal("統制の一覧")
+
+        assert first == second == "[0.5, 0.25]"
+        assert api_calls == ["統制の一覧"]
+
+    async def test_fallback_not_cached(self, store: VectorStore, api_calls: list[str]) -> None:
+        """API失敗時のフォールバックはキャッシュしない"""
+        with patch("src.storage.vector.VectorStore._request_embeddings", AsyncMock(return_value=None)):
+            literal = await store._query_embedding_literal("統制の一覧")
+
+        assert literal == str(store._fallback_embedding("統制の一覧"))
+        assert len(vector._QUERY_EMBEDDING_CACHE) == 0
+        assert await store._query_embedding_literal("統制の一覧") == "[0.5, 0.25]"
+        assert api_calls == ["統制の一覧"]
+
+
+@pytest.mark.unit
+class TestVectorStoreSearch:
+    """検索モードテスト"""
+
+    @staticmethod
+    def _store() -> tuple[VectorStore, AsyncMock]:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(fetchall=MagicMock(return_value=[]))
+        store = VectorStore.__new__(VectorStore)
+        store._session = session
+        store._query_embedding_literal = AsyncMock(return_value="[0.5]")  # type: ignore[method-assign]
+        return store, session
+
+    @staticmethod
+    def _statements(session: AsyncMock) -> list[str]:
+        return [str(c.args[0]) for c in session.execute.await_args_list]
+
+    @pytest.mark.parametrize(("recall_mode", "ef_search"), [("fast", 20), ("balanced", 80), ("accurate", 200)])
+    async def test_ef_search_by_recall_mode(self, recall_mode: RecallMode, ef_search: int) -> None:
+        """検索モードに応じた ef_search をSELECTの前に設定"""
+        store, session = self._store()
+
+        await store.search("統制", tenant_id="t-1", recall_mode=recall_mode)
+
+        statements = self._statements(session)
+        assert statements[0] == f"SET LOCAL hnsw.ef_search = {ef_search}"
+        assert statements[1].startswith("SELECT")
+
+    async def test_ef_search_not_below_top_k(self) -> None:
+        """ef_search は top_k 未満にしない"""
+        store, session = self._store()
+
+        await store.search("統制", tenant_id="t-1", top_k=50, recall_mode="fast")
+
+        assert self._statements(session)[0] == "SET LOCAL hnsw.ef_search = 50"
+
+    async def test_iterative_scan_with_filter(self) -> None:
+        """絞り込み検索では反復索引走査を有効化"""
+        store, session = self._store()
+
+        await store.search("統制", tenant_id="t-1", doc_type="regulation")
+
+        assert self._statements(session)[1] == "SET LOCAL hnsw.iterative_scan = strict_order"
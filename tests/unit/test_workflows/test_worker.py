@@ -0,0 +1,30 @@
+"""Temporal Worker エントリーポイント テスト"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.workflows.worker import _event_loop_factory
+
+
+@pytest.mark.unit
+class TestEventLoopFactory:
+    """_event_loop_factory テスト"""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uvloopはWindows非対応")
+    def test_uses_uvloop_when_available(self) -> None:
+        """uvloopがあればそのループを使う"""
+        uvloop = pytest.importorskip("uvloop")
+
+        assert _event_loop_factory() is uvloop.new_event_loop
+
+    def test_falls_back_on_windows(self) -> None:
+        """Windowsでは標準ループ"""
+        with patch.object(sys, "platform", "win32"):
+            assert _event_loop_factory() is None
+
+    def test_falls_back_without_uvloop(self) -> None:
+        """uvloop未インストール時は標準ループ"""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert _event_loop_factory() is None